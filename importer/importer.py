@@ -26,6 +26,30 @@ def importSignal(file_path):
     np.ndarray: The signal data as a numpy array.
   """
 
-  data = np.genfromtxt(file_path, delimiter=',', usecols=1)
-  return data
+  return importSignalAndConstant(file_path)[0]
+
+def importSignalAndConstant(file_path, dtype=np.float64):
+  """
+  Import a signal and the constant of its first column (acquisition time stamp).
+  Uses numpy's C tokenizer (np.loadtxt) rather than np.genfromtxt.
+  The only CSV parser of the repository: tp-reducer/reader.py calls it too.
+
+  Args:
+    file_path (str): Path to the CSV file.
+    dtype: Type of the returned signal.
+
+  Returns:
+    np.ndarray: The signal data as a numpy array.
+    float: The value of the first column, nan for an empty file.
+  """
+
+  with open(file_path, 'rb') as file:
+    first_line = file.readline()
+
+  if not first_line.strip():
+    return np.empty(0, dtype=dtype), float('nan')
+
+  constant = float(first_line.split(b',', 1)[0])
+  data = np.loadtxt(file_path, delimiter=',', usecols=1, dtype=dtype, ndmin=1)
+  return data, constant
 
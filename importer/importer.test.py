@@ -2,8 +2,10 @@
   @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved. 
 """ 
 
+import os
+
 from importer import importSignal
 
-data = importSignal("./tp-equilibrator/data/1-roulement-sain/acc_00001.csv")
+data = importSignal(os.path.join(os.path.dirname(__file__), "..", "data", "tp-equilibrator-bad", "1-roulement-sain", "acc_00001.csv"))
 print(data)
-
+assert data.shape == (25600,)
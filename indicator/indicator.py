@@ -4,8 +4,6 @@
 
 import numpy as np
 
-from importer import importSignal
-
 
 """
   Interface Indicator
@@ -40,15 +38,15 @@ def calculateIndicators(signal: np.ndarray) -> dict:
   k_factor = peak * rms
 
   return {
-    mean: mean,
-    std_dev: std_dev,
-    variance: variance,
-    rms: rms,
-    peak: peak,
-    energy: energy,
-    power: power,
-    skewness: skewness,
-    kurtosis: kurtosis,
-    crest_factor: crest_factor,
-    k_factor: k_factor,
+    "mean": mean,
+    "std_dev": std_dev,
+    "variance": variance,
+    "rms": rms,
+    "peak": peak,
+    "energy": energy,
+    "power": power,
+    "skewness": skewness,
+    "kurtosis": kurtosis,
+    "crest_factor": crest_factor,
+    "k_factor": k_factor,
   }
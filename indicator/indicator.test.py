@@ -2,37 +2,22 @@
   @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved. 
 """ 
 
-"""
-  This module is responsible for extracting data from a CSV file.
-  CSV shape: 
-    time, data
-"""
+import os
+import sys
 
-"""
-  Interface Signal: np.ndarray
-"""
+import numpy as np
 
-def importSignal(file_path):
-  """
-  Import a signal from a CSV file with columns: time, data
-  Returns only the data column as a numpy array.
-  
-  Args:
-    file_path (str): Path to the CSV file.
-    
-  Returns:
-    np.ndarray: The signal data as a numpy array.
-  """
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "importer"))
 
-  data = np.genfromtxt(file_path, delimiter=',', usecols=1)
-  return data
+from importer import importSignal
+from indicator import calculateIndicators
 
 
-
-signal = importSignal("./tp-equilibrator/data/1-roulement-sain/acc_00001.csv")
+signal = importSignal(os.path.join(os.path.dirname(__file__), "..", "data", "tp-equilibrator-bad", "1-roulement-sain", "acc_00001.csv"))
 print(signal)
 
 indicators = calculateIndicators(signal)
-print(signal)
-
+print(indicators)
 
+assert list(indicators) == ["mean", "std_dev", "variance", "rms", "peak", "energy", "power", "skewness", "kurtosis", "crest_factor", "k_factor"]
+assert np.isclose(indicators["rms"], np.sqrt(indicators["power"]))
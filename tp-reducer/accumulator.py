@@ -0,0 +1,145 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from indicators import INDICATOR_NAMES
+
+"""
+  Single-pass indicator accumulator for recordings too long to hold in memory.
+  State: count, mean, central moment sums M2..M4 (Welford / Terriberry),
+  sum of squares (energy) and running max |x| (peak).
+  Accumulators built on separate chunks can be merged (Chan / Pébay formulas),
+  so one recording can be split across workers and reduced.
+"""
+
+
+class IndicatorAccumulator:
+
+  def __init__(self):
+    self.count = 0
+    self.mean = 0.0
+    self.m2 = 0.0
+    self.m3 = 0.0
+    self.m4 = 0.0
+    self.energy = 0.0
+    self.peak = 0.0
+
+  @classmethod
+  def fromSignal(cls, signal) -> "IndicatorAccumulator":
+    accumulator = cls()
+    accumulator.update(signal)
+    return accumulator
+
+  def update(self, chunk) -> "IndicatorAccumulator":
+    """
+    Add a chunk of samples. The chunk moments are computed vectorized,
+    then merged into the running state.
+    """
+
+    chunk = np.asarray(chunk, dtype=np.float64).ravel()
+    if chunk.size == 0:
+      return self
+
+    other = IndicatorAccumulator()
+    other.count = chunk.size
+    other.mean = float(chunk.mean())
+    centered = chunk - other.mean
+    squared = centered * centered
+    other.m2 = float(squared.sum())
+    other.m3 = float(np.dot(squared, centered))
+    other.m4 = float(np.dot(squared, squared))
+    other.energy = float(np.dot(chunk, chunk))
+    other.peak = float(max(chunk.max(), -chunk.min()))
+    return self.merge(other)
+
+  def merge(self, other: "IndicatorAccumulator") -> "IndicatorAccumulator":
+    """
+    Merge another accumulator into this one, as if its samples followed ours.
+    """
+
+    if other.count == 0:
+      return self
+    if self.count == 0:
+      self.count, self.mean = other.count, other.mean
+      self.m2, self.m3, self.m4 = other.m2, other.m3, other.m4
+      self.energy, self.peak = other.energy, other.peak
+      return self
+
+    na, nb = float(self.count), float(other.count)
+    n = na + nb
+    delta = other.mean - self.mean
+    delta_n = delta / n
+
+    m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+    m3 = (
+      self.m3 + other.m3
+      + delta * delta_n * delta_n * na * nb * (na - nb)
+      + 3 * delta_n * (na * other.m2 - nb * self.m2)
+    )
+    m4 = (
+      self.m4 + other.m4
+      + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+      + 6 * delta_n * delta_n * (na * na * other.m2 + nb * nb * self.m2)
+      + 4 * delta_n * (na * other.m3 - nb * self.m3)
+    )
+
+    self.count += other.count
+    self.mean += delta_n * nb
+    self.m2, self.m3, self.m4 = m2, m3, m4
+    self.energy += other.energy
+    self.peak = max(self.peak, other.peak)
+    return self
+
+  def indicators(self) -> dict:
+    """
+    Return the indicators with the same keys as calculateIndicators.
+    """
+
+    if self.count == 0: raise ValueError("No samples accumulated.")
+
+    variance = self.m2 / self.count
+    std_dev = np.sqrt(variance)
+    power = self.energy / self.count
+    rms = np.sqrt(power)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+      skewness = np.float64(self.m3 / self.count) / (variance * std_dev)
+      kurtosis = np.float64(self.m4 / self.count) / (variance * variance) - 3
+      crest_factor = np.float64(self.peak) / rms
+
+    values = {
+      "mean": np.float64(self.mean),
+      "std_dev": std_dev,
+      "variance": np.float64(variance),
+      "rms": rms,
+      "peak": np.float64(self.peak),
+      "energy": np.float64(self.energy),
+      "power": np.float64(power),
+      "skewness": skewness,
+      "kurtosis": kurtosis,
+      "crest_factor": crest_factor,
+      "k_factor": np.float64(self.peak * rms),
+    }
+    return {name: values[name] for name in INDICATOR_NAMES}
+
+
+def mergeAccumulators(accumulators) -> IndicatorAccumulator:
+  """
+  Reduce partial accumulators (e.g. one per worker, in recording order) into one.
+  """
+  merged = IndicatorAccumulator()
+  for accumulator in accumulators:
+    merged.merge(accumulator)
+  return merged
+
+
+def accumulateChunks(chunks) -> IndicatorAccumulator:
+  """
+  Accumulate an iterable of chunks, e.g. iterSignalBatches output or a file read block by block.
+  """
+  accumulator = IndicatorAccumulator()
+  for chunk in chunks:
+    accumulator.update(chunk)
+  return accumulator
@@ -0,0 +1,28 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+
+import numpy as np
+
+from accumulator import IndicatorAccumulator, accumulateChunks, mergeAccumulators
+from reducer import calculateIndicators, importSignalList
+
+signalMatrix = importSignalList(os.path.join(os.path.dirname(__file__), "data", "3-roulement-sain-pignon-defaut"))
+recording = np.concatenate([signalMatrix[:10].ravel(), 30.0 + signalMatrix[10:20].ravel()])
+expected = calculateIndicators(recording)
+
+# Uneven chunks, as a continuous acquisition would deliver them.
+chunks = np.array_split(recording, [1, 1000, 25600, 100003, 200000])
+streamed = accumulateChunks(chunks).indicators()
+
+# Same recording split across "workers", then reduced.
+parts = [IndicatorAccumulator.fromSignal(part) for part in np.array_split(recording, 7)]
+merged = mergeAccumulators(parts).indicators()
+
+assert list(streamed) == list(expected)
+for name in expected:
+  assert np.isclose(streamed[name], expected[name], rtol=1e-9), name
+  assert np.isclose(merged[name], expected[name], rtol=1e-9), name
+print("accumulator", {name: round(float(value), 6) for name, value in merged.items()})
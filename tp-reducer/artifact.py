@@ -0,0 +1,224 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import json
+
+import numpy as np
+
+from indicators import calculateIndicatorsBatch, indicatorColumns
+from metrics import instrument
+from network import Network2LayersPredictor
+
+"""
+  Persisted diagnosis pipeline: selected indicators, normalisation statistics and
+  network weights in one uncompressed .npz file, loaded in a few milliseconds.
+
+  .npz members:
+    header  -  JSON string, see Interface PipelineHeader
+    mean, scale  -  Normalisation of the selected indicators: (x - mean) / scale
+    weights_<i>, biases_<i>  -  Layer i, weights of shape (n_in, n_out)
+
+  Interface PipelineHeader
+    format: string  -  PIPELINE_FORMAT
+    version: number  -  PIPELINE_VERSION
+    indicatorNames: list  -  Indicator names of the selected columns, in input order
+    labels: list  -  Class names, in output order
+    hiddenActivation: string  -  "tanh" (neuralNetwork2LayersTraining) or "sigmoid" (model/source/model.ts)
+    layerCount: number  -  Number of layers
+
+  The same pipeline can be exported to the model/source/model.json layout used by
+  predict.ts: normalisation is folded into the first layer and tanh layers are
+  rewritten as sigmoid layers (tanh(z) = 2 sigmoid(2z) - 1), so both paths give
+  the same probabilities.
+"""
+
+PIPELINE_FORMAT = "mpp-pipeline"
+PIPELINE_VERSION = 1
+
+# model/source/feature/feature.ts FeatureSet keys <-> calculateIndicators keys.
+TS_FEATURE_NAMES = {
+  "mean": "mean",
+  "stdDev": "std_dev",
+  "variance": "variance",
+  "rms": "rms",
+  "peak": "peak",
+  "energy": "energy",
+  "power": "power",
+  "skewness": "skewness",
+  "kurtosis": "kurtosis",
+  "crestFactor": "crest_factor",
+  "kFactor": "k_factor",
+}
+INDICATOR_TS_NAMES = {name: tsName for tsName, name in TS_FEATURE_NAMES.items()}
+
+
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+  return 0.5 * (np.tanh(0.5 * values) + 1.0)
+
+
+class PipelineArtifact:
+  """
+  A loaded pipeline, ready to classify indicator rows or raw signals.
+  """
+
+  def __init__(self, layers: list, indicatorNames: list, labels: list, mean=None, scale=None,
+               hiddenActivation: str = "tanh"):
+    if hiddenActivation not in ("tanh", "sigmoid"): raise ValueError(f"Unknown hidden activation '{hiddenActivation}'.")
+    self.layers = [(np.ascontiguousarray(weights, dtype=np.float64), np.ascontiguousarray(biases, dtype=np.float64)) for weights, biases in layers]
+    self.indicatorNames = list(indicatorNames)
+    self.labels = list(labels)
+    featureCount = self.layers[0][0].shape[0]
+    self.mean = np.zeros(featureCount) if mean is None else np.asarray(mean, dtype=np.float64)
+    self.scale = np.ones(featureCount) if scale is None else np.asarray(scale, dtype=np.float64)
+    self.hiddenActivation = hiddenActivation
+    self._predictor = None
+    if len(self.layers) == 2 and hiddenActivation == "tanh":
+      self._predictor = Network2LayersPredictor([*self.layers[0], *self.layers[1]])
+
+  @property
+  def weights(self) -> list:
+    """
+    [weightsL1, biasesL1, weightsL2, biasesL2] of a 2-layer pipeline.
+    """
+    if len(self.layers) != 2: raise ValueError("Only 2-layer pipelines have neuralNetwork2LayersTraining weights.")
+    return [*self.layers[0], *self.layers[1]]
+
+  def normalize(self, indicatorRows) -> np.ndarray:
+    return (np.asarray(indicatorRows, dtype=np.float64) - self.mean) / self.scale
+
+  @instrument("PipelineArtifact.classify", counters=lambda result, self, indicatorRows, *args, **kwargs: {"items": result[1].shape[0]})
+  def classify(self, indicatorRows):
+    """
+    Classify rows of the selected indicators (columns in self.indicatorNames order).
+
+    Returns:
+      np.ndarray: (n, n_classes) softmax probabilities.
+      np.ndarray: (n,) label indices into self.labels.
+    """
+
+    inputs = self.normalize(indicatorRows)
+    if inputs.ndim == 1:
+      inputs = inputs[None, :]
+    if self._predictor is not None:
+      return self._predictor.predict(inputs, copy=True)
+
+    activations = inputs
+    for i, (weights, biases) in enumerate(self.layers):
+      activations = activations @ weights + biases
+      if i < len(self.layers) - 1:
+        activations = np.tanh(activations) if self.hiddenActivation == "tanh" else _sigmoid(activations)
+    activations = activations - activations.max(axis=1, keepdims=True)
+    probabilities = np.exp(activations)
+    probabilities /= probabilities.sum(axis=1, keepdims=True)
+    return probabilities, np.argmax(probabilities, axis=1)
+
+  def classifySignals(self, signalMatrix):
+    """
+    Compute the selected indicators of raw signals (see indicators.py) and classify them.
+    """
+    indicatorBatch = calculateIndicatorsBatch(signalMatrix)
+    return self.classify(indicatorBatch[:, indicatorColumns(self.indicatorNames)])
+
+
+def savePipeline(path: str, artifact: PipelineArtifact):
+  """
+  Write a pipeline to an uncompressed .npz file.
+  """
+
+  header = {
+    "format": PIPELINE_FORMAT,
+    "version": PIPELINE_VERSION,
+    "indicatorNames": artifact.indicatorNames,
+    "labels": artifact.labels,
+    "hiddenActivation": artifact.hiddenActivation,
+    "layerCount": len(artifact.layers),
+  }
+  arrays = {"header": np.array(json.dumps(header)), "mean": artifact.mean, "scale": artifact.scale}
+  for i, (weights, biases) in enumerate(artifact.layers):
+    arrays[f"weights_{i}"] = weights
+    arrays[f"biases_{i}"] = biases
+  with open(path, "wb") as file:
+    np.savez(file, **arrays)
+
+
+def loadPipeline(path: str) -> PipelineArtifact:
+  """
+  Read a pipeline written by savePipeline.
+
+  Raises:
+    ValueError: If the file is not a pipeline or was written by a newer version.
+  """
+
+  with np.load(path, allow_pickle=False) as data:
+    header = json.loads(str(data["header"]))
+    if header.get("format") != PIPELINE_FORMAT:
+      raise ValueError(f"{path} is not a {PIPELINE_FORMAT} file.")
+    if header.get("version", 0) > PIPELINE_VERSION:
+      raise ValueError(f"{path} has version {header['version']}, this code reads up to {PIPELINE_VERSION}.")
+    layers = [(data[f"weights_{i}"], data[f"biases_{i}"]) for i in range(header["layerCount"])]
+    return PipelineArtifact(
+      layers, header["indicatorNames"], header["labels"], data["mean"], data["scale"], header["hiddenActivation"],
+    )
+
+
+def _sigmoidLayers(artifact: PipelineArtifact) -> list:
+  """
+  Equivalent layers for predict.ts: normalisation folded in, hidden activations as sigmoid.
+  """
+
+  layers = [(weights.copy(), biases.copy()) for weights, biases in artifact.layers]
+  weights, biases = layers[0]
+  weights /= artifact.scale[:, None]
+  biases -= (artifact.mean / artifact.scale) @ artifact.layers[0][0]
+
+  if artifact.hiddenActivation == "tanh":
+    for i in range(len(layers) - 1):
+      # tanh(z) = 2 sigmoid(2z) - 1
+      layers[i][0][...] *= 2
+      layers[i][1][...] *= 2
+      nextWeights, nextBiases = layers[i + 1]
+      nextBiases -= nextWeights.sum(axis=0)
+      nextWeights *= 2
+  return layers
+
+
+def exportModelJson(artifact: PipelineArtifact, modelPath: str, relevantFeaturesPath: str = None, labelsPath: str = None):
+  """
+  Export a pipeline in the model/source/model.json layout, plus optionally the
+  relevant-features.json and expectation-labels.json files read by predict.ts.
+  """
+
+  model = {"layers": [
+    {"neurons": [{"weights": weights[:, j].tolist(), "bias": float(biases[j])} for j in range(weights.shape[1])]}
+    for weights, biases in _sigmoidLayers(artifact)
+  ]}
+  with open(modelPath, "w") as file:
+    json.dump(model, file, indent=2)
+
+  if relevantFeaturesPath is not None:
+    with open(relevantFeaturesPath, "w") as file:
+      json.dump([INDICATOR_TS_NAMES[name] for name in artifact.indicatorNames], file, indent=2)
+  if labelsPath is not None:
+    with open(labelsPath, "w") as file:
+      json.dump(artifact.labels, file, indent=2)
+
+
+def loadModelJson(modelPath: str, relevantFeaturesPath: str, labelsPath: str) -> PipelineArtifact:
+  """
+  Load a model.json written by model/source (sigmoid hidden layers, softmax output)
+  or by exportModelJson, with its relevant-features.json and expectation-labels.json.
+  """
+
+  with open(modelPath) as file:
+    model = json.load(file)
+  with open(relevantFeaturesPath) as file:
+    indicatorNames = [TS_FEATURE_NAMES[name] for name in json.load(file)]
+  with open(labelsPath) as file:
+    labels = json.load(file)
+
+  layers = [
+    (np.array([neuron["weights"] for neuron in layer["neurons"]]).T, np.array([neuron["bias"] for neuron in layer["neurons"]]))
+    for layer in model["layers"]
+  ]
+  return PipelineArtifact(layers, indicatorNames, labels, hiddenActivation="sigmoid")
@@ -0,0 +1,42 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from artifact import PipelineArtifact, exportModelJson, loadModelJson, loadPipeline, savePipeline
+from network import trainNetwork2Layers
+
+rng = np.random.default_rng(4)
+labels = np.repeat(np.arange(4), 30)
+inputs = rng.normal(0, 1, size=(4, 3))[labels] * [1e4, 1.0, 10.0] + rng.normal(50, 1, size=(120, 3))
+mean, scale = inputs.mean(axis=0), inputs.std(axis=0)
+weights, _ = trainNetwork2Layers((inputs - mean) / scale, np.eye(4)[labels], epochs=200, seed=0)
+
+pipeline = PipelineArtifact([weights[:2], weights[2:]], ["energy", "rms", "peak"], ["a", "b", "c", "d"], mean, scale)
+expected, expectedLabels = pipeline.classify(inputs)
+
+with tempfile.TemporaryDirectory() as directory:
+  path = os.path.join(directory, "pipeline.npz")
+  savePipeline(path, pipeline)
+  start = time.perf_counter()
+  loaded = loadPipeline(path)
+  probabilities, predicted = loaded.classify(inputs)
+  print(f"loadPipeline + classify {(time.perf_counter() - start) * 1e3:.2f} ms")
+  assert np.allclose(probabilities, expected) and np.array_equal(predicted, expectedLabels)
+
+  # model.json export: normalisation folded in, tanh rewritten as sigmoid (predict.ts semantics).
+  paths = [os.path.join(directory, name) for name in ("model.json", "relevant-features.json", "expectation-labels.json")]
+  exportModelJson(pipeline, *paths)
+  fromJson = loadModelJson(*paths)
+  assert fromJson.indicatorNames == ["energy", "rms", "peak"]
+  assert np.allclose(fromJson.classify(inputs)[0], expected)
+
+# The model trained by model/source loads as well.
+source = os.path.join(os.path.dirname(__file__), "..", "model", "source")
+tsPipeline = loadModelJson(*[os.path.join(source, name) for name in ("model.json", "relevant-features.json", "expectation-labels.json")])
+print("model/source/model.json", tsPipeline.indicatorNames, tsPipeline.classify(np.ones((2, 4)))[1])
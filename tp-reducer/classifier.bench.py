@@ -0,0 +1,78 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from classifier import KNeighborsClassifier, NearestCentroidClassifier
+from dataset import FeatureDataset
+from network import Network2LayersPredictor
+from reducer import (
+  INDICATOR_VECTOR_NAMES,
+  REDUCER_CLASS_LABELS,
+  calculateIndicatorsMatrix,
+  importSignalList,
+  neuralNetwork2LayersTraining,
+  selectRelevantIndicatorsUsingSBS,
+)
+
+"""
+  Fit and predict times of the distance classifiers against the 2-layer network,
+  on the 3 SBS-selected indicators of the four tp-reducer classes (70/30 split).
+  Prediction throughput is also measured on a large batch of jittered test rows.
+  Usage: python tp-reducer/classifier.bench.py [queries] [repetitions]
+"""
+
+queryCount = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+data_dir = os.path.join(os.path.dirname(__file__), "data")
+classMatrices = [calculateIndicatorsMatrix(importSignalList(os.path.join(data_dir, label))) for label in REDUCER_CLASS_LABELS]
+dataset = selectRelevantIndicatorsUsingSBS(FeatureDataset.fromClassMatrices(classMatrices, INDICATOR_VECTOR_NAMES, REDUCER_CLASS_LABELS), 3)
+train, test = dataset.split(0.7)
+
+rng = np.random.default_rng(0)
+queries = test.features[rng.integers(0, len(test), queryCount)]
+queries = queries * (1 + 0.01 * rng.standard_normal(queries.shape))
+
+
+def best(function):
+  timings = []
+  for _ in range(repetitions):
+    start = time.perf_counter()
+    result = function()
+    timings.append(time.perf_counter() - start)
+  return min(timings), result
+
+
+class NetworkClassifier:
+  def fit(self, dataset):
+    self.mean = dataset.features.mean(axis=0)
+    self.scale = dataset.features.std(axis=0)
+    weights = neuralNetwork2LayersTraining(
+      (dataset.features - self.mean) / self.scale, dataset.oneHot(), batchSize=16, optimizer="momentum", seed=0,
+    )
+    self.predictor = Network2LayersPredictor(weights)
+    return self
+
+  def predict(self, X):
+    X = X.features if isinstance(X, FeatureDataset) else X
+    return self.predictor.predict((X - self.mean) / self.scale, copy=True)[1]
+
+
+print(f"{len(train)} training rows, {len(test)} testing rows, features {dataset.featureNames}")
+print(f"{'classifier':<22}{'fit ms':>10}{'predict test ms':>18}{f'predict {queryCount} ms':>20}{'rows/s':>14}{'accuracy':>10}")
+for name, create in (
+  ("2-layer network", NetworkClassifier),
+  ("nearest centroid", NearestCentroidClassifier),
+  ("k-NN (k=5, KD-tree)", lambda: KNeighborsClassifier(k=5)),
+):
+  fitSeconds, model = best(lambda: create().fit(train))
+  testSeconds, predictions = best(lambda: model.predict(test))
+  batchSeconds, _ = best(lambda: model.predict(queries))
+  accuracy = np.mean(predictions == test.labels)
+  print(f"{name:<22}{fitSeconds * 1e3:>10.2f}{testSeconds * 1e3:>18.3f}{batchSeconds * 1e3:>20.1f}{queryCount / batchSeconds:>14.0f}{accuracy:>10.3f}")
@@ -0,0 +1,404 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from dataset import FeatureDataset
+
+"""
+  Distance classifiers for the small selected-indicator spaces (3 features in reducer.py):
+  nearest centroid (the class means of the Fisher criterion, see sbs.py) and k nearest
+  neighbours on a KD-tree.
+
+  The KD-tree keeps leaf buckets of point indices. Queries run in batches: every
+  round expands all (query, node) pairs at once and drops the nodes whose bounding
+  box is farther than the current k-th neighbour. Points are inserted in place: they
+  go to their leaf, a full leaf is split in two, and only the boxes on their path grow.
+
+  Both classifiers take (X, y) arrays or a FeatureDataset, and standardize the features
+  with the statistics of the first fit unless standardize=False.
+"""
+
+
+def _splitOnWidest(points: np.ndarray, indices: np.ndarray):
+  """
+  Median split of indices on the dimension of largest spread.
+  """
+  values = points[indices]
+  dimension = int(np.argmax(values.max(axis=0) - values.min(axis=0)))
+  half = indices.shape[0] // 2
+  order = np.argpartition(values[:, dimension], half)
+  splitValue = float(values[order[half], dimension])
+  left, right = indices[order[:half]], indices[order[half:]]
+  return dimension, splitValue, left, right
+
+
+class KDTree:
+  """
+  Args:
+    points: (n, d) points.
+    leafSize (int): Points per leaf after a build; leaves hold up to twice as many
+      through inserts before they are split.
+  """
+
+  def __init__(self, points, leafSize: int = 16):
+    if leafSize < 1: raise ValueError("leafSize must be positive.")
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2: raise ValueError(f"Expected (n, d) points, got shape {points.shape}.")
+
+    self.leafSize = leafSize
+    self.leafCapacity = 2 * leafSize
+    self.dimension = points.shape[1]
+    self.size = 0
+    self.points = np.empty((max(points.shape[0], 16), self.dimension))
+
+    # Node arrays (grown by doubling). Inner nodes: splitDimension/splitValue/left/right.
+    # Leaves: left == -1 and leafSlot indexes leafIndices/leafCounts.
+    self.nodeCount = 0
+    self.splitDimension = np.zeros(16, dtype=np.intp)
+    self.splitValue = np.zeros(16)
+    self.left = np.full(16, -1, dtype=np.intp)
+    self.right = np.full(16, -1, dtype=np.intp)
+    self.leafSlot = np.full(16, -1, dtype=np.intp)
+    self.low = np.full((16, self.dimension), np.inf)
+    self.high = np.full((16, self.dimension), -np.inf)
+    self.leafCount = 0
+    self.leafIndices = np.full((16, self.leafCapacity), -1, dtype=np.intp)
+    self.leafCounts = np.zeros(16, dtype=np.intp)
+
+    self.points[:points.shape[0]] = points
+    self.size = points.shape[0]
+    root = self._newNode()
+    self._build(root, np.arange(self.size))
+
+  def __len__(self) -> int:
+    return self.size
+
+  def _newNode(self) -> int:
+    if self.nodeCount == self.left.shape[0]:
+      grow = self.left.shape[0]
+      self.splitDimension = np.concatenate((self.splitDimension, np.zeros(grow, dtype=np.intp)))
+      self.splitValue = np.concatenate((self.splitValue, np.zeros(grow)))
+      self.left = np.concatenate((self.left, np.full(grow, -1, dtype=np.intp)))
+      self.right = np.concatenate((self.right, np.full(grow, -1, dtype=np.intp)))
+      self.leafSlot = np.concatenate((self.leafSlot, np.full(grow, -1, dtype=np.intp)))
+      self.low = np.concatenate((self.low, np.full((grow, self.dimension), np.inf)))
+      self.high = np.concatenate((self.high, np.full((grow, self.dimension), -np.inf)))
+    self.nodeCount += 1
+    return self.nodeCount - 1
+
+  def _newLeafSlot(self) -> int:
+    if self.leafCount == self.leafCounts.shape[0]:
+      grow = self.leafCounts.shape[0]
+      self.leafIndices = np.concatenate((self.leafIndices, np.full((grow, self.leafCapacity), -1, dtype=np.intp)))
+      self.leafCounts = np.concatenate((self.leafCounts, np.zeros(grow, dtype=np.intp)))
+    self.leafCount += 1
+    return self.leafCount - 1
+
+  def _makeLeaf(self, node: int, indices: np.ndarray, slot: int = None):
+    slot = self._newLeafSlot() if slot is None else slot
+    self.left[node] = self.right[node] = -1
+    self.leafSlot[node] = slot
+    self.leafIndices[slot] = -1
+    self.leafIndices[slot, :indices.shape[0]] = indices
+    self.leafCounts[slot] = indices.shape[0]
+
+  def _build(self, root: int, indices: np.ndarray):
+    stack = [(root, indices)]
+    while stack:
+      node, indices = stack.pop()
+      if indices.shape[0]:
+        values = self.points[indices]
+        self.low[node] = values.min(axis=0)
+        self.high[node] = values.max(axis=0)
+      if indices.shape[0] <= self.leafSize:
+        self._makeLeaf(node, indices)
+        continue
+      dimension, splitValue, leftIndices, rightIndices = _splitOnWidest(self.points, indices)
+      left, right = self._newNode(), self._newNode()
+      self.splitDimension[node], self.splitValue[node] = dimension, splitValue
+      self.left[node], self.right[node] = left, right
+      stack += [(left, leftIndices), (right, rightIndices)]
+
+  def _descend(self, queries: np.ndarray, nodes: np.ndarray = None) -> np.ndarray:
+    """
+    Leaf node of every query, all queries moving down one level per step.
+    """
+    nodes = np.zeros(queries.shape[0], dtype=np.intp) if nodes is None else nodes.copy()
+    inner = np.flatnonzero(self.left[nodes] >= 0)
+    while inner.shape[0]:
+      current = nodes[inner]
+      goRight = queries[inner, self.splitDimension[current]] >= self.splitValue[current]
+      nodes[inner] = np.where(goRight, self.right[current], self.left[current])
+      inner = inner[self.left[nodes[inner]] >= 0]
+    return nodes
+
+  def insert(self, points) -> np.ndarray:
+    """
+    Add points without rebuilding the tree.
+
+    Returns:
+      np.ndarray: Indices of the new points.
+    """
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, self.dimension)
+    count = points.shape[0]
+    if self.size + count > self.points.shape[0]:
+      grown = np.empty((max(2 * self.points.shape[0], self.size + count), self.dimension))
+      grown[:self.size] = self.points[:self.size]
+      self.points = grown
+    indices = np.arange(self.size, self.size + count)
+    self.points[indices] = points
+    self.size += count
+
+    # Grow the boxes along every path, level by level for the whole batch.
+    nodes = np.zeros(count, dtype=np.intp)
+    active = np.arange(count)
+    while active.shape[0]:
+      current = nodes[active]
+      np.minimum.at(self.low, current, points[active])
+      np.maximum.at(self.high, current, points[active])
+      inner = self.left[current] >= 0
+      active, current = active[inner], current[inner]
+      goRight = points[active, self.splitDimension[current]] >= self.splitValue[current]
+      nodes[active] = np.where(goRight, self.right[current], self.left[current])
+
+    # Place the points; a leaf that fills up is split. Later points of the batch then
+    # descend through the new nodes, whose boxes must grow as well.
+    for index, node in zip(indices, nodes):
+      point = self.points[index]
+      while self.left[node] >= 0:
+        node = self.right[node] if point[self.splitDimension[node]] >= self.splitValue[node] else self.left[node]
+        self.low[node] = np.minimum(self.low[node], point)
+        self.high[node] = np.maximum(self.high[node], point)
+      slot = self.leafSlot[node]
+      self.leafIndices[slot, self.leafCounts[slot]] = index
+      self.leafCounts[slot] += 1
+      if self.leafCounts[slot] == self.leafCapacity:
+        self._splitLeaf(node)
+    return indices
+
+  def _splitLeaf(self, node: int):
+    slot = self.leafSlot[node]
+    indices = self.leafIndices[slot, :self.leafCounts[slot]].copy()
+    dimension, splitValue, leftIndices, rightIndices = _splitOnWidest(self.points, indices)
+    left, right = self._newNode(), self._newNode()
+    for child, childIndices, childSlot in ((left, leftIndices, slot), (right, rightIndices, None)):
+      values = self.points[childIndices]
+      self.low[child], self.high[child] = values.min(axis=0), values.max(axis=0)
+      self._makeLeaf(child, childIndices, childSlot)
+    self.splitDimension[node], self.splitValue[node] = dimension, splitValue
+    self.left[node], self.right[node] = left, right
+    self.leafSlot[node] = -1
+
+  def _leafCandidates(self, queries: np.ndarray, queryIndices: np.ndarray, nodes: np.ndarray):
+    """
+    (pairs, leafCapacity) squared distances and point indices of the leaves of (query, node) pairs.
+    """
+    slots = self.leafSlot[nodes]
+    members = self.leafIndices[slots, :max(int(self.leafCounts[slots].max(initial=0)), 1)]
+    differences = self.points[np.maximum(members, 0)] - queries[queryIndices][:, None, :]
+    distances = np.einsum("ijk,ijk->ij", differences, differences)
+    distances[members < 0] = np.inf
+    return distances, members
+
+  @staticmethod
+  def _merge(k: int, best: tuple, queryIndices: np.ndarray, distances: np.ndarray, members: np.ndarray):
+    """
+    Merge leaf candidates into the (count, k) best distances / indices, in place.
+    The candidates of every query are laid out on one row next to its current best,
+    then the k smallest of each row are kept.
+    """
+
+    order = np.argsort(queryIndices, kind="stable")
+    queryIndices, distances, members = queryIndices[order], distances[order], members[order]
+    rows, starts, counts = np.unique(queryIndices, return_index=True, return_counts=True)
+    rank = np.arange(queryIndices.shape[0]) - np.repeat(starts, counts)
+    width = members.shape[1]
+
+    rowDistances = np.full((rows.shape[0], k + counts.max() * width), np.inf)
+    rowMembers = np.full(rowDistances.shape, -1, dtype=np.intp)
+    rowDistances[:, :k], rowMembers[:, :k] = best[0][rows], best[1][rows]
+    target = np.repeat(np.arange(rows.shape[0]), counts)[:, None]
+    columns = k + rank[:, None] * width + np.arange(width)
+    rowDistances[target, columns] = distances
+    rowMembers[target, columns] = members
+
+    if rowDistances.shape[1] > k:
+      keep = np.argpartition(rowDistances, k - 1, axis=1)[:, :k]
+      rowDistances = np.take_along_axis(rowDistances, keep, axis=1)
+      rowMembers = np.take_along_axis(rowMembers, keep, axis=1)
+    order = np.argsort(rowDistances, axis=1)
+    best[0][rows] = np.take_along_axis(rowDistances, order, axis=1)
+    best[1][rows] = np.take_along_axis(rowMembers, order, axis=1)
+
+  def query(self, queries, k: int = 1):
+    """
+    k nearest points of every query.
+
+    Returns:
+      np.ndarray: (m, k) Euclidean distances, ascending (inf when the tree has fewer than k points).
+      np.ndarray: (m, k) point indices (-1 where missing).
+    """
+
+    queries = np.asarray(queries, dtype=np.float64).reshape(-1, self.dimension)
+    count = queries.shape[0]
+    if k < 1: raise ValueError("k must be positive.")
+
+    # The leaf of every query gives a first bound, then the tree is searched breadth first.
+    firstLeaves = self._descend(queries)
+    best = (np.full((count, k), np.inf), np.full((count, k), -1, dtype=np.intp))
+    self._merge(k, best, np.arange(count), *self._leafCandidates(queries, np.arange(count), firstLeaves))
+
+    queryIndices = np.arange(count)
+    nodes = np.zeros(count, dtype=np.intp)
+    while queryIndices.shape[0]:
+      gap = np.maximum(self.low[nodes] - queries[queryIndices], 0) + np.maximum(queries[queryIndices] - self.high[nodes], 0)
+      bound = np.einsum("ij,ij->i", gap, gap)
+      keep = (bound < best[0][queryIndices, -1]) & (nodes != firstLeaves[queryIndices])
+      queryIndices, nodes = queryIndices[keep], nodes[keep]
+
+      isLeaf = self.left[nodes] < 0
+      if isLeaf.any():
+        self._merge(k, best, queryIndices[isLeaf], *self._leafCandidates(queries, queryIndices[isLeaf], nodes[isLeaf]))
+      inner = ~isLeaf
+      queryIndices = np.repeat(queryIndices[inner], 2)
+      nodes = np.stack((self.left[nodes[inner]], self.right[nodes[inner]]), axis=1).ravel()
+
+    return np.sqrt(best[0]), best[1]
+
+
+def _featuresAndLabels(X, y):
+  if isinstance(X, FeatureDataset):
+    return np.asarray(X.features, dtype=np.float64), np.asarray(X.labels, dtype=np.intp)
+  if y is None: raise TypeError("Labels are required unless X is a FeatureDataset.")
+  return np.asarray(X, dtype=np.float64), np.asarray(y, dtype=np.intp)
+
+
+class _Standardizer:
+  def __init__(self, standardize: bool):
+    self.standardize = standardize
+    self.mean = None
+    self.scale = None
+
+  def fit(self, X: np.ndarray):
+    if self.standardize:
+      self.mean = X.mean(axis=0)
+      self.scale = X.std(axis=0)
+      self.scale[self.scale == 0] = 1.0
+
+  def __call__(self, X) -> np.ndarray:
+    X = np.asarray(X.features if isinstance(X, FeatureDataset) else X, dtype=np.float64)
+    if X.ndim == 1:
+      X = X[None, :]
+    return (X - self.mean) / self.scale if self.standardize else X
+
+
+class NearestCentroidClassifier:
+  """
+  Each class is represented by its mean; a sample goes to the closest one.
+  partialFit updates the means with new samples (running sums, no refit).
+
+  Args:
+    standardize (bool): Standardize with the statistics of the first fit.
+  """
+
+  def __init__(self, standardize: bool = True):
+    self._standardizer = _Standardizer(standardize)
+    self.sums = None
+    self.counts = None
+
+  @property
+  def centroids(self) -> np.ndarray:
+    return self.sums / np.maximum(self.counts, 1)[:, None]
+
+  def fit(self, X, y=None) -> "NearestCentroidClassifier":
+    X, y = _featuresAndLabels(X, y)
+    self._standardizer.fit(X)
+    self.sums, self.counts = None, None
+    return self.partialFit(X, y)
+
+  def partialFit(self, X, y=None) -> "NearestCentroidClassifier":
+    X, y = _featuresAndLabels(X, y)
+    X = self._standardizer(X)
+    classCount = int(y.max()) + 1 if y.size else 0
+    if self.sums is None:
+      self.sums, self.counts = np.zeros((classCount, X.shape[1])), np.zeros(classCount, dtype=np.intp)
+    elif classCount > self.counts.shape[0]:
+      grow = classCount - self.counts.shape[0]
+      self.sums = np.vstack((self.sums, np.zeros((grow, X.shape[1]))))
+      self.counts = np.concatenate((self.counts, np.zeros(grow, dtype=np.intp)))
+    np.add.at(self.sums, y, X)
+    self.counts += np.bincount(y, minlength=self.counts.shape[0])
+    return self
+
+  def distances(self, X) -> np.ndarray:
+    """
+    (n, n_classes) squared distances to the centroids (inf for classes without samples).
+    """
+    X = self._standardizer(X)
+    centroids = self.centroids
+    distances = np.einsum("ij,ij->i", X, X)[:, None] - 2 * X @ centroids.T + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+    distances[:, self.counts == 0] = np.inf
+    return np.maximum(distances, 0)
+
+  def predict(self, X) -> np.ndarray:
+    return np.argmin(self.distances(X), axis=1)
+
+
+class KNeighborsClassifier:
+  """
+  Majority vote of the k nearest training samples, found with a KDTree.
+  Ties go to the class of the nearest of the tied neighbours.
+
+  Args:
+    k (int): Number of neighbours.
+    leafSize (int): KDTree leaf size.
+    standardize (bool): Standardize with the statistics of the first fit.
+  """
+
+  def __init__(self, k: int = 5, leafSize: int = 16, standardize: bool = True):
+    if k < 1: raise ValueError("k must be positive.")
+    self.k = k
+    self.leafSize = leafSize
+    self._standardizer = _Standardizer(standardize)
+    self.tree = None
+    self.labels = None
+
+  def fit(self, X, y=None) -> "KNeighborsClassifier":
+    X, y = _featuresAndLabels(X, y)
+    self._standardizer.fit(X)
+    self.tree = KDTree(self._standardizer(X), self.leafSize)
+    self.labels = y.copy()
+    return self
+
+  def insert(self, X, y=None) -> "KNeighborsClassifier":
+    """
+    Add training samples to the index, keeping the standardization of fit.
+    """
+    X, y = _featuresAndLabels(X, y)
+    self.tree.insert(self._standardizer(X))
+    self.labels = np.concatenate((self.labels, y))
+    return self
+
+  def kneighbors(self, X, k: int = None):
+    """
+    (distances, indices) of the k nearest training samples, see KDTree.query.
+    """
+    return self.tree.query(self._standardizer(X), k or self.k)
+
+  def predict(self, X, batchSize: int = 4096) -> np.ndarray:
+    X = self._standardizer(X)
+    predictions = np.empty(X.shape[0], dtype=np.intp)
+    classCount = int(self.labels.max()) + 1
+    for start in range(0, X.shape[0], batchSize):
+      _distances, indices = self.tree.query(X[start:start + batchSize], self.k)
+      valid = indices >= 0
+      neighbourLabels = self.labels[np.where(valid, indices, 0)]
+      votes = np.zeros((indices.shape[0], classCount))
+      rows = np.repeat(np.arange(indices.shape[0]), self.k).reshape(indices.shape)
+      # Rank weights 1/2, 1/4, ... sum below one vote and let the nearest neighbour break ties.
+      np.add.at(votes, (rows[valid], neighbourLabels[valid]), 1 + 0.5 ** (np.nonzero(valid)[1] + 1))
+      predictions[start:start + batchSize] = np.argmax(votes, axis=1)
+    return predictions
@@ -0,0 +1,74 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from classifier import KDTree, KNeighborsClassifier, NearestCentroidClassifier
+from dataset import FeatureDataset
+
+rng = np.random.default_rng(0)
+
+
+def bruteForce(points, queries, k):
+  distances = np.sqrt(((queries[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+  order = np.argsort(distances, axis=1, kind="stable")[:, :k]
+  return np.take_along_axis(distances, order, axis=1), order
+
+
+# KD-tree queries match a brute-force search, before and after incremental inserts.
+points = rng.normal(size=(500, 3))
+points[:40] = points[0]  # duplicates
+queries = rng.normal(size=(200, 3))
+tree = KDTree(points, leafSize=8)
+for k in (1, 5, 17):
+  distances, indices = tree.query(queries, k)
+  expected, _ = bruteForce(points, queries, k)
+  assert np.allclose(distances, expected), k
+  assert np.allclose(np.linalg.norm(points[indices] - queries[:, None, :], axis=2), distances)
+
+inserted = rng.normal(2.0, 0.5, size=(300, 3))
+for start in range(0, 300, 37):
+  tree.insert(inserted[start:start + 37])
+allPoints = np.concatenate((points, inserted))
+assert len(tree) == 800 and tree.leafCounts[:tree.leafCount].sum() == 800
+distances, indices = tree.query(queries, 9)
+assert np.allclose(distances, bruteForce(allPoints, queries, 9)[0])
+
+# One large batch into a small-leaf tree: leaves split mid-batch and the new nodes' boxes must hold the later points.
+batchPoints = rng.normal(size=(46, 3))
+tree = KDTree(batchPoints, leafSize=3)
+batch = rng.normal(size=(179, 3))
+tree.insert(batch)
+batchQueries = rng.normal(size=(200, 3))
+assert np.allclose(tree.query(batchQueries, 3)[0], bruteForce(np.concatenate((batchPoints, batch)), batchQueries, 3)[0])
+
+# Growing a tree from empty, and asking for more neighbours than points.
+tree = KDTree(np.empty((0, 2)), leafSize=4)
+tree.insert(rng.normal(size=(3, 2)))
+distances, indices = tree.query(np.zeros((1, 2)), 5)
+assert np.isfinite(distances[0, :3]).all() and np.isinf(distances[0, 3:]).all() and (indices[0, 3:] == -1).all()
+tree.insert(rng.normal(size=(100, 2)))
+assert np.allclose(tree.query(np.zeros((4, 2)), 3)[0], bruteForce(tree.points[:103], np.zeros((4, 2)), 3)[0])
+
+# Classifiers on separated blobs, from arrays or a FeatureDataset.
+centers = np.array([[0, 0, 0], [4, 0, 0], [0, 4, 0], [0, 0, 4]], dtype=float)
+classMatrices = [rng.normal(center, 0.5, size=(60, 3)) for center in centers]
+dataset = FeatureDataset.fromClassMatrices(classMatrices, ["x", "y", "z"])
+train, test = dataset.split(0.7)
+
+centroid = NearestCentroidClassifier().fit(train)
+assert np.mean(centroid.predict(test) == test.labels) > 0.95
+neighbours = KNeighborsClassifier(k=5).fit(train.features, train.labels)
+assert np.mean(neighbours.predict(test) == test.labels) > 0.95
+
+# Incremental updates give the same centroids as a refit, with the same standardization.
+incremental = NearestCentroidClassifier(standardize=False).fit(train.classView(0)).partialFit(train)
+full = NearestCentroidClassifier(standardize=False).fit(np.concatenate((train.classView(0).features, train.features)),
+                                                        np.concatenate((train.classView(0).labels, train.labels)))
+assert np.allclose(incremental.centroids, full.centroids)
+
+neighbours = KNeighborsClassifier(k=1).fit(train.classView(0))
+neighbours.insert(train.features[train.labels > 0], train.labels[train.labels > 0])
+assert np.mean(neighbours.predict(test) == test.labels) > 0.95
+print("classifier tests passed")
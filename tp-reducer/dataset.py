@@ -0,0 +1,255 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import json
+
+import numpy as np
+
+"""
+  Labelled feature table: one column-major float64 array, an int8 label array and the
+  feature and class names.
+
+  Rows are kept grouped by class, so a class is a row slice and every column is
+  contiguous in memory: class views and column selections (single columns, or any
+  evenly spaced set of columns) are views, never copies.
+
+  File layout (written by saveDataset, opened with np.memmap by openDataset):
+    magic: 8 bytes  -  DATASET_MAGIC
+    header length: uint64 little-endian
+    header: JSON, see Interface DatasetHeader
+    features: float64[n_features][n_rows], at header["featuresOffset"]
+    labels: int8[n_rows], at header["labelsOffset"]
+
+  Interface DatasetHeader
+    version: number  -  DATASET_VERSION
+    rows: number
+    featureNames: list
+    labelNames: list
+    featuresOffset, labelsOffset: number  -  Byte offsets, multiples of 64
+"""
+
+DATASET_MAGIC = b"MPPDS\x00\x00\x00"
+DATASET_VERSION = 1
+_ALIGNMENT = 64
+
+
+class FeatureDataset:
+  """
+  Args:
+    features: (n_rows, n_features) values.
+    labels: (n_rows,) class indices into labelNames (0 to 127).
+    featureNames (list): Name of every column.
+    labelNames (list): Name of every class. Defaults to the class indices as strings.
+
+  Rows are reordered by class (stable) when the labels are not already sorted.
+  """
+
+  def __init__(self, features, labels, featureNames: list, labelNames: list = None):
+    features = np.asarray(features, dtype=np.float64)
+    labels = np.asarray(labels)
+    if features.ndim != 2: raise ValueError(f"Expected a (n_rows, n_features) array, got shape {features.shape}.")
+    if labels.shape != (features.shape[0],): raise ValueError(f"Expected {features.shape[0]} labels, got shape {labels.shape}.")
+    if len(featureNames) != features.shape[1]: raise ValueError(f"Expected {features.shape[1]} feature names, got {len(featureNames)}.")
+    if labels.size and (labels.min() < 0 or labels.max() > 127): raise ValueError("Labels must be in [0, 127].")
+
+    if labels.size and np.any(labels[1:] < labels[:-1]):
+      order = np.argsort(labels, kind="stable")
+      features, labels = features[order], labels[order]
+
+    classCount = int(labels.max()) + 1 if labels.size else 0
+    self.labelNames = list(labelNames) if labelNames is not None else [str(label) for label in range(classCount)]
+    if classCount > len(self.labelNames): raise ValueError(f"Label {classCount - 1} has no name in labelNames.")
+
+    self.features = np.asfortranarray(features)
+    self.labels = np.ascontiguousarray(labels, dtype=np.int8)
+    self.featureNames = list(featureNames)
+    counts = np.bincount(self.labels, minlength=len(self.labelNames))
+    self.classOffsets = np.concatenate(([0], np.cumsum(counts)))
+
+  @classmethod
+  def fromClassMatrices(cls, classMatrices: list, featureNames: list, labelNames: list = None) -> "FeatureDataset":
+    """
+    Build a dataset from one (n_samples_i, n_features) matrix per class, as passed
+    around by reducer.py. Every matrix is written once into the preallocated table.
+    """
+
+    matrices = [np.asarray(matrix, dtype=np.float64).reshape(-1, len(featureNames)) for matrix in classMatrices]
+    rows = sum(matrix.shape[0] for matrix in matrices)
+    features = np.empty((rows, len(featureNames)), dtype=np.float64, order="F")
+    labels = np.empty(rows, dtype=np.int8)
+    start = 0
+    for label, matrix in enumerate(matrices):
+      features[start:start + matrix.shape[0]] = matrix
+      labels[start:start + matrix.shape[0]] = label
+      start += matrix.shape[0]
+    return cls(features, labels, featureNames, labelNames if labelNames is not None else [str(label) for label in range(len(matrices))])
+
+  @classmethod
+  def _view(cls, features: np.ndarray, labels: np.ndarray, featureNames: list, labelNames: list) -> "FeatureDataset":
+    # Sorted labels and a column-major array: no validation, no copy.
+    dataset = cls.__new__(cls)
+    dataset.features = features
+    dataset.labels = labels
+    dataset.featureNames = list(featureNames)
+    dataset.labelNames = labelNames
+    counts = np.bincount(labels, minlength=len(labelNames))
+    dataset.classOffsets = np.concatenate(([0], np.cumsum(counts)))
+    return dataset
+
+  def __len__(self) -> int:
+    return self.features.shape[0]
+
+  @property
+  def shape(self) -> tuple:
+    return self.features.shape
+
+  @property
+  def classCounts(self) -> np.ndarray:
+    return np.diff(self.classOffsets)
+
+  def featureIndices(self, names) -> list:
+    """
+    Column indices of feature names (integers are passed through).
+    """
+    return [name if isinstance(name, (int, np.integer)) else self.featureNames.index(name) for name in names]
+
+  def column(self, name) -> np.ndarray:
+    """
+    One feature as a contiguous 1-D view.
+    """
+    return self.features[:, self.featureIndices([name])[0]]
+
+  def select(self, names) -> "FeatureDataset":
+    """
+    Dataset restricted to some features (names or indices), in the given order.
+    A view when the columns are evenly spaced (e.g. [0, 2, 4] or a single one), a copy otherwise.
+    """
+
+    indices = self.featureIndices(names)
+    names = [self.featureNames[index] for index in indices]
+    steps = set(np.diff(indices).tolist())
+    if len(indices) == 1 or (len(steps) == 1 and 0 not in steps):
+      step = steps.pop() if steps else 1
+      stop = indices[-1] + step if indices[-1] + step >= 0 else None
+      features = self.features[:, indices[0]:stop:step]
+    else:
+      features = np.asfortranarray(self.features[:, indices])
+    return FeatureDataset._view(features, self.labels, names, self.labelNames)
+
+  def classView(self, label) -> "FeatureDataset":
+    """
+    Rows of one class (index or name), as a view.
+    """
+
+    if not isinstance(label, (int, np.integer)):
+      label = self.labelNames.index(label)
+    start, stop = self.classOffsets[label], self.classOffsets[label + 1]
+    return FeatureDataset._view(self.features[start:stop], self.labels[start:stop], self.featureNames, self.labelNames)
+
+  def classMatrices(self) -> list:
+    """
+    One (n_samples_i, n_features) view per class, the layout reducer.py works with.
+    """
+    return [self.features[self.classOffsets[label]:self.classOffsets[label + 1]] for label in range(len(self.labelNames))]
+
+  def split(self, ratio: float) -> tuple:
+    """
+    Per-class split: the first `ratio` of every class for training, the rest for testing,
+    as reducer.py does. Each part is gathered once; a single-class dataset splits into views.
+
+    Returns:
+      FeatureDataset: Training rows.
+      FeatureDataset: Testing rows.
+    """
+
+    if not 0.0 <= ratio <= 1.0: raise ValueError("ratio must be in [0, 1].")
+    splits = [int(count * ratio) for count in self.classCounts]
+    parts = ([], [])
+    for start, stop, splitIndex in zip(self.classOffsets[:-1], self.classOffsets[1:], splits):
+      parts[0].append(slice(start, start + splitIndex))
+      parts[1].append(slice(start + splitIndex, stop))
+
+    datasets = []
+    for slices in parts:
+      slices = [part for part in slices if part.stop > part.start]
+      if len(slices) <= 1:
+        rows = slices[0] if slices else slice(0, 0)
+        features, labels = self.features[rows], self.labels[rows]
+      else:
+        features = np.empty((sum(part.stop - part.start for part in slices), self.features.shape[1]), order="F")
+        np.concatenate([self.features[part] for part in slices], out=features)
+        labels = np.concatenate([self.labels[part] for part in slices])
+      datasets.append(FeatureDataset._view(features, labels, self.featureNames, self.labelNames))
+    return tuple(datasets)
+
+  def oneHot(self, dtype=np.float64) -> np.ndarray:
+    """
+    (n_rows, n_classes) one-hot targets, as desiredOutputs of neuralNetwork2LayersTraining.
+    """
+    targets = np.zeros((len(self), len(self.labelNames)), dtype=dtype)
+    targets[np.arange(len(self)), self.labels] = 1
+    return targets
+
+
+def saveDataset(path: str, dataset: FeatureDataset):
+  """
+  Write a dataset in the memory-mappable layout read by openDataset.
+  """
+
+  def header(featuresOffset: int, labelsOffset: int) -> bytes:
+    return json.dumps({
+      "version": DATASET_VERSION,
+      "rows": len(dataset),
+      "featureNames": dataset.featureNames,
+      "labelNames": dataset.labelNames,
+      "featuresOffset": featuresOffset,
+      "labelsOffset": labelsOffset,
+    }).encode()
+
+  def align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+  # The offsets are part of the header: size it with placeholders wide enough for any file.
+  placeholder = len(header(10 ** 15, 10 ** 15))
+  featuresOffset = align(len(DATASET_MAGIC) + 8 + placeholder)
+  labelsOffset = align(featuresOffset + dataset.features.nbytes)
+  encoded = header(featuresOffset, labelsOffset).ljust(placeholder)
+
+  with open(path, "wb") as file:
+    file.write(DATASET_MAGIC)
+    file.write(np.uint64(len(encoded)).tobytes())
+    file.write(encoded)
+    file.seek(featuresOffset)
+    file.write(np.asfortranarray(dataset.features).T.tobytes(order="C"))
+    file.seek(labelsOffset)
+    file.write(dataset.labels.tobytes())
+
+
+def openDataset(path: str, mmap: bool = True) -> FeatureDataset:
+  """
+  Open a dataset written by saveDataset. With mmap (default) nothing is read until
+  used: the arrays are read-only views on the file.
+
+  Raises:
+    ValueError: If the file is not a dataset or was written by a newer version.
+  """
+
+  with open(path, "rb") as file:
+    if file.read(len(DATASET_MAGIC)) != DATASET_MAGIC: raise ValueError(f"{path} is not a feature dataset.")
+    length = int(np.frombuffer(file.read(8), dtype="<u8")[0])
+    header = json.loads(file.read(length))
+  if header["version"] > DATASET_VERSION:
+    raise ValueError(f"{path} has version {header['version']}, this code reads up to {DATASET_VERSION}.")
+
+  rows, columns = header["rows"], len(header["featureNames"])
+  if mmap and rows:
+    features = np.memmap(path, dtype=np.float64, mode="r", offset=header["featuresOffset"], shape=(rows, columns), order="F")
+    labels = np.memmap(path, dtype=np.int8, mode="r", offset=header["labelsOffset"], shape=(rows,))
+  else:
+    with open(path, "rb") as file:
+      file.seek(header["featuresOffset"])
+      features = np.fromfile(file, dtype=np.float64, count=rows * columns).reshape((rows, columns), order="F")
+      file.seek(header["labelsOffset"])
+      labels = np.fromfile(file, dtype=np.int8, count=rows)
+  return FeatureDataset._view(features, labels, header["featureNames"], header["labelNames"])
@@ -0,0 +1,71 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from dataset import FeatureDataset, openDataset, saveDataset
+from metrics import enableMetrics, resetMetrics, stageTotals
+from reducer import selectRelevantIndicators
+
+rng = np.random.default_rng(0)
+names = ["mean", "rms", "peak", "kurtosis", "energy"]
+classMatrices = [rng.normal(label, 1.0, (10 + label, 5)) for label in range(3)]
+dataset = FeatureDataset.fromClassMatrices(classMatrices, names, ["a", "b", "c"])
+
+assert dataset.shape == (33, 5) and dataset.features.flags.f_contiguous
+assert dataset.classCounts.tolist() == [10, 11, 12]
+assert np.array_equal(dataset.classView("b").features, classMatrices[1])
+assert np.shares_memory(dataset.classView(2).features, dataset.features)
+assert all(np.array_equal(view, matrix) for view, matrix in zip(dataset.classMatrices(), classMatrices))
+
+# Column access and evenly spaced selections are views, other selections copies.
+assert dataset.column("rms").flags.c_contiguous and np.shares_memory(dataset.column("rms"), dataset.features)
+for selection in (["rms"], ["mean", "peak", "energy"], [4, 2, 0], ["rms", "peak"]):
+  selected = dataset.select(selection)
+  assert np.shares_memory(selected.features, dataset.features), selection
+  assert np.array_equal(selected.features, dataset.features[:, dataset.featureIndices(selection)])
+selected = dataset.select(["energy", "mean", "rms"])
+assert not np.shares_memory(selected.features, dataset.features)
+assert selected.featureNames == ["energy", "mean", "rms"]
+
+# Unsorted labels are grouped by class, keeping the row order within a class.
+shuffled = FeatureDataset(np.arange(12.0).reshape(6, 2), [1, 0, 1, 0, 2, 0], ["x", "y"])
+assert shuffled.labels.tolist() == [0, 0, 0, 1, 1, 2]
+assert shuffled.column("x").tolist() == [2.0, 6.0, 10.0, 0.0, 4.0, 8.0]
+
+train, test = dataset.split(0.7)
+assert train.classCounts.tolist() == [7, 7, 8] and test.classCounts.tolist() == [3, 4, 4]
+assert np.array_equal(train.classView(1).features, classMatrices[1][:7])
+assert np.array_equal(test.classView(2).features, classMatrices[2][8:])
+assert np.array_equal(train.oneHot().argmax(axis=1), train.labels)
+
+# selectRelevantIndicators counts dataset rows (not its iteration) when metrics are on.
+enableMetrics(True)
+resetMetrics()
+assert selectRelevantIndicators(dataset, 3).shape == (33, 3)
+assert len(selectRelevantIndicators(classMatrices, desiredRelevantIndicatorLength=2)[0][0]) == 2
+assert stageTotals()["selectRelevantIndicators"] == {**stageTotals()["selectRelevantIndicators"], "calls": 2, "items": 66}
+enableMetrics(False)
+
+with tempfile.TemporaryDirectory() as directory:
+  path = os.path.join(directory, "features.mppds")
+  saveDataset(path, dataset)
+  reopened = openDataset(path)
+  assert isinstance(reopened.features, np.memmap)
+  assert np.array_equal(reopened.features, dataset.features) and np.array_equal(reopened.labels, dataset.labels)
+  assert reopened.featureNames == names and reopened.labelNames == ["a", "b", "c"]
+  assert np.array_equal(openDataset(path, mmap=False).features, dataset.features)
+
+  # A two-million-row table reopens without reading its data.
+  large = FeatureDataset(np.ones((2_000_000, 8)), np.repeat(np.arange(4), 500_000), [f"f{i}" for i in range(8)])
+  saveDataset(path, large)
+  start = time.perf_counter()
+  reopened = openDataset(path)
+  print(f"reopened {reopened.shape} in {(time.perf_counter() - start) * 1e3:.2f} ms")
+  assert reopened.classCounts.tolist() == [500_000] * 4 and reopened.classView(3).column("f7")[-1] == 1.0
+  del reopened
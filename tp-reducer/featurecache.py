@@ -0,0 +1,172 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from indicators import INDICATOR_CODE_VERSION, calculateIndicatorsBatch, indicatorColumns
+from metrics import instrument
+from reader import readSignal
+
+"""
+  On-disk cache of per-file indicator rows.
+  Key: (file identity, indicator names, INDICATOR_CODE_VERSION), where the file identity is
+  either its real path + size + mtime ("stat", default) or the SHA-256 of its content ("content").
+  Every row is one small .npy file; index.json keeps sizes and use order for LRU eviction
+  once the cache grows beyond maxBytes. The index is written with every batch of new rows,
+  and rows missing from it (a process killed in between) are adopted as least recently used.
+
+  Interface CacheStats
+    hits: number  -  Rows read from the cache
+    misses: number  -  Rows computed
+    evictions: number  -  Rows removed to respect maxBytes
+    entries: number  -  Rows currently cached
+    bytes: number  -  Size of the cached rows
+"""
+
+INDEX_FILE = "index.json"
+
+
+def fileIdentity(file_path: str, identity: str = "stat") -> str:
+  if identity == "stat":
+    stat = os.stat(file_path)
+    return f"{os.path.realpath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+  if identity == "content":
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+      for block in iter(lambda: file.read(1 << 20), b""):
+        digest.update(block)
+    return digest.hexdigest()
+  raise ValueError(f"Unknown identity '{identity}', expected 'stat' or 'content'.")
+
+
+class IndicatorCache:
+  """
+  Args:
+    cacheDir (str): Directory holding the cached rows (created if needed).
+    maxBytes (int): Size bound of the cached rows.
+    identity (str): "stat" or "content", see fileIdentity.
+  """
+
+  def __init__(self, cacheDir: str, maxBytes: int = 64 * 1024 * 1024, identity: str = "stat"):
+    self.cacheDir = cacheDir
+    self.maxBytes = maxBytes
+    self.identity = identity
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    os.makedirs(cacheDir, exist_ok=True)
+
+    self._index = {}
+    self._clock = 0
+    index_path = os.path.join(cacheDir, INDEX_FILE)
+    if os.path.exists(index_path):
+      try:
+        with open(index_path) as file:
+          self._index = json.load(file)
+      except (OSError, ValueError):
+        self._index = {}
+      self._index = {
+        name: entry for name, entry in self._index.items()
+        if os.path.exists(os.path.join(cacheDir, name))
+      }
+      self._clock = max((entry["used"] for entry in self._index.values()), default=0)
+
+    for name in os.listdir(cacheDir):
+      if name.endswith(".npy") and name not in self._index:
+        self._index[name] = {"bytes": os.path.getsize(os.path.join(cacheDir, name)), "used": 0}
+    self._evict()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.flush()
+
+  def _entryName(self, file_path: str, indicatorNames: list) -> str:
+    key = json.dumps([fileIdentity(file_path, self.identity), list(indicatorNames), INDICATOR_CODE_VERSION])
+    return hashlib.sha256(key.encode()).hexdigest()[:32] + ".npy"
+
+  def _touch(self, name: str, size: int):
+    self._clock += 1
+    self._index[name] = {"bytes": size, "used": self._clock}
+
+  def _evict(self):
+    total = sum(entry["bytes"] for entry in self._index.values())
+    for name in sorted(self._index, key=lambda name: self._index[name]["used"]):
+      if total <= self.maxBytes:
+        break
+      total -= self._index.pop(name)["bytes"]
+      self.evictions += 1
+      try:
+        os.remove(os.path.join(self.cacheDir, name))
+      except FileNotFoundError:
+        pass
+
+  @instrument("IndicatorCache.indicatorRows", counters=lambda result, self, file_paths, *args, **kwargs: {"items": len(file_paths)})
+  def indicatorRows(self, file_paths: list, indicatorNames: list) -> np.ndarray:
+    """
+    Indicator rows of acc_*.csv files, computing only the rows missing from the cache.
+
+    Args:
+      file_paths (list): CSV files.
+      indicatorNames (list): Indicator names (see INDICATOR_NAMES), in column order.
+
+    Returns:
+      np.ndarray: (len(file_paths), len(indicatorNames)) array.
+    """
+
+    rows = np.empty((len(file_paths), len(indicatorNames)))
+    names = [self._entryName(file_path, indicatorNames) for file_path in file_paths]
+    missing = []
+    for i, name in enumerate(names):
+      entry_path = os.path.join(self.cacheDir, name)
+      if name in self._index:
+        try:
+          rows[i] = np.load(entry_path)
+          self._touch(name, self._index[name]["bytes"])
+          self.hits += 1
+          continue
+        except (OSError, ValueError):
+          self._index.pop(name, None)
+      missing.append(i)
+
+    if missing:
+      self.misses += len(missing)
+      signals = [readSignal(file_paths[i]) for i in missing]
+      columns = indicatorColumns(indicatorNames)
+      if len({signal.shape[0] for signal in signals}) == 1:
+        computed = calculateIndicatorsBatch(np.stack(signals))[:, columns]
+      else:
+        computed = np.stack([calculateIndicatorsBatch(signal)[0, columns] for signal in signals])
+      for i, row in zip(missing, computed):
+        rows[i] = row
+        entry_path = os.path.join(self.cacheDir, names[i])
+        np.save(entry_path, row)
+        self._touch(names[i], os.path.getsize(entry_path))
+      self._evict()
+      self.flush()
+
+    return rows
+
+  def stats(self) -> dict:
+    return {
+      "hits": self.hits,
+      "misses": self.misses,
+      "evictions": self.evictions,
+      "entries": len(self._index),
+      "bytes": sum(entry["bytes"] for entry in self._index.values()),
+    }
+
+  def flush(self):
+    """
+    Persist the LRU index (use order). Also done after every batch of new rows.
+    """
+    index_path = os.path.join(self.cacheDir, INDEX_FILE)
+    with open(index_path + ".tmp", "w") as file:
+      json.dump(self._index, file)
+    os.replace(index_path + ".tmp", index_path)
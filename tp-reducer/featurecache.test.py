@@ -0,0 +1,55 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from featurecache import IndicatorCache
+from indicators import calculateIndicatorsBatch, indicatorColumns
+from reader import readSignal
+
+source_dir = os.path.join(os.path.dirname(__file__), "data", "2-roulement-defaut-pignon-sain")
+names = ["rms", "kurtosis", "peak"]
+
+with tempfile.TemporaryDirectory() as directory:
+  file_paths = []
+  for name in ["acc_00001.csv", "acc_00002.csv", "acc_00003.csv"]:
+    file_paths.append(shutil.copy(os.path.join(source_dir, name), directory))
+  cacheDir = os.path.join(directory, "cache")
+
+  with IndicatorCache(cacheDir) as cache:
+    rows = cache.indicatorRows(file_paths, names)
+  expected = calculateIndicatorsBatch(np.stack([readSignal(path) for path in file_paths]))[:, indicatorColumns(names)]
+  assert np.array_equal(rows, expected) and cache.misses == 3
+
+  # A new process only computes the changed file; another indicator list is another key.
+  with open(file_paths[1], "a") as file:
+    file.write("1,0.5\n")
+  with IndicatorCache(cacheDir) as cache:
+    cache.indicatorRows(file_paths, names)
+    assert (cache.hits, cache.misses) == (2, 1), cache.stats()
+    cache.indicatorRows(file_paths[:1], ["mean"])
+    assert cache.misses == 2
+
+  # Bounded size: the least recently used rows go first.
+  with IndicatorCache(cacheDir, maxBytes=2 * 160) as cache:
+    cache.indicatorRows(file_paths, names)
+    print("featurecache", cache.stats())
+    assert cache.stats()["entries"] == 2 and cache.evictions > 0
+
+  # A process killed before closing its cache: the index was written with its rows, and
+  # rows missing from the index (killed between the two) are still evicted.
+  orphanDir = os.path.join(directory, "orphans")
+  cache = IndicatorCache(orphanDir)
+  cache.indicatorRows(file_paths, names)
+  del cache
+  with IndicatorCache(orphanDir) as cache:
+    assert cache.stats()["entries"] == 3
+  os.remove(os.path.join(orphanDir, "index.json"))
+  with IndicatorCache(orphanDir, maxBytes=160) as cache:
+    assert cache.stats()["entries"] == 1 and cache.evictions == 2
+  assert len(os.listdir(orphanDir)) == 2
@@ -0,0 +1,210 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import argparse
+import csv
+import fnmatch
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from artifact import loadPipeline
+from indicators import calculateIndicatorsBatch, indicatorColumns
+from reader import readSignal
+
+"""
+  Batch diagnosis of a fleet of machines.
+
+  A manifest lists capture directories; their files are cut into chunks that a
+  process pool diagnoses (load -> indicators -> classify). Workers load the pipeline
+  once and send back only result rows, never signals. Rows are written to one CSV
+  in manifest order while progress, throughput and per-stage time are reported.
+
+  Manifest: JSON list of ManifestEntry.
+
+  Interface ManifestEntry
+    machine: string  -  Machine name, copied to the output
+    directory: string  -  Capture directory (relative paths start at the manifest)
+    channel: string  -  Optional channel name, copied to the output. Defaults to ""
+    pattern: string  -  Optional file pattern. Defaults to "acc_*.csv"
+
+  Output columns: machine,channel,file,label,p_<label>...
+
+  Usage: python tp-reducer/fleet.py <manifest.json> <pipeline.npz> <output.csv> [--workers N] [--chunk-size N]
+"""
+
+STAGES = ("load", "indicators", "classify")
+
+_workerPipeline = None
+
+
+def readManifest(path: str) -> list:
+  """
+  Read a manifest and list its files.
+
+  Returns:
+    list: (machine, channel, file_path) tuples, sorted by file name within each entry.
+
+  Raises:
+    ValueError: If an entry misses "machine" or "directory".
+  """
+
+  with open(path) as file:
+    entries = json.load(file)
+
+  base = os.path.dirname(os.path.abspath(path))
+  tasks = []
+  for entry in entries:
+    if "machine" not in entry or "directory" not in entry: raise ValueError(f"Manifest entry {entry} needs 'machine' and 'directory'.")
+    directory = os.path.join(base, entry["directory"])
+    pattern = entry.get("pattern", "acc_*.csv")
+    names = sorted(name for name in os.listdir(directory) if fnmatch.fnmatch(name, pattern))
+    tasks += [(entry["machine"], entry.get("channel", ""), os.path.join(directory, name)) for name in names]
+  return tasks
+
+
+def _initWorker(pipelinePath: str):
+  global _workerPipeline
+  _workerPipeline = loadPipeline(pipelinePath)
+
+
+def diagnoseChunk(chunk: list, pipeline=None) -> tuple:
+  """
+  Diagnose a chunk of (machine, channel, file_path) tuples.
+
+  Returns:
+    list: One [machine, channel, file, label, probabilities] row per readable file.
+    dict: Seconds spent per stage, plus "bytes" read and "failed" files.
+  """
+
+  pipeline = pipeline or _workerPipeline
+  timing = dict.fromkeys(STAGES, 0.0)
+  timing["bytes"] = 0
+  timing["failed"] = 0
+
+  start = time.perf_counter()
+  signals, kept = [], []
+  for task in chunk:
+    try:
+      signal = readSignal(task[2])
+      timing["bytes"] += os.path.getsize(task[2])
+    except (OSError, ValueError):
+      timing["failed"] += 1
+      continue
+    # A truncated capture has no samples: it cannot join a length group.
+    if signal.shape[0] == 0:
+      timing["failed"] += 1
+      continue
+    signals.append(signal)
+    kept.append(task)
+  timing["load"] = time.perf_counter() - start
+
+  rows = [None] * len(kept)
+  columns = indicatorColumns(pipeline.indicatorNames)
+  # Signals of equal length share one indicator batch.
+  for length in sorted({signal.shape[0] for signal in signals}):
+    positions = [i for i, signal in enumerate(signals) if signal.shape[0] == length]
+
+    # A failing group only fails its own files, never the chunk or the fleet run.
+    try:
+      start = time.perf_counter()
+      indicatorRows = calculateIndicatorsBatch(np.stack([signals[i] for i in positions]))[:, columns]
+      timing["indicators"] += time.perf_counter() - start
+
+      start = time.perf_counter()
+      probabilities, labels = pipeline.classify(indicatorRows)
+      timing["classify"] += time.perf_counter() - start
+    except (ValueError, FloatingPointError):
+      timing["failed"] += len(positions)
+      continue
+
+    for position, probability, label in zip(positions, probabilities, labels):
+      machine, channel, file_path = kept[position]
+      rows[position] = [machine, channel, os.path.basename(file_path), pipeline.labels[label], probability.tolist()]
+  return [row for row in rows if row is not None], timing
+
+
+def diagnoseFleet(tasks: list, pipelinePath: str, outputPath: str, workers: int = None,
+                  chunkSize: int = 16, progress=None) -> dict:
+  """
+  Diagnose every task of a manifest and write the result table.
+
+  Args:
+    tasks (list): (machine, channel, file_path) tuples, see readManifest.
+    pipelinePath (str): Pipeline saved by savePipeline.
+    outputPath (str): CSV file to write.
+    workers (int): Process pool size. Defaults to os.cpu_count(); 1 runs in the calling process.
+    chunkSize (int): Files per work item.
+    progress: Optional callable(summary) called after every chunk.
+
+  Returns:
+    dict: Summary: files, failed, bytes, seconds, per-stage seconds (summed over workers).
+  """
+
+  if chunkSize <= 0: raise ValueError("chunkSize must be positive.")
+  workers = workers or os.cpu_count() or 1
+  chunks = [tasks[start:start + chunkSize] for start in range(0, len(tasks), chunkSize)]
+  pipeline = loadPipeline(pipelinePath)
+
+  summary = {"files": 0, "failed": 0, "bytes": 0, "seconds": 0.0, "total": len(tasks), **dict.fromkeys(STAGES, 0.0)}
+  started = time.perf_counter()
+  pool = None
+  if workers > 1:
+    pool = ProcessPoolExecutor(workers, initializer=_initWorker, initargs=(pipelinePath,))
+    results = pool.map(diagnoseChunk, chunks)
+  else:
+    results = (diagnoseChunk(chunk, pipeline) for chunk in chunks)
+
+  try:
+    with open(outputPath, "w", newline="") as output:
+      # Machine and channel names come from the manifest and may hold commas or quotes.
+      writer = csv.writer(output, lineterminator="\n")
+      writer.writerow(["machine", "channel", "file", "label"] + [f"p_{label}" for label in pipeline.labels])
+      for rows, timing in results:
+        writer.writerows(
+          [machine, channel, name, label] + [f"{value:.6g}" for value in probability]
+          for machine, channel, name, label, probability in rows
+        )
+        summary["files"] += len(rows)
+        for key in ("failed", "bytes", *STAGES):
+          summary[key] += timing[key]
+        summary["seconds"] = time.perf_counter() - started
+        if progress is not None:
+          progress(summary)
+  finally:
+    if pool is not None:
+      pool.shutdown()
+  return summary
+
+
+def printProgress(summary: dict, file=sys.stderr):
+  seconds = max(summary["seconds"], 1e-9)
+  print(
+    f"\r{summary['files'] + summary['failed']}/{summary['total']} files"
+    f"  {summary['files'] / seconds:.1f} files/s  {summary['bytes'] / seconds / 1e6:.1f} MB/s",
+    end="", file=file, flush=True,
+  )
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Diagnose the captures listed in a manifest.")
+  parser.add_argument("manifest")
+  parser.add_argument("pipeline")
+  parser.add_argument("output")
+  parser.add_argument("--workers", type=int, default=None)
+  parser.add_argument("--chunk-size", type=int, default=16)
+  arguments = parser.parse_args()
+
+  tasks = readManifest(arguments.manifest)
+  summary = diagnoseFleet(tasks, arguments.pipeline, arguments.output, arguments.workers, arguments.chunk_size, printProgress)
+  print(file=sys.stderr)
+
+  stageTotal = max(sum(summary[stage] for stage in STAGES), 1e-9)
+  print(f"{summary['files']} files diagnosed, {summary['failed']} failed, in {summary['seconds']:.2f} s -> {arguments.output}")
+  for stage in STAGES:
+    print(f"  {stage:<10} {summary[stage]:8.3f} s  {100 * summary[stage] / stageTotal:5.1f} %")
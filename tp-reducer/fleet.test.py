@@ -0,0 +1,73 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from artifact import PipelineArtifact, savePipeline
+from fleet import diagnoseChunk, diagnoseFleet, readManifest
+from reader import readSignal
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+rng = np.random.default_rng(0)
+pipeline = PipelineArtifact(
+  [(rng.random((3, 3)), rng.random(3)), (rng.random((3, 4)), rng.random(4))],
+  ["rms", "kurtosis", "peak"], ["a", "b", "c", "d"],
+)
+
+with tempfile.TemporaryDirectory() as directory:
+  manifestPath = os.path.join(directory, "manifest.json")
+  with open(manifestPath, "w") as file:
+    json.dump([
+      {"machine": "m1", "directory": os.path.join(data_dir, "1-roulement-sain-pignon-sain"), "pattern": "acc_0000*.csv"},
+      {"machine": "m2", "channel": "x", "directory": os.path.join(data_dir, "4-roulement-defaut-pignon-defaut"), "pattern": "acc_0001*.csv"},
+    ], file)
+  pipelinePath = os.path.join(directory, "pipeline.npz")
+  savePipeline(pipelinePath, pipeline)
+
+  tasks = readManifest(manifestPath)
+  assert len(tasks) == 19 and tasks[0][:2] == ("m1", "") and tasks[-1][:2] == ("m2", "x")
+
+  for workers in (1, 2):
+    outputPath = os.path.join(directory, f"diagnosis-{workers}.csv")
+    summary = diagnoseFleet(tasks, pipelinePath, outputPath, workers=workers, chunkSize=4)
+    assert summary["files"] == 19 and summary["failed"] == 0
+    with open(outputPath) as file:
+      lines = file.read().splitlines()
+    assert lines[0] == "machine,channel,file,label,p_a,p_b,p_c,p_d" and len(lines) == 20
+    print(f"workers={workers}: {summary['files']} files in {summary['seconds']:.2f} s")
+
+  with open(os.path.join(directory, "diagnosis-1.csv")) as first, open(os.path.join(directory, "diagnosis-2.csv")) as second:
+    assert first.read() == second.read()
+
+  probabilities, labels = pipeline.classifySignals(readSignal(tasks[-1][2]))
+  assert lines[-1].split(",")[3] == pipeline.labels[labels[0]]
+
+# An empty capture only fails itself, in the calling process and in the pool.
+with tempfile.TemporaryDirectory() as directory:
+  open(os.path.join(directory, "acc_00000.csv"), "w").close()
+  shutil.copy(tasks[0][2], os.path.join(directory, "acc_00001.csv"))
+  chunk = [("m", "", os.path.join(directory, name)) for name in ("acc_00000.csv", "acc_00001.csv")]
+  rows, timing = diagnoseChunk(chunk, pipeline)
+  assert timing["failed"] == 1 and [row[2] for row in rows] == ["acc_00001.csv"]
+
+  pipelinePath = os.path.join(directory, "pipeline.npz")
+  savePipeline(pipelinePath, pipeline)
+  summary = diagnoseFleet(chunk, pipelinePath, os.path.join(directory, "diagnosis.csv"), workers=2, chunkSize=2)
+  assert (summary["files"], summary["failed"]) == (1, 1), summary
+
+# Manifest names are quoted in the output when they hold commas or quotes.
+with tempfile.TemporaryDirectory() as directory:
+  pipelinePath = os.path.join(directory, "pipeline.npz")
+  savePipeline(pipelinePath, pipeline)
+  outputPath = os.path.join(directory, "diagnosis.csv")
+  diagnoseFleet([('press "A", line 2', "x,y", tasks[0][2])], pipelinePath, outputPath, workers=1)
+  with open(outputPath, newline="") as file:
+    rows = list(csv.reader(file))
+  assert len(rows) == 2 and rows[1][:3] == ['press "A", line 2', "x,y", os.path.basename(tasks[0][2])] and len(rows[1]) == len(rows[0])
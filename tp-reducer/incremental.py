@@ -0,0 +1,371 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from artifact import PipelineArtifact, loadPipeline, savePipeline
+from featurecache import IndicatorCache
+from network import trainNetwork2Layers
+from sbs import fisherSBSFromScatters
+from store import listSignalFiles
+
+"""
+  Incremental updates of a saved pipeline when newly labelled captures arrive.
+
+  A model state file, kept next to the pipeline, holds what a full rebuild would
+  otherwise recompute from every CSV: running per-class statistics of all the
+  candidate indicators, a replay buffer of indicator rows and the list of files
+  already learnt. An update then:
+    1. computes indicators of the new files only (through the indicator cache),
+    2. merges them into the class statistics (Chan's parallel formulas),
+    3. moves the normalisation to the statistics of all the rows seen, folding the
+       change into the first layer so the network output is unchanged,
+    4. warm-starts the network for a few epochs on the replay buffer plus the new rows,
+    5. reruns SBS on the updated scatters and flags drift when a different indicator
+       set separates the classes clearly better than the one in use.
+
+  State file (.npz, see saveModelState):
+    header: JSON, see Interface ModelStateHeader
+    counts: (n_classes,) rows per class
+    means, m2: (n_classes, n_indicators) class means and sums of squared deviations
+    replaySlots: (n_classes, replayPerClass, n_indicators) replay rows
+    replaySeen: (n_classes,) rows offered to the reservoir of each class
+
+  Interface ModelStateHeader
+    version: number  -  MODEL_STATE_VERSION
+    indicatorNames: list  -  Candidate indicators (INDICATOR_VECTOR_NAMES)
+    labels: list  -  Class names, in pipeline order
+    files: dict  -  {absolute file path: class index} of every file already learnt
+    replayPerClass: number  -  Reservoir size of each class
+    updates: number  -  Updates applied since the state was created
+
+  Interface UpdateReport
+    newFiles: list  -  New files per class
+    seconds: dict  -  indicators, statistics, training, total
+    selected: list  -  Indicators of the pipeline
+    bestSelection: list  -  SBS selection on the updated statistics
+    criterion: number  -  Fisher J of the pipeline's indicators
+    bestCriterion: number  -  Fisher J of bestSelection
+    drift: number  -  1 - criterion / bestCriterion
+    needsRebuild: boolean  -  drift above the tolerance: rerun reducer.py
+
+  Usage:
+    python tp-reducer/incremental.py init <pipeline.npz> <state.npz> [--data ./tp-reducer/data]
+    python tp-reducer/incremental.py update <pipeline.npz> <state.npz> [--data ./tp-reducer/data] [--epochs 20]
+"""
+
+MODEL_STATE_VERSION = 1
+
+
+class RunningClassStats:
+  """
+  Per-class count, mean and sum of squared deviations of every indicator,
+  updated batch by batch without keeping the rows.
+  """
+
+  def __init__(self, classCount: int, featureCount: int):
+    self.counts = np.zeros(classCount, dtype=np.int64)
+    self.means = np.zeros((classCount, featureCount))
+    self.m2 = np.zeros((classCount, featureCount))
+
+  def update(self, rows: np.ndarray, labels: np.ndarray):
+    rows = np.asarray(rows, dtype=np.float64)
+    for label in np.unique(labels):
+      batch = rows[labels == label]
+      count, mean = batch.shape[0], batch.mean(axis=0)
+      m2 = ((batch - mean) ** 2).sum(axis=0)
+
+      total = self.counts[label] + count
+      delta = mean - self.means[label]
+      self.m2[label] += m2 + delta * delta * self.counts[label] * count / total
+      self.means[label] += delta * count / total
+      self.counts[label] = total
+
+  def scatters(self) -> tuple:
+    """
+    within and between per-feature scatters of classScatters (sbs.py), over the learnt classes.
+    """
+    learnt = self.counts > 0
+    within = self.m2[learnt].sum(axis=0)
+    spread = self.means[learnt] - self.means[learnt].mean(axis=0)
+    return within, (spread * spread).sum(axis=0)
+
+  def pooled(self) -> tuple:
+    """
+    Mean and standard deviation of every indicator over all the rows seen.
+    """
+    total = self.counts.sum()
+    mean = (self.counts[:, None] * self.means).sum(axis=0) / total
+    deviation = self.means - mean
+    variance = (self.m2.sum(axis=0) + (self.counts[:, None] * deviation * deviation).sum(axis=0)) / total
+    return mean, np.sqrt(variance)
+
+
+class ReplayBuffer:
+  """
+  Uniform reservoir sample (algorithm R) of at most `perClass` indicator rows per class.
+  """
+
+  def __init__(self, classCount: int, featureCount: int, perClass: int, seed=0):
+    self.perClass = perClass
+    self.slots = np.zeros((classCount, perClass, featureCount))
+    self.seen = np.zeros(classCount, dtype=np.int64)
+    self.rng = np.random.default_rng(seed)
+
+  def add(self, rows: np.ndarray, labels: np.ndarray):
+    for row, label in zip(np.asarray(rows, dtype=np.float64), labels):
+      seen = self.seen[label]
+      position = seen if seen < self.perClass else self.rng.integers(0, seen + 1)
+      if position < self.perClass:
+        self.slots[label, position] = row
+      self.seen[label] += 1
+
+  def samples(self) -> tuple:
+    """
+    Returns:
+      np.ndarray: (n, n_indicators) kept rows, grouped by class.
+      np.ndarray: (n,) their class indices.
+    """
+    filled = np.minimum(self.seen, self.perClass)
+    rows = np.concatenate([self.slots[label, :count] for label, count in enumerate(filled)])
+    return rows, np.repeat(np.arange(filled.shape[0]), filled)
+
+
+class ModelState:
+  """
+  Args:
+    indicatorNames (list): Candidate indicators.
+    labels (list): Class names, in pipeline order.
+    replayPerClass (int): Replay rows kept per class.
+  """
+
+  def __init__(self, indicatorNames: list, labels: list, replayPerClass: int = 64, seed=0):
+    self.indicatorNames = list(indicatorNames)
+    self.labels = list(labels)
+    self.files = {}
+    self.updates = 0
+    self.stats = RunningClassStats(len(labels), len(indicatorNames))
+    self.replay = ReplayBuffer(len(labels), len(indicatorNames), replayPerClass, seed)
+
+  def add(self, rows: np.ndarray, labels: np.ndarray, filePaths: list):
+    labels = np.asarray(labels, dtype=np.int64)
+    self.stats.update(rows, labels)
+    self.replay.add(rows, labels)
+    self.files.update((os.path.abspath(path), int(label)) for path, label in zip(filePaths, labels))
+
+
+def saveModelState(path: str, state: ModelState):
+  header = {
+    "version": MODEL_STATE_VERSION,
+    "indicatorNames": state.indicatorNames,
+    "labels": state.labels,
+    "files": state.files,
+    "replayPerClass": state.replay.perClass,
+    "updates": state.updates,
+  }
+  with open(path, "wb") as file:
+    np.savez(
+      file, header=np.array(json.dumps(header)),
+      counts=state.stats.counts, means=state.stats.means, m2=state.stats.m2,
+      replaySlots=state.replay.slots, replaySeen=state.replay.seen,
+    )
+
+
+def loadModelState(path: str, seed=None) -> ModelState:
+  """
+  Raises:
+    ValueError: If the file was written by a newer version.
+  """
+
+  with np.load(path, allow_pickle=False) as data:
+    header = json.loads(str(data["header"]))
+    if header["version"] > MODEL_STATE_VERSION:
+      raise ValueError(f"{path} has version {header['version']}, this code reads up to {MODEL_STATE_VERSION}.")
+    # The reservoir continues with a seed derived from the update count: reruns are reproducible.
+    state = ModelState(header["indicatorNames"], header["labels"], header["replayPerClass"],
+                       header["updates"] if seed is None else seed)
+    state.files = header["files"]
+    state.updates = header["updates"]
+    state.stats.counts, state.stats.means, state.stats.m2 = data["counts"], data["means"], data["m2"]
+    state.replay.slots, state.replay.seen = data["replaySlots"], data["replaySeen"]
+  return state
+
+
+def classFiles(data_dir: str, labels: list) -> dict:
+  """
+  {class index: [acc_*.csv paths]} of the class directories <data_dir>/<label>.
+  """
+  return {
+    index: [os.path.abspath(os.path.join(data_dir, label, name)) for name in listSignalFiles(os.path.join(data_dir, label))]
+    for index, label in enumerate(labels) if os.path.isdir(os.path.join(data_dir, label))
+  }
+
+
+def newFiles(state: ModelState, filesByClass: dict) -> dict:
+  """
+  Files not learnt yet, per class. A file already learnt under another class raises.
+
+  Raises:
+    ValueError: If a learnt file changed class.
+  """
+
+  new = {}
+  for label, paths in filesByClass.items():
+    for path in paths:
+      known = state.files.get(os.path.abspath(path))
+      if known is None:
+        new.setdefault(label, []).append(path)
+      elif known != label:
+        raise ValueError(f"{path} was learnt as '{state.labels[known]}', now found under '{state.labels[label]}'.")
+  return new
+
+
+def _indicatorRows(filesByClass: dict, indicatorNames: list, indicatorCache: IndicatorCache) -> tuple:
+  paths = [path for label in sorted(filesByClass) for path in filesByClass[label]]
+  labels = np.concatenate([np.full(len(filesByClass[label]), label) for label in sorted(filesByClass)]) if paths else np.empty(0, dtype=np.int64)
+  rows = indicatorCache.indicatorRows(paths, indicatorNames) if paths else np.empty((0, len(indicatorNames)))
+  return rows, labels.astype(np.int64), paths
+
+
+def initModelState(pipeline: PipelineArtifact, filesByClass: dict, indicatorNames: list,
+                   indicatorCache: IndicatorCache, skip: int = 10, replayPerClass: int = 64, seed=0) -> ModelState:
+  """
+  State of a pipeline trained by reducer.py on the files of `filesByClass`.
+
+  Args:
+    skip (int): Leading warm-up captures of every class left out, as importIndicatorMatrix.
+      They are still recorded as learnt, so updates never pick them up.
+  """
+
+  state = ModelState(indicatorNames, pipeline.labels, replayPerClass, seed)
+  trained = {label: paths[skip:] for label, paths in filesByClass.items()}
+  rows, labels, paths = _indicatorRows(trained, indicatorNames, indicatorCache)
+  state.add(rows, labels, paths)
+  state.files.update((os.path.abspath(path), label) for label, paths in filesByClass.items() for path in paths[:skip])
+  return state
+
+
+def renormalize(pipeline: PipelineArtifact, mean: np.ndarray, scale: np.ndarray) -> PipelineArtifact:
+  """
+  Same network under a new input normalisation: the first layer absorbs the change,
+  so classify() gives the same result for every row.
+  """
+
+  (weightsL1, biasesL1), *rest = pipeline.layers
+  ratio = scale / pipeline.scale
+  weightsL1 = weightsL1 * ratio[:, None]
+  biasesL1 = biasesL1 + ((mean - pipeline.mean) / pipeline.scale) @ pipeline.layers[0][0]
+  return PipelineArtifact([(weightsL1, biasesL1), *rest], pipeline.indicatorNames, pipeline.labels, mean, scale,
+                          pipeline.hiddenActivation)
+
+
+def updateModel(pipeline: PipelineArtifact, state: ModelState, filesByClass: dict, indicatorCache: IndicatorCache,
+                epochs: int = 20, learningRate: float = 0.01, driftTolerance: float = 0.05, seed=0) -> tuple:
+  """
+  Learn newly labelled files, see the module description.
+
+  Args:
+    pipeline (PipelineArtifact): Pipeline to update (2 layers, tanh).
+    state (ModelState): Its state, updated in place.
+    filesByClass (dict): {class index: [file paths]} of the new files.
+    epochs (int): Warm-start epochs.
+    driftTolerance (float): Largest relative loss of Fisher J accepted before needsRebuild.
+
+  Returns:
+    PipelineArtifact: Updated pipeline (the input one when there is nothing new).
+    dict: UpdateReport.
+  """
+
+  started = time.perf_counter()
+  seconds = dict.fromkeys(("indicators", "statistics", "training"), 0.0)
+  report = {"newFiles": [len(filesByClass.get(label, [])) for label in range(len(state.labels))], "seconds": seconds}
+
+  rows, labels, paths = _indicatorRows(filesByClass, state.indicatorNames, indicatorCache)
+  seconds["indicators"] = time.perf_counter() - started
+
+  if paths:
+    start = time.perf_counter()
+    replayRows, replayLabels = state.replay.samples()
+    state.add(rows, labels, paths)
+    state.updates += 1
+    columns = [state.indicatorNames.index(name) for name in pipeline.indicatorNames]
+    mean, scale = state.stats.pooled()
+    scale[scale == 0] = 1.0
+    pipeline = renormalize(pipeline, mean[columns], scale[columns])
+    seconds["statistics"] = time.perf_counter() - start
+
+    # Old samples from the replay buffer as it was, so the new rows are never left out.
+    start = time.perf_counter()
+    inputs = pipeline.normalize(np.vstack([replayRows, rows])[:, columns])
+    targets = np.eye(len(state.labels))[np.concatenate([replayLabels, labels])]
+    weights, _history = trainNetwork2Layers(inputs, targets, epochs=epochs, learningRate=learningRate, batchSize=16,
+                                            optimizer="momentum", seed=seed, initialWeights=pipeline.weights)
+    pipeline = PipelineArtifact([weights[:2], weights[2:]], pipeline.indicatorNames, pipeline.labels, pipeline.mean, pipeline.scale)
+    seconds["training"] = time.perf_counter() - start
+
+  within, between = state.stats.scatters()
+  selected = [state.indicatorNames.index(name) for name in pipeline.indicatorNames]
+  best = fisherSBSFromScatters(within, between, len(selected))["selected"]
+  criterion = between[selected].sum() / within[selected].sum()
+  bestCriterion = between[best].sum() / within[best].sum()
+  drift = 1.0 - criterion / bestCriterion if bestCriterion > 0 else 0.0
+
+  report.update({
+    "selected": pipeline.indicatorNames,
+    "bestSelection": [state.indicatorNames[index] for index in best],
+    "criterion": float(criterion),
+    "bestCriterion": float(bestCriterion),
+    "drift": float(drift),
+    "needsRebuild": bool(drift > driftTolerance),
+  })
+  seconds["total"] = time.perf_counter() - started
+  return pipeline, report
+
+
+if __name__ == "__main__":
+  from reducer import INDICATOR_VECTOR_NAMES
+
+  parser = argparse.ArgumentParser(description="Incremental updates of a saved pipeline.")
+  parser.add_argument("command", choices=("init", "update"))
+  parser.add_argument("pipeline", help="Pipeline saved by reducer.py (savePipeline).")
+  parser.add_argument("state", help="Model state file.")
+  parser.add_argument("--data", default="./tp-reducer/data", help="Directory of the class directories.")
+  parser.add_argument("--cache", default="./tp-reducer/.indicator-cache")
+  parser.add_argument("--output", default=None, help="Updated pipeline. Defaults to overwriting the input.")
+  parser.add_argument("--epochs", type=int, default=20)
+  parser.add_argument("--learning-rate", type=float, default=0.01)
+  parser.add_argument("--replay-per-class", type=int, default=64)
+  parser.add_argument("--drift-tolerance", type=float, default=0.05)
+  parser.add_argument("--seed", type=int, default=0)
+  arguments = parser.parse_args()
+
+  pipeline = loadPipeline(arguments.pipeline)
+  with IndicatorCache(arguments.cache) as indicatorCache:
+    if arguments.command == "init":
+      state = initModelState(pipeline, classFiles(arguments.data, pipeline.labels), INDICATOR_VECTOR_NAMES,
+                             indicatorCache, replayPerClass=arguments.replay_per_class, seed=arguments.seed)
+      saveModelState(arguments.state, state)
+      print(f"{len(state.files)} files recorded, {state.stats.counts.tolist()} rows per class -> {arguments.state}")
+    else:
+      state = loadModelState(arguments.state)
+      new = newFiles(state, classFiles(arguments.data, state.labels))
+      pipeline, report = updateModel(pipeline, state, new, indicatorCache, arguments.epochs, arguments.learning_rate,
+                                     arguments.drift_tolerance, arguments.seed)
+      if sum(report["newFiles"]):
+        savePipeline(arguments.output or arguments.pipeline, pipeline)
+        saveModelState(arguments.state, state)
+
+      seconds = report["seconds"]
+      print(f"new files per class: {report['newFiles']}")
+      print(f"indicators {seconds['indicators']:.3f} s, statistics {seconds['statistics']:.3f} s, "
+            f"training {seconds['training']:.3f} s, total {seconds['total']:.3f} s")
+      print(f"selected {report['selected']} J={report['criterion']:.4g}; "
+            f"best {report['bestSelection']} J={report['bestCriterion']:.4g}; drift {report['drift']:.1%}")
+      if report["needsRebuild"]:
+        print("The selected indicators drifted: rerun reducer.py for a full rebuild.")
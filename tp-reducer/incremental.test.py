@@ -0,0 +1,98 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from artifact import PipelineArtifact
+from featurecache import IndicatorCache
+from incremental import (
+  RunningClassStats, classFiles, initModelState, loadModelState, newFiles, renormalize, saveModelState, updateModel,
+)
+from network import trainNetwork2Layers
+from reducer import INDICATOR_VECTOR_NAMES, REDUCER_CLASS_LABELS
+from sbs import classScatters, fisherSBSFromScatters
+
+source_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+rng = np.random.default_rng(0)
+
+# Running statistics match a recomputation on all the rows.
+classMatrices = [rng.normal(label, 1.0 + label, (20 + label, 4)) for label in range(3)]
+stats = RunningClassStats(3, 4)
+for start in (0, 8, 16):
+  rows = np.concatenate([matrix[start:start + 8] for matrix in classMatrices])
+  stats.update(rows, np.concatenate([np.full(matrix[start:start + 8].shape[0], label) for label, matrix in enumerate(classMatrices)]))
+within, between, _ = classScatters(classMatrices)
+assert np.allclose(stats.scatters()[0], within) and np.allclose(stats.scatters()[1], between)
+allRows = np.concatenate(classMatrices)
+assert np.allclose(stats.pooled()[0], allRows.mean(axis=0)) and np.allclose(stats.pooled()[1], allRows.std(axis=0))
+
+with tempfile.TemporaryDirectory() as directory:
+  data_dir = os.path.join(directory, "data")
+
+  def copyCaptures(first: int, last: int):
+    for label in REDUCER_CLASS_LABELS:
+      os.makedirs(os.path.join(data_dir, label), exist_ok=True)
+      for number in range(first, last + 1):
+        shutil.copy(os.path.join(source_dir, label, f"acc_{number:05d}.csv"), os.path.join(data_dir, label))
+
+  copyCaptures(1, 10)
+  with IndicatorCache(os.path.join(directory, "cache")) as cache:
+    # The pipeline reducer.py would have built on these files (without the 2 warm-up captures).
+    state = initModelState(PipelineArtifact([(np.eye(1), np.zeros(1))], ["rms"], REDUCER_CLASS_LABELS),
+                           classFiles(data_dir, REDUCER_CLASS_LABELS), INDICATOR_VECTOR_NAMES, cache, skip=2)
+    assert state.stats.counts.tolist() == [8, 8, 8, 8] and len(state.files) == 40
+    selected = fisherSBSFromScatters(*state.stats.scatters(), 3)["selected"]
+    rows, labels = state.replay.samples()
+    mean, scale = state.stats.pooled()
+    weights, _ = trainNetwork2Layers((rows[:, selected] - mean[selected]) / scale[selected], np.eye(4)[labels],
+                                     epochs=300, batchSize=16, optimizer="momentum", seed=0)
+    pipeline = PipelineArtifact([weights[:2], weights[2:]], [INDICATOR_VECTOR_NAMES[i] for i in selected],
+                                REDUCER_CLASS_LABELS, mean[selected], scale[selected])
+
+    # A new normalisation is folded into the first layer.
+    moved = renormalize(pipeline, pipeline.mean + 1.0, pipeline.scale * 2.0)
+    assert np.allclose(moved.classify(rows[:, selected])[0], pipeline.classify(rows[:, selected])[0])
+
+    # Only the new captures are computed.
+    copyCaptures(11, 15)
+    new = newFiles(state, classFiles(data_dir, REDUCER_CLASS_LABELS))
+    assert sorted(new) == [0, 1, 2, 3] and all(len(paths) == 5 for paths in new.values())
+    misses = cache.misses
+    updated, report = updateModel(pipeline, state, new, cache, epochs=10)
+    assert cache.misses - misses == 20
+    assert report["newFiles"] == [5, 5, 5, 5] and state.stats.counts.tolist() == [13, 13, 13, 13]
+    assert report["selected"] == pipeline.indicatorNames and 0.0 <= report["drift"] < 1.0
+    assert not updated.weights[0] is pipeline.weights[0]
+    assert newFiles(state, classFiles(data_dir, REDUCER_CLASS_LABELS)) == {}
+
+    # Same statistics as a rebuild from all the files.
+    rebuilt = initModelState(pipeline, classFiles(data_dir, REDUCER_CLASS_LABELS), INDICATOR_VECTOR_NAMES, cache, skip=2)
+    assert np.allclose(rebuilt.stats.means, state.stats.means) and np.allclose(rebuilt.stats.m2, state.stats.m2)
+
+    statePath = os.path.join(directory, "state.npz")
+    saveModelState(statePath, state)
+    loaded = loadModelState(statePath)
+    assert loaded.files == state.files and np.array_equal(loaded.stats.m2, state.stats.m2)
+    assert np.array_equal(loaded.replay.samples()[0], state.replay.samples()[0])
+
+    # A pipeline on poorly separating indicators asks for a rebuild.
+    worst = [name for name in INDICATOR_VECTOR_NAMES if name not in report["bestSelection"]][-3:]
+    columns = [INDICATOR_VECTOR_NAMES.index(name) for name in worst]
+    weak = PipelineArtifact(updated.layers, worst, REDUCER_CLASS_LABELS, mean[columns], scale[columns])
+    _, weakReport = updateModel(weak, state, {}, cache)
+    assert weakReport["needsRebuild"] and weakReport["drift"] > 0.05, weakReport
+
+    # A learnt file found under another class is an error.
+    try:
+      newFiles(state, {1: [os.path.join(data_dir, REDUCER_CLASS_LABELS[0], "acc_00011.csv")]})
+      raise AssertionError("expected ValueError")
+    except ValueError:
+      pass
+
+  print(f"update of 20 files: {report['seconds']['total'] * 1e3:.1f} ms, drift {report['drift']:.1%}")
+print("incremental tests passed")
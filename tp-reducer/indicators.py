@@ -0,0 +1,105 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from metrics import instrument
+from sharedmatrix import asMatrix
+
+"""
+  Batched version of calculateIndicators (reducer.py).
+  Works on a whole (n_signals, n_samples) matrix at once and returns
+  a (n_signals, n_indicators) array whose columns follow INDICATOR_NAMES.
+"""
+
+# Bump when the indicator formulas change: cached indicator rows are keyed on it.
+INDICATOR_CODE_VERSION = 1
+
+INDICATOR_NAMES = (
+  "mean",
+  "std_dev",
+  "variance",
+  "rms",
+  "peak",
+  "energy",
+  "power",
+  "skewness",
+  "kurtosis",
+  "crest_factor",
+  "k_factor",
+)
+
+# Rows processed together: keeps the two temporaries of a block in cache.
+BLOCK_ROWS = 32
+
+
+def indicatorColumns(names) -> list:
+  """
+  Column indices of the given indicator names in the batch output.
+  """
+  return [INDICATOR_NAMES.index(name) for name in names]
+
+
+def _calculateIndicatorsBlock(block: np.ndarray, out: np.ndarray):
+  length = block.shape[1]
+
+  mean = block.mean(axis=1)
+  energy = np.einsum('ij,ij->i', block, block)
+  peak = np.maximum(block.max(axis=1), -block.min(axis=1))
+
+  # Central moments from the centered block, reusing two temporaries.
+  centered = block - mean[:, None]
+  squared = centered * centered
+  m2 = squared.sum(axis=1) / length
+  m3 = np.einsum('ij,ij->i', squared, centered) / length
+  m4 = np.einsum('ij,ij->i', squared, squared) / length
+
+  std_dev = np.sqrt(m2)
+  power = energy / length
+  rms = np.sqrt(power)
+
+  out[:, 0] = mean
+  out[:, 1] = std_dev
+  out[:, 2] = m2
+  out[:, 3] = rms
+  out[:, 4] = peak
+  out[:, 5] = energy
+  out[:, 6] = power
+  with np.errstate(divide='ignore', invalid='ignore'):
+    out[:, 7] = m3 / (m2 * std_dev)
+    out[:, 8] = m4 / (m2 * m2) - 3
+    out[:, 9] = peak / rms
+  out[:, 10] = peak * rms
+
+
+@instrument(counters=lambda result, signalMatrix, out=None, *args, **kwargs: {"items": result.shape[0], "arrays": int(out is None)})
+def calculateIndicatorsBatch(signalMatrix, out: np.ndarray = None) -> np.ndarray:
+  """
+  Calculate the indicators of every signal of a matrix.
+
+  Args:
+    signalMatrix (np.ndarray | SharedMatrixHandle): (n_signals, n_samples) matrix, one signal per row,
+      or a handle to one (see sharedmatrix.py). A single 1-D signal is accepted and treated as one row.
+    out (np.ndarray): Optional (n_signals, n_indicators) float64 array to write into.
+
+  Returns:
+    np.ndarray: (n_signals, len(INDICATOR_NAMES)) array, columns in INDICATOR_NAMES order.
+  """
+
+  signalMatrix = np.asarray(asMatrix(signalMatrix), dtype=np.float64)
+  if signalMatrix.ndim == 1:
+    signalMatrix = signalMatrix[None, :]
+  if signalMatrix.ndim != 2: raise ValueError(f"Expected a (n_signals, n_samples) matrix, got shape {signalMatrix.shape}.")
+  if signalMatrix.shape[0] > 0 and signalMatrix.shape[1] == 0: raise ValueError("Signals must contain at least one sample.")
+
+  n_signals = signalMatrix.shape[0]
+  if out is None:
+    out = np.empty((n_signals, len(INDICATOR_NAMES)), dtype=np.float64)
+  elif out.shape != (n_signals, len(INDICATOR_NAMES)):
+    raise ValueError(f"out must have shape {(n_signals, len(INDICATOR_NAMES))}, got {out.shape}.")
+
+  for start in range(0, n_signals, BLOCK_ROWS):
+    stop = min(start + BLOCK_ROWS, n_signals)
+    _calculateIndicatorsBlock(signalMatrix[start:stop], out[start:stop])
+  return out
@@ -0,0 +1,31 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from indicators import INDICATOR_NAMES, calculateIndicatorsBatch
+from reducer import calculateIndicators, importSignalList
+
+signalMatrix = importSignalList(os.path.join(os.path.dirname(__file__), "data", "2-roulement-defaut-pignon-sain"))
+
+start = time.perf_counter()
+expected = np.array([list(calculateIndicators(signal).values()) for signal in signalMatrix])
+perSignal = time.perf_counter() - start
+
+start = time.perf_counter()
+indicatorBatch = calculateIndicatorsBatch(signalMatrix)
+batch = time.perf_counter() - start
+
+assert list(calculateIndicators(signalMatrix[0])) == list(INDICATOR_NAMES)
+assert indicatorBatch.shape == (len(signalMatrix), len(INDICATOR_NAMES))
+assert np.allclose(indicatorBatch, expected, rtol=1e-10, atol=0)
+print(f"calculateIndicators {perSignal * 1e3:.1f} ms, calculateIndicatorsBatch {batch * 1e3:.1f} ms")
+
+# Offset signals (tp-equilibrator-fresnel style) keep skewness/kurtosis exact.
+offsetSignals = np.random.default_rng(0).normal(31.0, 0.2, size=(5, 25600))
+expected = np.array([list(calculateIndicators(signal).values()) for signal in offsetSignals])
+assert np.allclose(calculateIndicatorsBatch(offsetSignals), expected, rtol=1e-9, atol=0)
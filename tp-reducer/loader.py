@@ -0,0 +1,148 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from reader import readSignal, readSignalFile
+from store import listSignalFiles
+
+"""
+  This module loads whole class directories of acc_*.csv files.
+  Files are parsed concurrently and written into one preallocated
+  (n_files, n_samples) matrix per class directory.
+
+  Interface SignalMatrix: np.ndarray  -  shape (n_files, n_samples)
+"""
+
+
+def listSignalFilePaths(dir_path: str) -> list:
+  """
+  List the acc_*.csv files of a directory as full paths, sorted by name.
+  """
+  return [os.path.join(dir_path, name) for name in listSignalFiles(dir_path)]
+
+
+def _createExecutor(workers: int, executor: str):
+  if executor == "thread":
+    return ThreadPoolExecutor(max_workers=workers)
+  if executor == "process":
+    return ProcessPoolExecutor(max_workers=workers)
+  raise ValueError(f"Unknown executor '{executor}', expected 'thread' or 'process'.")
+
+
+def _fillSignalMatrix(file_paths: list, pool, workers: int, dtype) -> np.ndarray:
+  if not file_paths:
+    return np.empty((0, 0), dtype=dtype)
+
+  # The first file gives the row length of the whole matrix.
+  first = readSignal(file_paths[0])
+  matrix = np.empty((len(file_paths), first.shape[0]), dtype=dtype)
+  matrix[0] = first
+
+  rest = file_paths[1:]
+  if pool is None:
+    signals = map(readSignal, rest)
+  else:
+    # Chunks amortise the inter-process round trips; thread pools ignore it.
+    signals = pool.map(readSignal, rest, chunksize=max(1, len(rest) // (4 * workers)))
+
+  for i, signal in enumerate(signals, start=1):
+    if signal.shape[0] != matrix.shape[1]:
+      raise ValueError(
+        f"{file_paths[i]} has {signal.shape[0]} samples, "
+        f"expected {matrix.shape[1]} like {file_paths[0]}."
+      )
+    matrix[i] = signal
+  return matrix
+
+
+def iterSignalFiles(file_paths: list, workers: int = None, executor: str = "process", dtype=np.float64):
+  """
+  Parse acc_*.csv files concurrently. Unlike the matrix loaders, files may have
+  different lengths (the store packs them back to back).
+
+  Args:
+    file_paths (list): Paths of the CSV files.
+    workers (int): Number of workers. Defaults to os.cpu_count(); 1 parses in the calling thread.
+    executor (str): "process" (default) or "thread".
+    dtype: Type of the signals.
+
+  Yields:
+    tuple: (signal, constant) of every file, in the order of file_paths, see readSignalFile.
+  """
+
+  workers = min(workers or os.cpu_count() or 1, max(1, len(file_paths)))
+  if workers == 1:
+    for file_path in file_paths:
+      yield readSignalFile(file_path, dtype)
+    return
+  with _createExecutor(workers, executor) as pool:
+    yield from pool.map(readSignalFile, file_paths, itertools.repeat(dtype), chunksize=max(1, len(file_paths) // (4 * workers)))
+
+
+def loadSignalMatrices(dir_paths: list, workers: int = None, executor: str = "process", dtype=np.float64) -> list:
+  """
+  Load several class directories, sharing one worker pool.
+
+  Args:
+    dir_paths (list): Class directories, each containing acc_*.csv files.
+    workers (int): Number of workers. Defaults to os.cpu_count(); 1 parses in the calling thread.
+    executor (str): "process" (default) or "thread".
+    dtype: Type of the returned matrices.
+
+  Returns:
+    list: One (n_files, n_samples) matrix per directory, in the same order.
+
+  Raises:
+    ValueError: If the files of one directory do not all have the same number of samples.
+  """
+
+  workers = workers or os.cpu_count() or 1
+  file_lists = [listSignalFilePaths(dir_path) for dir_path in dir_paths]
+
+  if workers == 1:
+    return [_fillSignalMatrix(file_paths, None, workers, dtype) for file_paths in file_lists]
+  with _createExecutor(workers, executor) as pool:
+    return [_fillSignalMatrix(file_paths, pool, workers, dtype) for file_paths in file_lists]
+
+
+def loadSignalMatrix(dir_path: str, workers: int = None, executor: str = "process", dtype=np.float64) -> np.ndarray:
+  """
+  Load one class directory into a (n_files, n_samples) matrix.
+  See loadSignalMatrices for the arguments.
+  """
+  return loadSignalMatrices([dir_path], workers, executor, dtype)[0]
+
+
+def iterSignalBatches(dir_paths, batchSize: int, workers: int = None, executor: str = "process", dtype=np.float64):
+  """
+  Stream the signals of one or several directories as fixed-size batches.
+  At most one batch is held in memory, whatever the number of files.
+
+  Args:
+    dir_paths (str | list): One class directory or a list of them.
+    batchSize (int): Number of files per batch. The last batch of a directory may be smaller.
+
+  Yields:
+    tuple: (dir_path, file_paths, batch) with batch of shape (len(file_paths), n_samples).
+  """
+
+  if batchSize <= 0: raise ValueError("batchSize must be positive.")
+  if isinstance(dir_paths, str): dir_paths = [dir_paths]
+
+  workers = workers or os.cpu_count() or 1
+  pool = None if workers == 1 else _createExecutor(workers, executor)
+  try:
+    for dir_path in dir_paths:
+      file_paths = listSignalFilePaths(dir_path)
+      for start in range(0, len(file_paths), batchSize):
+        batch_paths = file_paths[start:start + batchSize]
+        yield dir_path, batch_paths, _fillSignalMatrix(batch_paths, pool, workers, dtype)
+  finally:
+    if pool is not None:
+      pool.shutdown()
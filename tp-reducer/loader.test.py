@@ -0,0 +1,24 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+
+import numpy as np
+
+from loader import iterSignalBatches, loadSignalMatrices
+
+dir_paths = [
+  os.path.join(os.path.dirname(__file__), "data", "1-roulement-sain-pignon-sain"),
+  os.path.join(os.path.dirname(__file__), "..", "data", "tp-equilibrator-fresnel", "2-sain"),
+]
+
+matrices = loadSignalMatrices(dir_paths, workers=2, executor="thread")
+print("matrices", [matrix.shape for matrix in matrices])
+
+expected = np.genfromtxt(os.path.join(dir_paths[0], "acc_00005.csv"), delimiter=',', usecols=1)
+assert np.array_equal(matrices[0][4], expected)
+
+batches = list(iterSignalBatches(dir_paths[0], 32, workers=1))
+print("batches", [batch.shape for _, _, batch in batches])
+assert np.array_equal(np.concatenate([batch for _, _, batch in batches]), matrices[0])
@@ -0,0 +1,265 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import collections
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+"""
+  Per-stage instrumentation of the diagnosis pipeline.
+
+  Stages are recorded with the `stage` context manager or the `instrument` decorator.
+  Recording is off by default (or on with MPP_METRICS=1): a disabled stage costs one
+  flag check, and counter functions are not even called.
+
+  Every recorded stage keeps wall time, CPU time of its thread and counters, and is
+  summed into per-stage totals. The recent spans can be exported as a Chrome trace
+  (chrome://tracing, Perfetto) and the totals as a Prometheus text snapshot, served
+  over HTTP by startMetricsServer.
+
+  Interface Counters
+    items: number  -  Signals, files or rows handled
+    bytes: number  -  Bytes read
+    arrays: number  -  Arrays allocated
+
+  Interface StageTotals
+    calls: number
+    wallSeconds: number
+    cpuSeconds: number
+    items, bytes, arrays: number  -  Summed Counters
+"""
+
+COUNTERS = ("items", "bytes", "arrays")
+
+# Spans kept for the Chrome trace; totals are kept for every stage regardless.
+MAX_SPANS = 100_000
+
+
+class _MetricsState:
+  def __init__(self):
+    self.enabled = os.environ.get("MPP_METRICS", "") not in ("", "0")
+    self.lock = threading.Lock()
+    self.spans = collections.deque(maxlen=MAX_SPANS)
+    self.totals = {}
+    self.origin = time.perf_counter_ns()
+
+
+_state = _MetricsState()
+
+
+def enableMetrics(enabled: bool = True):
+  _state.enabled = enabled
+
+
+def metricsEnabled() -> bool:
+  return _state.enabled
+
+
+def resetMetrics():
+  with _state.lock:
+    _state.spans.clear()
+    _state.totals.clear()
+    _state.origin = time.perf_counter_ns()
+
+
+class Span:
+  """
+  One recorded stage. add() accumulates Counters while it is open.
+  """
+
+  __slots__ = ("name", "counters", "_start", "_cpuStart")
+
+  def __init__(self, name: str, counters: dict):
+    self.name = name
+    self.counters = dict.fromkeys(COUNTERS, 0)
+    self.counters.update(counters)
+
+  def add(self, **counters):
+    for key, value in counters.items():
+      self.counters[key] = self.counters.get(key, 0) + value
+
+  def __enter__(self):
+    self._cpuStart = time.thread_time_ns()
+    self._start = time.perf_counter_ns()
+    return self
+
+  def __exit__(self, *exc_info):
+    end = time.perf_counter_ns()
+    cpu = time.thread_time_ns() - self._cpuStart
+    _record(self.name, self._start, end - self._start, cpu, self.counters)
+
+
+class _DisabledSpan:
+  __slots__ = ()
+
+  def add(self, **counters):
+    pass
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    pass
+
+
+_DISABLED_SPAN = _DisabledSpan()
+
+
+def _record(name: str, start: int, wall: int, cpu: int, counters: dict):
+  span = (name, start, wall, cpu, os.getpid(), threading.get_ident(), counters)
+  with _state.lock:
+    _state.spans.append(span)
+    totals = _state.totals.get(name)
+    if totals is None:
+      totals = _state.totals[name] = {"calls": 0, "wallSeconds": 0.0, "cpuSeconds": 0.0, **dict.fromkeys(COUNTERS, 0)}
+    totals["calls"] += 1
+    totals["wallSeconds"] += wall / 1e9
+    totals["cpuSeconds"] += cpu / 1e9
+    for key, value in counters.items():
+      totals[key] = totals.get(key, 0) + value
+
+
+def stage(name: str, **counters):
+  """
+  Context manager recording one stage:
+
+    with stage("load", items=len(paths)) as span:
+      ...
+      span.add(bytes=size)
+  """
+  if not _state.enabled:
+    return _DISABLED_SPAN
+  return Span(name, counters)
+
+
+def instrument(name: str = None, counters=None):
+  """
+  Decorator recording every call of a function as a stage.
+
+  Args:
+    name (str): Stage name. Defaults to the function name.
+    counters: Optional callable(result, *args, **kwargs) -> Counters, called only when enabled.
+      Arguments passed by keyword are handed to it positionally when the function allows
+      it. A failing counter is dropped: it never changes what the function returns.
+  """
+
+  def decorate(function):
+    stageName = name or function.__name__
+    signature = inspect.signature(function)
+
+    def count(span: Span, result, args: tuple, kwargs: dict):
+      try:
+        bound = signature.bind(*args, **kwargs)
+        span.add(**counters(result, *bound.args, **bound.kwargs))
+      except Exception:
+        pass
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+      if not _state.enabled:
+        return function(*args, **kwargs)
+      with Span(stageName, {}) as span:
+        result = function(*args, **kwargs)
+        if counters is not None:
+          count(span, result, args, kwargs)
+      return result
+
+    return wrapper
+
+  return decorate
+
+
+def stageTotals() -> dict:
+  """
+  {stage: StageTotals} since the last resetMetrics.
+  """
+  with _state.lock:
+    return {name: dict(totals) for name, totals in _state.totals.items()}
+
+
+def chromeTrace() -> dict:
+  """
+  Recorded spans in the Chrome trace event format (complete "X" events, times in µs).
+  """
+
+  with _state.lock:
+    spans = list(_state.spans)
+    origin = _state.origin
+  return {
+    "traceEvents": [
+      {
+        "name": name,
+        "cat": "mpp",
+        "ph": "X",
+        "ts": (start - origin) / 1e3,
+        "dur": wall / 1e3,
+        "pid": pid,
+        "tid": tid,
+        "args": {"cpuMs": cpu / 1e6, **counters},
+      }
+      for name, start, wall, cpu, pid, tid, counters in spans
+    ],
+    "displayTimeUnit": "ms",
+  }
+
+
+def writeChromeTrace(path: str):
+  with open(path, "w") as file:
+    json.dump(chromeTrace(), file)
+
+
+def prometheusSnapshot(prefix: str = "mpp_stage") -> str:
+  """
+  Stage totals in the Prometheus text exposition format.
+  """
+
+  metrics = [
+    ("calls", "calls_total", "Recorded calls of the stage."),
+    ("wallSeconds", "wall_seconds_total", "Wall time spent in the stage."),
+    ("cpuSeconds", "cpu_seconds_total", "CPU time of the recording thread spent in the stage."),
+    ("items", "items_total", "Items (signals, files, rows) handled by the stage."),
+    ("bytes", "bytes_total", "Bytes read by the stage."),
+    ("arrays", "arrays_total", "Arrays allocated by the stage."),
+  ]
+  totals = stageTotals()
+  lines = []
+  for key, suffix, description in metrics:
+    lines.append(f"# HELP {prefix}_{suffix} {description}")
+    lines.append(f"# TYPE {prefix}_{suffix} counter")
+    for name in sorted(totals):
+      lines.append(f'{prefix}_{suffix}{{stage="{name}"}} {totals[name].get(key, 0):.9g}')
+  return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+  def do_GET(self):
+    if self.path.startswith("/trace"):
+      body, contentType = json.dumps(chromeTrace()).encode(), "application/json"
+    else:
+      body, contentType = prometheusSnapshot().encode(), "text/plain; version=0.0.4"
+    self.send_response(200)
+    self.send_header("Content-Type", contentType)
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, format, *args):
+    pass
+
+
+def startMetricsServer(host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+  """
+  Enable recording and serve it on a daemon thread: /metrics (Prometheus text) and
+  /trace (Chrome trace JSON). Stop with server.shutdown().
+  """
+
+  enableMetrics(True)
+  server = ThreadingHTTPServer((host, port), _MetricsHandler)
+  threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+  return server
@@ -0,0 +1,81 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import time
+import urllib.request
+
+import numpy as np
+
+from indicators import calculateIndicatorsBatch
+from metrics import chromeTrace, enableMetrics, instrument, prometheusSnapshot, resetMetrics, stage, stageTotals, startMetricsServer
+from reader import readSignal
+
+file_path = os.path.join(os.path.dirname(__file__), "data", "1-roulement-sain-pignon-sain", "acc_00001.csv")
+
+calls = []
+
+
+@instrument(counters=lambda result, values: calls.append(1) or {"items": len(values)})
+def total(values):
+  return sum(values)
+
+
+# Disabled: nothing is recorded and counter functions are not called.
+enableMetrics(False)
+resetMetrics()
+assert total([1, 2, 3]) == 6
+with stage("disabled", items=3) as span:
+  span.add(bytes=10)
+assert stageTotals() == {} and calls == []
+
+start = time.perf_counter()
+for _ in range(100_000):
+  total(())
+print(f"disabled overhead {(time.perf_counter() - start) / 100_000 * 1e9:.0f} ns per call (including the call)")
+
+enableMetrics(True)
+signal = readSignal(file_path)
+calculateIndicatorsBatch(np.stack([signal, signal]))
+with stage("outer", items=2) as span:
+  total([1, 2])
+  span.add(bytes=64, arrays=1)
+
+totals = stageTotals()
+assert totals["readSignalFile"]["bytes"] == os.path.getsize(file_path)
+assert totals["calculateIndicatorsBatch"]["items"] == 2 and totals["calculateIndicatorsBatch"]["arrays"] == 1
+assert totals["outer"] == {**totals["outer"], "calls": 1, "items": 2, "bytes": 64, "arrays": 1}
+assert totals["total"]["items"] == 2 and totals["outer"]["wallSeconds"] >= totals["total"]["wallSeconds"]
+
+events = chromeTrace()["traceEvents"]
+assert [event["name"] for event in events] == ["readSignalFile", "calculateIndicatorsBatch", "total", "outer"]
+assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+
+snapshot = prometheusSnapshot()
+assert '# TYPE mpp_stage_calls_total counter' in snapshot
+assert 'mpp_stage_items_total{stage="calculateIndicatorsBatch"} 2' in snapshot
+
+server = startMetricsServer(port=0)
+with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+  assert response.read().decode() == prometheusSnapshot()
+server.shutdown()
+
+# Keyword arguments reach the counters positionally, and a failing counter never breaks the call.
+@instrument(counters=lambda result, values, scale: {"items": len(values) * scale})
+def scaled(values, scale=1):
+  return [value * scale for value in values]
+
+
+@instrument(counters=lambda result, values: {"items": 1 / 0})
+def broken(values):
+  return len(values)
+
+
+resetMetrics()
+assert scaled(values=[1, 2], scale=3) == [3, 6]
+assert broken([1, 2]) == 2
+totals = stageTotals()
+assert totals["scaled"]["items"] == 6 and totals["broken"]["calls"] == 1 and totals["broken"]["items"] == 0
+enableMetrics(False)
+print(snapshot.splitlines()[2:6])
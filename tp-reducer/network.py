@@ -0,0 +1,262 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from metrics import instrument
+
+"""
+  Vectorized engine behind neuralNetwork2LayersTraining (reducer.py).
+  Same network: tanh hidden layer, tanh output layer, squared error.
+  Forward and backward passes run on whole mini-batches as matrix products.
+
+  Interface Weights: [weightsL1, biasesL1, weightsL2, biasesL2]
+    weightsL1: (n_inputs, n_hidden)
+    biasesL1: (n_hidden,)
+    weightsL2: (n_hidden, n_outputs)
+    biasesL2: (n_outputs,)
+
+  Interface TrainingHistory
+    loss: list  -  Mean squared error on the training set, per epoch
+    validationLoss: list  -  Same on the validation split (empty without validation)
+    epochs: number  -  Epochs actually run
+    bestEpoch: number  -  Epoch of the returned weights
+"""
+
+OPTIMIZERS = ("sgd", "momentum", "adam")
+
+
+def initializeWeights(inputSize: int, hiddenSize: int, outputSize: int, rng) -> list:
+  """
+  Uniform [0, 1) initialisation, as the original np.random.rand one.
+  """
+  return [
+    rng.random((inputSize, hiddenSize)),
+    rng.random(hiddenSize),
+    rng.random((hiddenSize, outputSize)),
+    rng.random(outputSize),
+  ]
+
+
+def forwardNetwork2Layers(weights: list, inputs: np.ndarray) -> np.ndarray:
+  weightsL1, biasesL1, weightsL2, biasesL2 = weights
+  return np.tanh(np.tanh(inputs @ weightsL1 + biasesL1) @ weightsL2 + biasesL2)
+
+
+def _meanSquaredError(weights: list, inputs: np.ndarray, outputs: np.ndarray) -> float:
+  error = outputs - forwardNetwork2Layers(weights, inputs)
+  return float(np.mean(error * error))
+
+
+# Items are sample-epochs.
+@instrument(counters=lambda result, inputs, *args, **kwargs: {"items": len(inputs) * result[1]["epochs"]})
+def trainNetwork2Layers(inputs, desiredOutputs, hiddenSize: int = None, epochs: int = 1000,
+                        learningRate: float = 0.01, batchSize: int = 32, shuffle: bool = True,
+                        optimizer: str = "sgd", momentum: float = 0.9, beta2: float = 0.999,
+                        validationSplit: float = 0.0, patience: int = None, seed=None,
+                        initialWeights: list = None):
+  """
+  Train the 2-layer network with mini-batch gradient descent.
+
+  Args:
+    inputs: (n_samples, n_inputs) observations.
+    desiredOutputs: (n_samples, n_outputs) targets.
+    hiddenSize (int): Hidden layer width. Defaults to n_inputs, as the original network.
+    epochs (int): Maximum number of passes over the training set.
+    learningRate (float): Step size.
+    batchSize (int): Samples per update. 1 reproduces the original per-sample updates.
+    shuffle (bool): Reshuffle the training set every epoch.
+    optimizer (str): "sgd", "momentum" or "adam".
+    momentum (float): Momentum, or Adam's beta1.
+    beta2 (float): Adam's second moment decay.
+    validationSplit (float): Share of the (shuffled) samples held out for early stopping.
+    patience (int): Stop after this many epochs without validation improvement, then
+      return the best weights. None disables early stopping.
+    seed: Seed of the initialisation, split and shuffling.
+    initialWeights (list): Weights to start from instead of a random initialisation (copied).
+
+  Returns:
+    list: Weights.
+    dict: TrainingHistory.
+  """
+
+  if optimizer not in OPTIMIZERS: raise ValueError(f"Unknown optimizer '{optimizer}', expected one of {OPTIMIZERS}.")
+  if batchSize <= 0: raise ValueError("batchSize must be positive.")
+  if not 0.0 <= validationSplit < 1.0: raise ValueError("validationSplit must be in [0, 1).")
+
+  rng = np.random.default_rng(seed)
+  inputs = np.ascontiguousarray(inputs, dtype=np.float64)
+  desiredOutputs = np.ascontiguousarray(desiredOutputs, dtype=np.float64)
+  if inputs.ndim != 2 or desiredOutputs.ndim != 2 or inputs.shape[0] != desiredOutputs.shape[0]:
+    raise ValueError(f"Expected (n, n_inputs) and (n, n_outputs) arrays, got {inputs.shape} and {desiredOutputs.shape}.")
+
+  sampleCount = inputs.shape[0]
+  validationCount = int(sampleCount * validationSplit)
+  if validationCount:
+    order = rng.permutation(sampleCount)
+    validationInputs, validationOutputs = inputs[order[:validationCount]], desiredOutputs[order[:validationCount]]
+    inputs, desiredOutputs = inputs[order[validationCount:]], desiredOutputs[order[validationCount:]]
+    sampleCount -= validationCount
+
+  if initialWeights is not None:
+    weights = [np.array(weight, dtype=np.float64) for weight in initialWeights]
+  else:
+    weights = initializeWeights(inputs.shape[1], hiddenSize or inputs.shape[1], desiredOutputs.shape[1], rng)
+  velocities = [np.zeros_like(weight) for weight in weights]
+  squares = [np.zeros_like(weight) for weight in weights]
+  gradients = [np.empty_like(weight) for weight in weights]
+
+  # Shuffled copies live in preallocated buffers, refilled in place every epoch.
+  shuffledInputs = np.empty_like(inputs)
+  shuffledOutputs = np.empty_like(desiredOutputs)
+
+  history = {"loss": [], "validationLoss": [], "epochs": 0, "bestEpoch": 0}
+  bestLoss, bestWeights, waited, step = np.inf, None, 0, 0
+
+  for epoch in range(epochs):
+    if shuffle:
+      order = rng.permutation(sampleCount)
+      np.take(inputs, order, axis=0, out=shuffledInputs)
+      np.take(desiredOutputs, order, axis=0, out=shuffledOutputs)
+      epochInputs, epochOutputs = shuffledInputs, shuffledOutputs
+    else:
+      epochInputs, epochOutputs = inputs, desiredOutputs
+
+    for start in range(0, sampleCount, batchSize):
+      batchInputs = epochInputs[start:start + batchSize]
+      batchOutputs = epochOutputs[start:start + batchSize]
+      weightsL1, biasesL1, weightsL2, biasesL2 = weights
+
+      # Forward pass
+      layer1Output = np.tanh(batchInputs @ weightsL1 + biasesL1)
+      layer2Output = np.tanh(layer1Output @ weightsL2 + biasesL2)
+
+      # Backward pass (descent direction, averaged over the batch)
+      dLayer2 = (batchOutputs - layer2Output) * (1 - layer2Output * layer2Output)
+      dLayer1 = (dLayer2 @ weightsL2.T) * (1 - layer1Output * layer1Output)
+      scale = 1.0 / batchInputs.shape[0]
+      np.dot(batchInputs.T, dLayer1, out=gradients[0])
+      np.sum(dLayer1, axis=0, out=gradients[1])
+      np.dot(layer1Output.T, dLayer2, out=gradients[2])
+      np.sum(dLayer2, axis=0, out=gradients[3])
+
+      step += 1
+      for weight, gradient, velocity, square in zip(weights, gradients, velocities, squares):
+        gradient *= scale
+        if optimizer == "sgd":
+          weight += learningRate * gradient
+        elif optimizer == "momentum":
+          velocity *= momentum
+          velocity += learningRate * gradient
+          weight += velocity
+        else:
+          velocity *= momentum
+          velocity += (1 - momentum) * gradient
+          square *= beta2
+          square += (1 - beta2) * gradient * gradient
+          correction = np.sqrt(1 - beta2 ** step) / (1 - momentum ** step)
+          weight += learningRate * correction * velocity / (np.sqrt(square) + 1e-8)
+
+    history["epochs"] = epoch + 1
+    history["loss"].append(_meanSquaredError(weights, inputs, desiredOutputs))
+    if validationCount:
+      validationLoss = _meanSquaredError(weights, validationInputs, validationOutputs)
+      history["validationLoss"].append(validationLoss)
+      if validationLoss < bestLoss:
+        bestLoss, bestWeights, waited = validationLoss, [weight.copy() for weight in weights], 0
+        history["bestEpoch"] = epoch + 1
+      else:
+        waited += 1
+        if patience is not None and waited >= patience:
+          break
+
+  if bestWeights is not None:
+    weights = bestWeights
+  else:
+    history["bestEpoch"] = history["epochs"]
+  return weights, history
+
+
+class Network2LayersPredictor:
+  """
+  Batched inference for trained Weights.
+  Weights are held as contiguous arrays and every intermediate result goes into
+  buffers allocated once and reused across calls (grown only for a larger batch).
+  Probabilities are the softmax of the output layer activations, as predictWithSoftmax
+  in model/source/model.ts.
+
+  Args:
+    weights (list): Weights, as returned by neuralNetwork2LayersTraining.
+    dtype: np.float64 (default) or np.float32.
+    capacity (int): Initial batch capacity of the buffers.
+  """
+
+  def __init__(self, weights: list, dtype=np.float64, capacity: int = 1024):
+    self.dtype = np.dtype(dtype)
+    weightsL1, biasesL1, weightsL2, biasesL2 = weights
+    self.weightsL1 = np.ascontiguousarray(weightsL1, dtype=self.dtype)
+    self.biasesL1 = np.ascontiguousarray(biasesL1, dtype=self.dtype)
+    self.weightsL2 = np.ascontiguousarray(weightsL2, dtype=self.dtype)
+    self.biasesL2 = np.ascontiguousarray(biasesL2, dtype=self.dtype)
+    self.inputSize, self.hiddenSize = self.weightsL1.shape
+    self.outputSize = self.weightsL2.shape[1]
+    self._allocate(capacity)
+
+  def _allocate(self, capacity: int):
+    self.capacity = capacity
+    self._inputs = np.empty((capacity, self.inputSize), dtype=self.dtype)
+    self._hidden = np.empty((capacity, self.hiddenSize), dtype=self.dtype)
+    self._probabilities = np.empty((capacity, self.outputSize), dtype=self.dtype)
+    self._rowValues = np.empty((capacity, 1), dtype=self.dtype)
+    self._labels = np.empty(capacity, dtype=np.intp)
+
+  def predict(self, inputs, copy: bool = False):
+    """
+    Classify a batch of observations.
+
+    Args:
+      inputs: (n, n_inputs) observations (a single observation is accepted as (n_inputs,)).
+      copy (bool): Return copies. By default the results are views on the internal
+        buffers and are overwritten by the next call.
+
+    Returns:
+      np.ndarray: (n, n_outputs) softmax probabilities.
+      np.ndarray: (n,) argmax labels.
+    """
+
+    inputs = np.asarray(inputs)
+    if inputs.ndim == 1:
+      inputs = inputs[None, :]
+    if inputs.ndim != 2 or inputs.shape[1] != self.inputSize:
+      raise ValueError(f"Expected (n, {self.inputSize}) observations, got shape {inputs.shape}.")
+
+    count = inputs.shape[0]
+    if count > self.capacity:
+      self._allocate(max(count, 2 * self.capacity))
+
+    if inputs.dtype != self.dtype or not inputs.flags.c_contiguous:
+      batch = self._inputs[:count]
+      batch[...] = inputs
+      inputs = batch
+    hidden = self._hidden[:count]
+    probabilities = self._probabilities[:count]
+    rowValues = self._rowValues[:count]
+    labels = self._labels[:count]
+
+    np.matmul(inputs, self.weightsL1, out=hidden)
+    hidden += self.biasesL1
+    np.tanh(hidden, out=hidden)
+    np.matmul(hidden, self.weightsL2, out=probabilities)
+    probabilities += self.biasesL2
+
+    np.argmax(probabilities, axis=1, out=labels)
+    np.max(probabilities, axis=1, keepdims=True, out=rowValues)
+    probabilities -= rowValues
+    np.exp(probabilities, out=probabilities)
+    np.sum(probabilities, axis=1, keepdims=True, out=rowValues)
+    probabilities /= rowValues
+
+    if copy:
+      return probabilities.copy(), labels.copy()
+    return probabilities, labels
@@ -0,0 +1,42 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import time
+
+import numpy as np
+
+from network import forwardNetwork2Layers, initializeWeights, trainNetwork2Layers
+
+rng = np.random.default_rng(3)
+centers = rng.normal(0, 1, size=(4, 3))
+labels = np.repeat(np.arange(4), 42)
+inputs = centers[labels] + rng.normal(0, 0.2, size=(168, 3))
+outputs = np.eye(4)[labels]
+
+# batchSize=1 without shuffling is the original per-sample loop.
+initial = initializeWeights(3, 3, 4, np.random.default_rng(0))
+weights, _ = trainNetwork2Layers(inputs, outputs, epochs=2, batchSize=1, shuffle=False, initialWeights=initial)
+reference = [weight.copy() for weight in initial]
+for _ in range(2):
+  for inputVector, desiredOutput in zip(inputs, outputs):
+    layer1Output = np.tanh(np.dot(inputVector, reference[0]) + reference[1])
+    layer2Output = np.tanh(np.dot(layer1Output, reference[2]) + reference[3])
+    dLayer2 = (desiredOutput - layer2Output) * (1 - layer2Output ** 2)
+    dLayer1 = np.dot(dLayer2, reference[2].T) * (1 - layer1Output ** 2)
+    reference[2] += 0.01 * np.outer(layer1Output, dLayer2)
+    reference[3] += 0.01 * dLayer2
+    reference[0] += 0.01 * np.outer(inputVector, dLayer1)
+    reference[1] += 0.01 * dLayer1
+assert all(np.allclose(a, b) for a, b in zip(weights, reference))
+
+for optimizer in ("sgd", "momentum", "adam"):
+  start = time.perf_counter()
+  weights, history = trainNetwork2Layers(
+    inputs, outputs, hiddenSize=8, epochs=300, batchSize=32, optimizer=optimizer,
+    learningRate=0.05 if optimizer == "adam" else 0.5, validationSplit=0.2, patience=30, seed=0,
+  )
+  elapsed = time.perf_counter() - start
+  accuracy = np.mean(np.argmax(forwardNetwork2Layers(weights, inputs), axis=1) == labels)
+  print(f"{optimizer:<8} {history['epochs']:4d} epochs in {elapsed * 1e3:6.1f} ms, accuracy {accuracy:.2f}")
+  assert accuracy > 0.8
@@ -0,0 +1,272 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+from reducer import (
+  calculateIndicators,
+  calculateIndicatorsMatrix,
+  importSignal,
+  importSignalList,
+  neuralNetwork2LayersTraining,
+  selectRelevantIndicators,
+)
+from reader import readSignalFile
+from store import buildSignalStore, listSignalFiles
+
+"""
+  Benchmark of the import -> indicators -> selection -> training pipeline of reducer.py,
+  on the bundled datasets and on synthetic data scaled from them.
+
+  Every stage is timed without tracing, then run once more under tracemalloc for its
+  peak memory (numpy allocations included). Results are written as JSON so two
+  commits can be compared with --compare.
+
+  Interface BenchResult
+    dataset: string  -  "tp-reducer", "tp-equilibrator" or "synthetic"
+    stage: string  -  Benchmarked function
+    scale: number  -  Size relative to the tp-reducer dataset (1 for the bundled datasets)
+    items: number  -  Signals, or indicator rows for selection and training
+    bytes: number  -  CSV bytes for the CSV parses, float64 bytes returned by the store views
+      (importSignal, importSignalList) or processed otherwise
+    seconds: number  -  Best wall time
+    itemsPerSecond: number
+    mbPerSecond: number
+    peakBytes: number  -  tracemalloc peak; null with --no-memory and for the synthetic
+      indicator stages, timed chunk by chunk
+
+  Usage: python tp-reducer/pipeline.bench.py [--scales 10,100,1000] [--output results.json] [--compare old.json]
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASETS = {
+  "tp-reducer": os.path.join(ROOT, "tp-reducer", "data"),
+  "tp-equilibrator": os.path.join(ROOT, "data", "tp-equilibrator-bad"),
+}
+
+# Synthetic signals are generated and processed in chunks of this many rows.
+SYNTHETIC_CHUNK = 256
+# calculateIndicators is one Python call per signal: past this scale it only adds minutes.
+PER_SIGNAL_MAX_SCALE = 100
+TRAINING_EPOCHS = 50
+
+
+def measure(function, repeat: int = 1, memory: bool = True):
+  """
+  Best wall time over `repeat` runs and the tracemalloc peak of one extra run.
+  """
+
+  seconds = float("inf")
+  for _ in range(repeat):
+    start = time.perf_counter()
+    function()
+    seconds = min(seconds, time.perf_counter() - start)
+
+  peakBytes = None
+  if memory:
+    tracemalloc.start()
+    try:
+      function()
+      peakBytes = tracemalloc.get_traced_memory()[1]
+    finally:
+      tracemalloc.stop()
+  return seconds, peakBytes
+
+
+def result(dataset: str, stage: str, scale: float, items: int, bytes_: int, seconds: float, peakBytes) -> dict:
+  return {
+    "dataset": dataset,
+    "stage": stage,
+    "scale": scale,
+    "items": items,
+    "bytes": bytes_,
+    "seconds": seconds,
+    "itemsPerSecond": items / seconds,
+    "mbPerSecond": bytes_ / seconds / 1e6,
+    "peakBytes": peakBytes,
+  }
+
+
+def _classDirectories(dataset_dir: str) -> list:
+  return sorted(os.path.join(dataset_dir, name) for name in os.listdir(dataset_dir) if os.path.isdir(os.path.join(dataset_dir, name)))
+
+
+def _trainingSet(indicatorMatrices: list):
+  rows = np.concatenate([np.asarray(matrix, dtype=np.float64) for matrix in indicatorMatrices])
+  targets = np.repeat(np.eye(len(indicatorMatrices)), [len(matrix) for matrix in indicatorMatrices], axis=0)
+  scale = rows.std(axis=0)
+  scale[scale == 0] = 1.0
+  return (rows - rows.mean(axis=0)) / scale, targets
+
+
+def _pipelineStages(dataset: str, scale: float, indicatorMatrices: list, memory: bool) -> list:
+  """
+  Selection and training stages on indicator matrices (one per class).
+  """
+
+  items = sum(len(matrix) for matrix in indicatorMatrices)
+  featureBytes = items * len(indicatorMatrices[0][0]) * 8
+  results = []
+
+  seconds, peak = measure(lambda: selectRelevantIndicators(indicatorMatrices, 3), memory=memory)
+  results.append(result(dataset, "selectRelevantIndicators", scale, items, featureBytes, seconds, peak))
+
+  inputs, targets = _trainingSet([np.asarray(matrix)[:, :3] for matrix in indicatorMatrices])
+  train = lambda: neuralNetwork2LayersTraining(inputs, targets, epochs=TRAINING_EPOCHS, batchSize=16, optimizer="momentum", seed=0)
+  seconds, peak = measure(train, memory=memory)
+  results.append(result(dataset, f"neuralNetwork2LayersTraining[{TRAINING_EPOCHS} epochs]", scale, items, inputs.nbytes, seconds, peak))
+  return results
+
+
+def benchDataset(dataset: str, dataset_dir: str, repeat: int, memory: bool) -> list:
+  directories = _classDirectories(dataset_dir)
+  files = [os.path.join(directory, name) for directory in directories for name in listSignalFiles(directory)]
+  csvBytes = sum(os.path.getsize(path) for path in files)
+  results = []
+
+  seconds, peak = measure(lambda: [buildSignalStore(directory) for directory in directories], memory=memory)
+  results.append(result(dataset, "buildSignalStore (CSV parse)", 1, len(files), csvBytes, seconds, peak))
+
+  seconds, peak = measure(lambda: [readSignalFile(path) for path in files], repeat, memory)
+  results.append(result(dataset, "readSignalFile (CSV parse)", 1, len(files), csvBytes, seconds, peak))
+
+  # No CSV is parsed here: the store returns views, so the bytes are the samples served.
+  viewBytes = sum(importSignal(path).nbytes for path in files)
+  seconds, peak = measure(lambda: [importSignal(path) for path in files], repeat, memory)
+  results.append(result(dataset, "importSignal (store views)", 1, len(files), viewBytes, seconds, peak))
+
+  matrices = []
+  seconds, peak = measure(lambda: matrices.__setitem__(slice(None), [importSignalList(directory) for directory in directories]), repeat, memory)
+  signalCount = sum(matrix.shape[0] for matrix in matrices)
+  signalBytes = sum(matrix.nbytes for matrix in matrices)
+  results.append(result(dataset, "importSignalList (store views)", 1, signalCount, signalBytes, seconds, peak))
+
+  seconds, peak = measure(lambda: [calculateIndicators(signal) for matrix in matrices for signal in matrix], repeat, memory)
+  results.append(result(dataset, "calculateIndicators", 1, signalCount, signalBytes, seconds, peak))
+
+  indicatorMatrices = []
+  seconds, peak = measure(lambda: indicatorMatrices.__setitem__(slice(None), [calculateIndicatorsMatrix(matrix) for matrix in matrices]), repeat, memory)
+  results.append(result(dataset, "calculateIndicatorsMatrix", 1, signalCount, signalBytes, seconds, peak))
+
+  return results + _pipelineStages(dataset, 1, indicatorMatrices, memory)
+
+
+def benchSynthetic(scale: int, baseMatrices: list, memory: bool, seed: int = 0) -> list:
+  """
+  Scale the tp-reducer dataset `scale` times: every synthetic signal is a randomly
+  rolled real capture of the same class plus 5 % white noise.
+  """
+
+  rng = np.random.default_rng(seed)
+  length = baseMatrices[0].shape[1]
+  perClass = [matrix.shape[0] * scale for matrix in baseMatrices]
+  results = []
+
+  def synthetic(base: np.ndarray, count: int):
+    for start in range(0, count, SYNTHETIC_CHUNK):
+      rows = min(SYNTHETIC_CHUNK, count - start)
+      chunk = base[rng.integers(0, base.shape[0], rows)]
+      chunk = np.stack([np.roll(row, shift) for row, shift in zip(chunk, rng.integers(0, length, rows))])
+      chunk += rng.normal(0.0, 0.05 * base.std(), chunk.shape)
+      yield chunk
+
+  # Generation is excluded from the timings: only the indicator calls are timed.
+  indicatorMatrices, seconds, perSignalSeconds = [], 0.0, 0.0
+  for base, count in zip(baseMatrices, perClass):
+    rows = []
+    for chunk in synthetic(base, count):
+      start = time.perf_counter()
+      rows += calculateIndicatorsMatrix(chunk)
+      seconds += time.perf_counter() - start
+      if scale <= PER_SIGNAL_MAX_SCALE:
+        start = time.perf_counter()
+        for signal in chunk:
+          calculateIndicators(signal)
+        perSignalSeconds += time.perf_counter() - start
+    indicatorMatrices.append(rows)
+
+  items = sum(perClass)
+  signalBytes = items * length * 8
+  results.append(result("synthetic", "calculateIndicatorsMatrix", scale, items, signalBytes, seconds, None))
+  if scale <= PER_SIGNAL_MAX_SCALE:
+    results.append(result("synthetic", "calculateIndicators", scale, items, signalBytes, perSignalSeconds, None))
+  return results + _pipelineStages("synthetic", scale, indicatorMatrices, memory)
+
+
+def environment() -> dict:
+  try:
+    commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+  except OSError:
+    commit = None
+  return {
+    "commit": commit or None,
+    "python": platform.python_version(),
+    "numpy": np.__version__,
+    "machine": platform.machine(),
+    "cpuCount": os.cpu_count(),
+  }
+
+
+def printResults(results: list):
+  print(f"{'dataset':<16}{'stage':<46}{'scale':>6}{'items':>9}{'seconds':>10}{'items/s':>12}{'MB/s':>10}{'peak MB':>10}")
+  for entry in results:
+    peak = "" if entry["peakBytes"] is None else f"{entry['peakBytes'] / 1e6:.1f}"
+    print(
+      f"{entry['dataset']:<16}{entry['stage']:<46}{entry['scale']:>6}{entry['items']:>9}"
+      f"{entry['seconds']:>10.4f}{entry['itemsPerSecond']:>12.1f}{entry['mbPerSecond']:>10.1f}{peak:>10}"
+    )
+
+
+def compareResults(previous: dict, current: dict):
+  """
+  Print the speed ratio of every (dataset, stage, scale) present in both runs.
+  """
+
+  before = {(entry["dataset"], entry["stage"], entry["scale"]): entry for entry in previous["results"]}
+  print(f"\n{previous['environment'].get('commit')} -> {current['environment'].get('commit')}")
+  for entry in current["results"]:
+    old = before.get((entry["dataset"], entry["stage"], entry["scale"]))
+    if old is not None:
+      ratio = old["seconds"] / entry["seconds"]
+      flag = "  REGRESSION" if ratio < 0.9 else ""
+      print(f"  {entry['dataset']:<16}{entry['stage']:<46}{entry['scale']:>6}  x{ratio:.2f}{flag}")
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Benchmark the reducer pipeline.")
+  parser.add_argument("--scales", default="10,100", help="Synthetic scales, e.g. 10,100,1000.")
+  parser.add_argument("--repeat", type=int, default=3)
+  parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc runs.")
+  parser.add_argument("--output", default=None, help="JSON results file. Defaults to bench-<commit>.json.")
+  parser.add_argument("--compare", default=None, help="Previous JSON results to compare with.")
+  arguments = parser.parse_args()
+
+  memory = not arguments.no_memory
+  results = []
+  for dataset, dataset_dir in DATASETS.items():
+    results += benchDataset(dataset, dataset_dir, arguments.repeat, memory)
+
+  baseMatrices = [importSignalList(directory) for directory in _classDirectories(DATASETS["tp-reducer"])]
+  for scale in [int(scale) for scale in arguments.scales.split(",") if scale]:
+    results += benchSynthetic(scale, baseMatrices, memory)
+
+  report = {"environment": environment(), "results": results}
+  printResults(results)
+
+  output = arguments.output or f"bench-{report['environment']['commit'] or 'local'}.json"
+  with open(output, "w") as file:
+    json.dump(report, file, indent=2)
+  print(f"\nResults written to {output}")
+
+  if arguments.compare:
+    with open(arguments.compare) as file:
+      compareResults(json.load(file), report)
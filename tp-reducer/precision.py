@@ -0,0 +1,333 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from artifact import PipelineArtifact
+from dataset import FeatureDataset
+from indicators import BLOCK_ROWS, INDICATOR_NAMES, calculateIndicatorsBatch, indicatorColumns
+from network import trainNetwork2Layers
+from sbs import fisherSBS
+
+"""
+  Reduced-precision signal matrices: an opt-in storage mode trading exactness for
+  memory and bandwidth, with a report of what it costs against float64.
+
+  Signals are optionally decimated (windowed-sinc low-pass FIR, then every `factor`-th
+  sample) and stored as float32, or as int16 with one scale per signal
+  (value = code * scale, scale = max |x| / 32767). Indicators are computed block by
+  block from the reduced storage; a full float64 copy is never held.
+
+  Decimation keeps the mean, and `energy` is multiplied by the factor so it stays a
+  sum over the original sample count. Content above the new Nyquist frequency is
+  removed, so rms, peak and kurtosis of wide-band signals do change: the report says
+  by how much.
+
+  Interface PrecisionReport
+    precision: string  -  "float64", "float32" or "int16"
+    decimation: number
+    bytes: number  -  Storage of all the signals
+    memoryRatio: number  -  bytes / float64 bytes
+    indicatorSeconds: number  -  Reduction + indicators of all the signals
+    indicators: dict  -  {name: {maxRelativeError, maxSpreadError}}, error relative to the
+      baseline value and to the baseline standard deviation over all signals
+    agreement: number  -  Share of test predictions of the float64 model unchanged
+    accuracy: number  -  Test accuracy of the float64 model on the reduced indicators
+    retrainedAccuracy: number  -  Test accuracy after selection and training on the reduced indicators
+    selected: list  -  Indicators selected on the reduced indicators
+    passed: boolean  -  accuracy and agreement within maxAccuracyDrop of the baseline
+
+  Usage: python tp-reducer/precision.py [--modes float32,int16,float32/2,int16/4] [--max-accuracy-drop 0.02]
+"""
+
+PRECISIONS = ("float64", "float32", "int16")
+INT16_MAX = 32767
+
+
+def lowPassFilter(factor: int, taps: int = None, beta: float = 8.0) -> np.ndarray:
+  """
+  Symmetric Kaiser-windowed sinc low-pass for decimation by `factor`: cut-off at 90 % of
+  the decimated Nyquist frequency, unit gain at DC.
+
+  Args:
+    factor (int): Decimation factor.
+    taps (int): Filter length, odd. Defaults to 16 * factor + 1.
+    beta (float): Kaiser window shape (8: about 80 dB stop-band attenuation).
+  """
+
+  taps = taps or 16 * factor + 1
+  if taps % 2 == 0: raise ValueError("taps must be odd.")
+  cutoff = 0.9 / factor
+  positions = np.arange(taps) - (taps - 1) / 2
+  coefficients = cutoff * np.sinc(cutoff * positions) * np.kaiser(taps, beta)
+  return coefficients / coefficients.sum()
+
+
+def decimateSignals(signalMatrix, factor: int, taps: int = None) -> np.ndarray:
+  """
+  Anti-aliased decimation of every row: low-pass (lowPassFilter, zero phase, reflected
+  edges) evaluated only at the kept samples 0, factor, 2 * factor...
+
+  Returns:
+    np.ndarray: (n_signals, ceil(n_samples / factor)) float64 matrix.
+  """
+
+  signalMatrix = np.asarray(signalMatrix, dtype=np.float64)
+  if signalMatrix.ndim == 1:
+    signalMatrix = signalMatrix[None, :]
+  if factor < 1: raise ValueError("factor must be at least 1.")
+  if factor == 1:
+    return signalMatrix.copy()
+
+  coefficients = lowPassFilter(factor, taps)
+  half = coefficients.shape[0] // 2
+  if signalMatrix.shape[1] <= half: raise ValueError(f"Signals need more than {half} samples for a {coefficients.shape[0]}-tap filter.")
+  padded = np.pad(signalMatrix, ((0, 0), (half, half)), mode="reflect")
+
+  # Polyphase form: one strided multiply-add per tap, over the kept outputs only.
+  count = -(-signalMatrix.shape[1] // factor)
+  out = np.zeros((signalMatrix.shape[0], count))
+  for tap, coefficient in enumerate(coefficients):
+    out += coefficient * padded[:, tap:tap + factor * (count - 1) + 1:factor]
+  return out
+
+
+class ReducedSignalMatrix:
+  """
+  Signals stored as float32, or as int16 codes with one scale per signal, after
+  optional decimation. Build with reduceSignals.
+
+  Args:
+    data (np.ndarray): (n_signals, n_samples) float32, int16 or float64 values.
+    scales (np.ndarray): (n_signals,) scales of int16 data, None otherwise.
+    decimation (int): Decimation factor applied to the original signals.
+  """
+
+  def __init__(self, data: np.ndarray, scales: np.ndarray = None, decimation: int = 1):
+    if data.dtype == np.int16 and scales is None: raise ValueError("int16 data needs per-signal scales.")
+    self.data = data
+    self.scales = scales
+    self.decimation = decimation
+
+  @property
+  def precision(self) -> str:
+    return self.data.dtype.name
+
+  @property
+  def shape(self) -> tuple:
+    return self.data.shape
+
+  @property
+  def nbytes(self) -> int:
+    return self.data.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+  def __len__(self) -> int:
+    return self.data.shape[0]
+
+  def rows(self, start: int = 0, stop: int = None) -> np.ndarray:
+    """
+    Signals start:stop back as float64 (decimated, not interpolated back).
+    """
+    block = self.data[start:stop].astype(np.float64)
+    if self.scales is not None:
+      block *= self.scales[start:stop, None]
+    return block
+
+
+def reduceSignals(signalMatrix, precision: str = "float32", decimation: int = 1, taps: int = None) -> ReducedSignalMatrix:
+  """
+  Decimate and quantise a signal matrix, BLOCK_ROWS signals at a time (the input can
+  be a memory-mapped store view).
+
+  Args:
+    signalMatrix: (n_signals, n_samples) matrix.
+    precision (str): "float64", "float32" or "int16".
+    decimation (int): Decimation factor, 1 to keep every sample.
+    taps (int): Length of the anti-aliasing filter, see lowPassFilter.
+  """
+
+  if precision not in PRECISIONS: raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}.")
+  signalMatrix = np.asarray(signalMatrix)
+  if signalMatrix.ndim == 1:
+    signalMatrix = signalMatrix[None, :]
+
+  count = signalMatrix.shape[0]
+  length = -(-signalMatrix.shape[1] // decimation)
+  data = np.empty((count, length), dtype=precision)
+  scales = np.empty(count) if precision == "int16" else None
+  for start in range(0, count, BLOCK_ROWS):
+    stop = min(start + BLOCK_ROWS, count)
+    block = signalMatrix[start:stop]
+    block = decimateSignals(block, decimation, taps) if decimation > 1 else np.asarray(block, dtype=np.float64)
+    if scales is None:
+      data[start:stop] = block
+    else:
+      peak = np.abs(block).max(axis=1)
+      scale = np.where(peak > 0, peak / INT16_MAX, 1.0)
+      data[start:stop] = np.rint(block / scale[:, None])
+      scales[start:stop] = scale
+  return ReducedSignalMatrix(data, scales, decimation)
+
+
+def calculateReducedIndicators(reduced: ReducedSignalMatrix) -> np.ndarray:
+  """
+  calculateIndicatorsBatch of reduced signals, columns in INDICATOR_NAMES order.
+  `energy` is scaled back to the original sample count.
+  """
+
+  out = np.empty((len(reduced), len(INDICATOR_NAMES)))
+  for start in range(0, len(reduced), BLOCK_ROWS):
+    stop = min(start + BLOCK_ROWS, len(reduced))
+    calculateIndicatorsBatch(reduced.rows(start, stop), out[start:stop])
+  out[:, INDICATOR_NAMES.index("energy")] *= reduced.decimation
+  return out
+
+
+def parseMode(mode: str) -> tuple:
+  """
+  "int16/4" -> ("int16", 4); "float32" -> ("float32", 1).
+  """
+  precision, _, decimation = mode.partition("/")
+  return precision, int(decimation or 1)
+
+
+def _fitPipeline(training: FeatureDataset, subsetSize: int, seed: int, epochs: int) -> PipelineArtifact:
+  # The reducer.py pipeline: Fisher SBS, standardisation, 2-layer network.
+  selected = fisherSBS(training.classMatrices(), subsetSize)["selected"]
+  inputs = training.features[:, selected]
+  mean = inputs.mean(axis=0)
+  scale = inputs.std(axis=0)
+  scale[scale == 0] = 1.0
+  weights, _history = trainNetwork2Layers((inputs - mean) / scale, training.oneHot(), epochs=epochs,
+                                          batchSize=16, optimizer="momentum", seed=seed)
+  return PipelineArtifact([weights[:2], weights[2:]], [training.featureNames[i] for i in selected], training.labelNames, mean, scale)
+
+
+def precisionReport(classMatrices: list, modes: list, indicatorNames: list, labelNames: list = None,
+                    subsetSize: int = 3, splitRatio: float = 0.7, epochs: int = 300, seed: int = 0,
+                    maxAccuracyDrop: float = 0.02) -> list:
+  """
+  Compare reduced storage modes with float64 on indicators and classification.
+
+  Args:
+    classMatrices (list): One (n_signals_i, n_samples) float64 signal matrix per class.
+    modes (list): (precision, decimation) pairs, see parseMode.
+    indicatorNames (list): Indicators the classifier selects from (INDICATOR_VECTOR_NAMES).
+    labelNames (list): Class names.
+    subsetSize (int): Indicators kept by fisherSBS.
+    splitRatio (float): Per-class training share, as reducer.py.
+    epochs (int): Training epochs of every model (all seeded with `seed`).
+    maxAccuracyDrop (float): Largest accuracy or agreement loss for `passed`.
+
+  Returns:
+    list: PrecisionReport per mode, the float64 baseline first.
+  """
+
+  columns = indicatorColumns(indicatorNames)
+
+  def indicatorDataset(matrices: list) -> FeatureDataset:
+    return FeatureDataset.fromClassMatrices([matrix[:, columns] for matrix in matrices], indicatorNames, labelNames)
+
+  started = time.perf_counter()
+  baselineIndicators = [calculateIndicatorsBatch(matrix) for matrix in classMatrices]
+  baselineSeconds = time.perf_counter() - started
+  baselineBytes = sum(np.asarray(matrix).size * 8 for matrix in classMatrices)
+
+  baselineTraining, baselineTesting = indicatorDataset(baselineIndicators).split(splitRatio)
+  baselinePipeline = _fitPipeline(baselineTraining, subsetSize, seed, epochs)
+  testColumns = baselineTesting.featureIndices(baselinePipeline.indicatorNames)
+  _probabilities, baselinePredictions = baselinePipeline.classify(baselineTesting.features[:, testColumns])
+  baselineAccuracy = float(np.mean(baselinePredictions == baselineTesting.labels))
+
+  allBaseline = np.concatenate(baselineIndicators)
+  spread = allBaseline.std(axis=0)
+  spread[spread == 0] = 1.0
+  magnitude = np.maximum(np.abs(allBaseline), np.finfo(np.float64).tiny)
+
+  reports = [{
+    "precision": "float64", "decimation": 1, "bytes": baselineBytes, "memoryRatio": 1.0,
+    "indicatorSeconds": baselineSeconds,
+    "indicators": {name: {"maxRelativeError": 0.0, "maxSpreadError": 0.0} for name in indicatorNames},
+    "agreement": 1.0, "accuracy": baselineAccuracy, "retrainedAccuracy": baselineAccuracy,
+    "selected": baselinePipeline.indicatorNames, "passed": True,
+  }]
+
+  for precision, decimation in modes:
+    started = time.perf_counter()
+    reducedMatrices = [reduceSignals(matrix, precision, decimation) for matrix in classMatrices]
+    indicators = [calculateReducedIndicators(reduced) for reduced in reducedMatrices]
+    seconds = time.perf_counter() - started
+
+    error = np.abs(np.concatenate(indicators) - allBaseline)
+    relativeError = error / magnitude
+    spreadError = error / spread
+
+    training, testing = indicatorDataset(indicators).split(splitRatio)
+    _probabilities, predictions = baselinePipeline.classify(testing.features[:, testColumns])
+    accuracy = float(np.mean(predictions == testing.labels))
+    agreement = float(np.mean(predictions == baselinePredictions))
+
+    retrained = _fitPipeline(training, subsetSize, seed, epochs)
+    _probabilities, retrainedPredictions = retrained.classify(testing.features[:, testing.featureIndices(retrained.indicatorNames)])
+
+    bytes_ = sum(reduced.nbytes for reduced in reducedMatrices)
+    reports.append({
+      "precision": precision,
+      "decimation": decimation,
+      "bytes": bytes_,
+      "memoryRatio": bytes_ / baselineBytes,
+      "indicatorSeconds": seconds,
+      "indicators": {
+        name: {"maxRelativeError": float(relativeError[:, column].max()), "maxSpreadError": float(spreadError[:, column].max())}
+        for name, column in zip(indicatorNames, columns)
+      },
+      "agreement": agreement,
+      "accuracy": accuracy,
+      "retrainedAccuracy": float(np.mean(retrainedPredictions == testing.labels)),
+      "selected": retrained.indicatorNames,
+      "passed": accuracy >= baselineAccuracy - maxAccuracyDrop and agreement >= 1.0 - maxAccuracyDrop,
+    })
+  return reports
+
+
+def printReport(reports: list):
+  names = list(reports[0]["indicators"])
+  print(f"{'mode':<12}{'MB':>8}{'memory':>8}{'seconds':>9}{'agree':>7}{'acc':>7}{'retrain':>9}  {'guardrail':<10}selected")
+  for report in reports:
+    mode = f"{report['precision']}/{report['decimation']}"
+    print(
+      f"{mode:<12}{report['bytes'] / 1e6:>8.1f}{report['memoryRatio']:>8.2f}{report['indicatorSeconds']:>9.3f}"
+      f"{report['agreement']:>7.3f}{report['accuracy']:>7.3f}{report['retrainedAccuracy']:>9.3f}"
+      f"  {'ok' if report['passed'] else 'FAILED':<10}{','.join(report['selected'])}"
+    )
+
+  print("\nMax indicator error, relative to the value (and to the spread over all signals)")
+  print(f"{'mode':<12}" + "".join(f"{name:>22}" for name in names))
+  for report in reports[1:]:
+    cells = [report["indicators"][name] for name in names]
+    print(f"{report['precision'] + '/' + str(report['decimation']):<12}" + "".join(
+      f"{cell['maxRelativeError']:>12.2e} ({cell['maxSpreadError']:.1e})" for cell in cells
+    ))
+
+
+if __name__ == "__main__":
+  import os
+
+  from reducer import INDICATOR_VECTOR_NAMES, REDUCER_CLASS_LABELS, importSignalList
+
+  parser = argparse.ArgumentParser(description="Accuracy and memory of reduced-precision signal storage.")
+  parser.add_argument("--data", default="./tp-reducer/data", help="Directory of the class directories.")
+  parser.add_argument("--modes", default="float32,int16,float32/2,int16/2,float32/4,int16/4")
+  parser.add_argument("--max-accuracy-drop", type=float, default=0.02)
+  parser.add_argument("--seed", type=int, default=0)
+  arguments = parser.parse_args()
+
+  classMatrices = [importSignalList(os.path.join(arguments.data, label)) for label in REDUCER_CLASS_LABELS]
+  modes = [parseMode(mode) for mode in arguments.modes.split(",") if mode]
+  reports = precisionReport(classMatrices, modes, INDICATOR_VECTOR_NAMES, REDUCER_CLASS_LABELS,
+                            seed=arguments.seed, maxAccuracyDrop=arguments.max_accuracy_drop)
+  printReport(reports)
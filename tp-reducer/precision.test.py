@@ -0,0 +1,57 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+
+import numpy as np
+
+from indicators import INDICATOR_NAMES, calculateIndicatorsBatch
+from precision import calculateReducedIndicators, decimateSignals, lowPassFilter, precisionReport, reduceSignals
+from reducer import INDICATOR_VECTOR_NAMES, calculateIndicatorsMatrix, importSignalList
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+rng = np.random.default_rng(0)
+
+# Low-pass: unit DC gain, a tone below the decimated Nyquist passes, one above is removed.
+assert np.isclose(lowPassFilter(4).sum(), 1.0)
+time_ = np.arange(8192) / 25600.0
+low = np.sin(2 * np.pi * 1000.0 * time_)
+high = np.sin(2 * np.pi * 5000.0 * time_)
+decimated = decimateSignals(np.stack([low, high, np.full(8192, 3.0)]), 4)
+assert decimated.shape == (3, 2048)
+assert np.allclose(decimated[0, 100:-100], low[::4][100:-100], atol=1e-3)
+assert np.abs(decimated[1, 100:-100]).max() < 1e-3
+assert np.allclose(decimated[2], 3.0)
+
+signals = rng.normal(0.5, 2.0, (40, 4096))
+baseline = calculateIndicatorsBatch(signals)
+for precision, memory, tolerance in (("float32", 0.5, 1e-5), ("int16", 0.25, 1e-3)):
+  reduced = reduceSignals(signals, precision)
+  assert reduced.data.dtype == precision and abs(reduced.nbytes / signals.nbytes - memory) < 0.01
+  assert np.allclose(calculateReducedIndicators(reduced), baseline, rtol=tolerance, atol=tolerance)
+
+# Energy stays a sum over the original length; white noise loses the removed band.
+bandLimited = 0.5 + np.sin(2 * np.pi * 300.0 * time_[:4096])[None, :] * rng.uniform(1.0, 2.0, (40, 1))
+reduced = reduceSignals(np.vstack([bandLimited, signals]), "float32", decimation=2)
+assert reduced.shape == (80, 2048)
+ratio = calculateReducedIndicators(reduced) / calculateIndicatorsBatch(np.vstack([bandLimited, signals]))
+energy, mean = INDICATOR_NAMES.index("energy"), INDICATOR_NAMES.index("mean")
+assert np.allclose(ratio[:40, energy], 1.0, atol=1e-3) and np.allclose(ratio[:40, mean], 1.0, atol=1e-3)
+variance = INDICATOR_NAMES.index("variance")
+keptNoise = (ratio[40:, energy] * baseline[:, energy] / 4096 - baseline[:, mean] ** 2) / baseline[:, variance]
+assert np.all((keptNoise > 0.35) & (keptNoise < 0.45)), keptNoise  # pass band: 45 % of the spectrum
+
+# Opt-in through importSignalList.
+directory = os.path.join(data_dir, "1-roulement-sain-pignon-sain")
+full = importSignalList(directory)
+reduced = importSignalList(directory, precision="int16")
+assert reduced.nbytes < full.nbytes / 3
+assert np.allclose(calculateIndicatorsMatrix(reduced), calculateIndicatorsMatrix(full), rtol=1e-3, atol=1e-6)
+
+classMatrices = [rng.normal(label, 1.0 + label, (30, 2048)) for label in range(3)]
+reports = precisionReport(classMatrices, [("float32", 1), ("int16", 2)], INDICATOR_VECTOR_NAMES, ["a", "b", "c"], epochs=100)
+assert [report["precision"] for report in reports] == ["float64", "float32", "int16"]
+assert reports[1]["memoryRatio"] == 0.5 and reports[1]["agreement"] == 1.0 and reports[1]["passed"]
+assert reports[2]["indicators"]["rms"]["maxRelativeError"] > reports[1]["indicators"]["rms"]["maxRelativeError"]
+print("precision tests passed")
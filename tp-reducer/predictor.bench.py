@@ -0,0 +1,31 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import time
+
+import numpy as np
+
+from network import Network2LayersPredictor, forwardNetwork2Layers, initializeWeights
+
+"""
+  Micro-benchmark: Network2LayersPredictor latency per 1,000 observations.
+"""
+
+rng = np.random.default_rng(0)
+weights = initializeWeights(3, 3, 4, rng)
+observations = rng.normal(size=(1000, 3))
+
+for dtype in (np.float64, np.float32):
+  predictor = Network2LayersPredictor(weights, dtype=dtype)
+  inputs = observations.astype(dtype)
+  probabilities, labels = predictor.predict(inputs)
+  assert np.array_equal(labels, np.argmax(forwardNetwork2Layers(weights, observations), axis=1))
+  assert np.allclose(probabilities.sum(axis=1), 1.0, atol=1e-5)
+
+  timings = []
+  for _ in range(200):
+    start = time.perf_counter()
+    predictor.predict(inputs)
+    timings.append(time.perf_counter() - start)
+  print(f"{np.dtype(dtype).name:<8} best {min(timings) * 1e6:7.1f} us  median {np.median(timings) * 1e6:7.1f} us per 1,000 observations")
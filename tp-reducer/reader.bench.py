@@ -0,0 +1,44 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from reader import readSignalFile
+
+"""
+  Micro-benchmark: readSignalFile vs np.genfromtxt on 25,600-row acc_*.csv files.
+  Usage: python tp-reducer/reader.bench.py [file.csv] [repetitions]
+"""
+
+file_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+  os.path.dirname(__file__), "data", "1-roulement-sain-pignon-sain", "acc_00001.csv"
+)
+repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+
+def bench(name, function):
+  function()
+  timings = []
+  for _ in range(repetitions):
+    start = time.perf_counter()
+    function()
+    timings.append(time.perf_counter() - start)
+  best = min(timings)
+  megabytes = os.path.getsize(file_path) / 1e6
+  print(f"{name:<14} best {best * 1e3:8.3f} ms  median {np.median(timings) * 1e3:8.3f} ms  {megabytes / best:8.1f} MB/s")
+  return best
+
+
+reference = np.genfromtxt(file_path, delimiter=',', usecols=1)
+signal, constant = readSignalFile(file_path)
+assert np.array_equal(signal, reference)
+
+print(file_path, reference.shape[0], "rows, constant", constant)
+genfromtxt = bench("genfromtxt", lambda: np.genfromtxt(file_path, delimiter=',', usecols=1))
+fast = bench("readSignalFile", lambda: readSignalFile(file_path))
+print(f"speedup x{genfromtxt / fast:.1f}")
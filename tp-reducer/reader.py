@@ -0,0 +1,45 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "importer"))
+
+from importer import importSignalAndConstant
+from metrics import instrument
+
+"""
+  This module reads the two-column acc_*.csv format:
+    <int>,<float>
+  The first column is constant for a whole file (acquisition time stamp),
+  the second column is the signal.
+"""
+
+
+@instrument(counters=lambda result, file_path, *args, **kwargs: {"items": 1, "bytes": os.path.getsize(file_path)})
+def readSignalFile(file_path: str, dtype=np.float64):
+  """
+  Read an acc_*.csv file with importSignalAndConstant (importer/importer.py),
+  the repository's one CSV parser (numpy's C tokenizer instead of np.genfromtxt).
+
+  Args:
+    file_path (str): Path to the CSV file.
+    dtype: Type of the returned signal.
+
+  Returns:
+    np.ndarray: The signal (second column).
+    float: The constant of the first column, taken from the first line (nan for an empty file).
+  """
+
+  return importSignalAndConstant(file_path, dtype)
+
+
+def readSignal(file_path: str, dtype=np.float64) -> np.ndarray:
+  """
+  Read only the signal of an acc_*.csv file. See readSignalFile.
+  """
+  return readSignalFile(file_path, dtype)[0]
@@ -2,9 +2,24 @@
   @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved. 
 """ 
 
+import os
+
 import numpy as np
 
+from artifact import PipelineArtifact, savePipeline
+from dataset import FeatureDataset
+from featurecache import IndicatorCache
+from indicators import calculateIndicatorsBatch, indicatorColumns
+from metrics import instrument, metricsEnabled, prometheusSnapshot, writeChromeTrace
+from network import Network2LayersPredictor, trainNetwork2Layers
+from precision import ReducedSignalMatrix, calculateReducedIndicators, reduceSignals
+from sbs import fisherSBS
+from sharedmatrix import shareMatrix
+from store import listSignalFiles, loadStoredSignal, openSignalStore
+
 
+# No bytes: the signal is a view on the store, the CSV parse is counted by buildSignalStore.
+@instrument(counters=lambda result, file_path, *args, **kwargs: {"items": 1})
 def importSignal(file_path):
   """
   Import a signal from a CSV file with columns: time, data
@@ -15,23 +30,58 @@ def importSignal(file_path):
     
   Returns:
     np.ndarray: The signal data as a numpy array.
+      A read-only view on the binary store of the file's directory (see store.py).
   """
 
-  data = np.genfromtxt(file_path, delimiter=',', usecols=1)
-  return data
+  return loadStoredSignal(file_path)
 
-def importSignalList(dir_path):
-  prefix = "acc_"
+@instrument(counters=lambda result, dir_path, *args, **kwargs: {"items": result.shape[0]})
+def importSignalList(dir_path, skip: int = 10, shared: str = None, precision: str = None, decimation: int = 1):
+  """
+  Import every acc_*.csv file of a directory.
 
-  signals = []
-  for i in range(11, 70 + 1):
-    file_name = f"{prefix}{i:05d}.csv"
-    full_file_path = f"{dir_path}/{file_name}"
-    
-    data = importSignal(full_file_path)
-    signals.append(data)
-  return signals
+  Args:
+    dir_path (str): Path to the class directory.
+    skip (int): Number of leading captures to ignore (warm-up acquisitions).
+    shared (str): "shm" or "file" to publish the matrix for process pool workers
+      (see sharedmatrix.py). None (default) returns the array itself.
+    precision (str): "float32" or "int16" to store the signals in reduced precision
+      (see precision.py). None (default) keeps float64.
+    decimation (int): Anti-aliased decimation factor applied with a reduced precision.
+
+  Returns:
+    np.ndarray | SharedMatrixHandle | ReducedSignalMatrix: (n_files - skip, n_samples) matrix,
+      one signal per row. A missing or stale store is rebuilt with the files parsed
+      in a process pool (see store.buildSignalStore).
+  """
+
+  store = openSignalStore(dir_path)
+  matrix = store.matrix(store.names[skip:])
+  if precision is not None or decimation > 1:
+    if shared is not None: raise ValueError("Reduced-precision matrices cannot be shared.")
+    return reduceSignals(matrix, precision or "float64", decimation)
+  if shared is not None:
+    return shareMatrix(matrix, shared)
+  return matrix
+
+def importIndicatorMatrix(dir_path, indicatorCache: IndicatorCache, skip: int = 10) -> list:
+  """
+  Indicator rows (INDICATOR_VECTOR_NAMES) of every acc_*.csv file of a directory,
+  read from the cache when the file did not change (see featurecache.py).
+
+  Args:
+    dir_path (str): Path to the class directory.
+    indicatorCache (IndicatorCache): Cache of per-file indicator rows.
+    skip (int): Number of leading captures to ignore (warm-up acquisitions).
+
+  Returns:
+    list: One indicator vector per file, as calculateIndicatorsMatrix.
+  """
 
+  file_paths = [os.path.join(dir_path, name) for name in listSignalFiles(dir_path)[skip:]]
+  return indicatorCache.indicatorRows(file_paths, INDICATOR_VECTOR_NAMES).tolist()
+
+@instrument(counters=lambda result, signal, *args, **kwargs: {"items": 1})
 def calculateIndicators(signal: np.ndarray) -> dict:  
   """
     Interface Indicator
@@ -78,24 +128,27 @@ def calculateIndicators(signal: np.ndarray) -> dict:
   }
 
 
+INDICATOR_VECTOR_NAMES = [
+  "energy",
+  "power",
+  "peak",
+  "mean",
+
+  "rms",
+  "kurtosis",
+  "crest_factor",
+  "k_factor",
+  # "std_dev",
+  # "variance",
+  # "skewness",
+]
+
 def calculateIndicatorsVector(signal: np.ndarray) -> list:  
   indicator_dict = calculateIndicators(signal)
 
-  return [
-    indicator_dict["energy"],
-    indicator_dict["power"],
-    indicator_dict["peak"],
-    indicator_dict["mean"],
-
-    indicator_dict["rms"],
-    indicator_dict["kurtosis"],
-    indicator_dict["crest_factor"],
-    indicator_dict["k_factor"],
-    # indicator_dict["std_dev"],
-    # indicator_dict["variance"],
-    # indicator_dict["skewness"],
-  ]
+  return [indicator_dict[name] for name in INDICATOR_VECTOR_NAMES]
 
+@instrument(counters=lambda result, signalMatrix, *args, **kwargs: {"items": len(result)})
 def calculateIndicatorsMatrix(signalMatrix: list) -> list:
   """
     Interface Indicator
@@ -110,18 +163,50 @@ def calculateIndicatorsMatrix(signalMatrix: list) -> list:
       kurtosis: number  -  Kurtosis
       crest_factor: number  -  Crest Factor
       k_factor: number  -  K Factor
+
+  Computed for the whole matrix at once (see indicators.py), one row of
+  INDICATOR_VECTOR_NAMES per signal. signalMatrix may also be a SharedMatrixHandle
+  (see importSignalList(shared=...)), read in place, or a ReducedSignalMatrix
+  (see importSignalList(precision=...)).
+  """
+
+  if isinstance(signalMatrix, ReducedSignalMatrix):
+    indicatorBatch = calculateReducedIndicators(signalMatrix)
+  else:
+    indicatorBatch = calculateIndicatorsBatch(signalMatrix)
+  return indicatorBatch[:, indicatorColumns(INDICATOR_VECTOR_NAMES)].tolist()
+
+def selectRelevantIndicatorsUsingSBS(matricesOfIndicatorMatrix: list, desiredRelevantIndicatorLength: int) -> list:
+  """
+  Selects relevant indicators with Sequential Backward Selection on the Fisher criterion
+  J = DISP_INTER / DISP_INTRA of the MATLAB code below (see sbs.py).
+
+  Args:
+    matricesOfIndicatorMatrix (list | FeatureDataset): One (n_samples, n_indicators) matrix per class, or a dataset.
+    desiredRelevantIndicatorLength (int): The target number of indicators to keep.
+
+  Returns:
+    list | FeatureDataset: The input restricted to the selected indicators (original column order).
   """
-  
-  return [calculateIndicatorsVector(signal) for signal in signalMatrix]
 
-# def selectRelevantIndicatorsUsingSBS(matricesOfIndicatorMatrix: list, desiredRelevantIndicatorLength: int) -> list:
-#   # initialIndicatorsLength = len(matricesOfIndicatorMatrix[0])
-#   # dataLength = len(matricesOfIndicatorMatrix[0][0])
+  if not isinstance(matricesOfIndicatorMatrix, (list, FeatureDataset)): raise TypeError("Input 'matricesOfIndicatorMatrix' must be a list or a FeatureDataset.")
+  if not isinstance(desiredRelevantIndicatorLength, int): raise TypeError("Input 'desiredRelevantIndicatorLength' must be an integer.")
+  if desiredRelevantIndicatorLength < 0: raise ValueError("desiredRelevantIndicatorLength cannot be negative.")
 
-#   # finalIndicatorsLength = desiredRelevantIndicatorLength
+  selected = selectRelevantIndicatorIndicesUsingSBS(matricesOfIndicatorMatrix, desiredRelevantIndicatorLength)
+  if isinstance(matricesOfIndicatorMatrix, FeatureDataset):
+    return matricesOfIndicatorMatrix.select(selected)
+  return [np.asarray(matrix, dtype=float)[:, selected].tolist() for matrix in matricesOfIndicatorMatrix]
 
-#   # for k in range(initialRowLength):
-#   #MatlabCode
+def selectRelevantIndicatorIndicesUsingSBS(matricesOfIndicatorMatrix: list, desiredRelevantIndicatorLength: int) -> list:
+  """
+  Column indices kept by selectRelevantIndicatorsUsingSBS, ascending.
+  """
+  if isinstance(matricesOfIndicatorMatrix, FeatureDataset):
+    matricesOfIndicatorMatrix = matricesOfIndicatorMatrix.classMatrices()
+  return fisherSBS(matricesOfIndicatorMatrix, desiredRelevantIndicatorLength)["selected"]
+
+# MatlabCode
 # # % % définition des variable d’entrée
 # # n = 70;
 # # M = 3;
@@ -164,8 +249,8 @@ def calculateIndicatorsMatrix(signalMatrix: list) -> list:
 # #     POS= find(J==max(J));
 # #     SERIE_INDICATEUR (POS(1)) = [];
 # # end
-#   return   
 
+@instrument(counters=lambda result, matrices, *args, **kwargs: {"items": len(matrices) if isinstance(matrices, FeatureDataset) else sum(len(matrix) for matrix in matrices)})
 def selectRelevantIndicators(matricesOfIndicatorMatrix: list, desiredRelevantIndicatorLength: int) -> list:
     """
     Selects relevant indicators from a list of indicator matrices using Sequential Backward Selection (SBS).
@@ -173,8 +258,8 @@ def selectRelevantIndicators(matricesOfIndicatorMatrix: list, desiredRelevantInd
     in all provided matrices are removed first.
 
     Args:
-        matricesOfIndicatorMatrix (list): 
-            A list of matrices. Each matrix is expected to be a list of samples (rows), 
+        matricesOfIndicatorMatrix (list | FeatureDataset): 
+            A FeatureDataset, or a list of matrices. Each matrix is expected to be a list of samples (rows), 
             where each sample is a list of numerical indicator values (columns).
             Example: [[[feat1, feat2], [feat1, feat2]], [[feat1, feat2]]]
                      (A list containing two matrices, one with 2 samples, one with 1 sample, both 2 features)
@@ -184,10 +269,11 @@ def selectRelevantIndicators(matricesOfIndicatorMatrix: list, desiredRelevantInd
             The target number of indicators to keep. Must be non-negative.
 
     Returns:
-        list: 
+        list | FeatureDataset: 
             A list of matrices, structured like the input, but each inner matrix will 
             contain only the 'desiredRelevantIndicatorLength' most relevant indicators (columns).
             Returns empty lists or matrices with zero columns if appropriate (e.g., desired length is 0).
+            A FeatureDataset input gives a FeatureDataset of the selected columns.
 
     Raises:
         TypeError: If inputs are not of the expected types.
@@ -196,10 +282,19 @@ def selectRelevantIndicators(matricesOfIndicatorMatrix: list, desiredRelevantInd
     """
 
 
-    if not isinstance(matricesOfIndicatorMatrix, list): raise TypeError("Input 'matricesOfIndicatorMatrix' must be a list.")
+    if not isinstance(matricesOfIndicatorMatrix, (list, FeatureDataset)): raise TypeError("Input 'matricesOfIndicatorMatrix' must be a list or a FeatureDataset.")
     if not isinstance(desiredRelevantIndicatorLength, int): raise TypeError("Input 'desiredRelevantIndicatorLength' must be an integer.")
     if desiredRelevantIndicatorLength < 0: raise ValueError("desiredRelevantIndicatorLength cannot be negative.")
 
+    if isinstance(matricesOfIndicatorMatrix, FeatureDataset):
+        # Variances do not change as columns are removed: removing the lowest one at a
+        # time keeps the highest ones (ties removed lowest index first, as below).
+        dataset = matricesOfIndicatorMatrix
+        desiredRelevantIndicatorLength = min(desiredRelevantIndicatorLength, dataset.shape[1])
+        variances = dataset.features.var(axis=0) if len(dataset) else np.zeros(dataset.shape[1])
+        removed = np.argsort(variances, kind="stable")[:dataset.shape[1] - desiredRelevantIndicatorLength]
+        return dataset.select(sorted(set(range(dataset.shape[1])) - set(removed.tolist())))
+
     if not matricesOfIndicatorMatrix: return []
 
     np_matrices = []
@@ -328,68 +423,62 @@ def selectRelevantIndicators(matricesOfIndicatorMatrix: list, desiredRelevantInd
         
     return output_matrices
 
-def neuralNetwork2LayersTraining(inputList: list, desiredOutputs: list) -> list:
+def neuralNetwork2LayersTraining(inputList: list, desiredOutputs: list = None, batchSize: int = 1, optimizer: str = "sgd", **options) -> list:
   """
   Neural network 2 layers.
   No hidden layers.
+  Trained on whole mini-batches at once (see network.py).
 
   Args:
-    inputList (list): List of input vectors.
-    desiredOutputs (list): List of desired output vectors.
+    inputList (list | FeatureDataset): List of input vectors, or a dataset.
+    desiredOutputs (list): List of desired output vectors. Defaults to the one-hot labels of a dataset.
+    batchSize (int): Samples per update. Defaults to 1, the original per-sample updates.
+    optimizer (str): "sgd" (default), "momentum" or "adam".
+    **options: Other trainNetwork2Layers options (epochs, learningRate, validationSplit, patience, seed...).
   Returns:
     list: List of weights for the neural network.
     list: List of biases for the neural network.
   """
 
-  observationLength = len(inputList[0])
-  outputLength = len(desiredOutputs[0])
-
-  # Initialize weights
-  weightsL1 = np.random.rand(observationLength, observationLength)
-  biasesL1 = np.random.rand(observationLength)
-
-  weightsL2 = np.random.rand(observationLength, outputLength)
-  biasesL2 = np.random.rand(outputLength)
+  if isinstance(inputList, FeatureDataset):
+    if desiredOutputs is None:
+      desiredOutputs = inputList.oneHot()
+    inputList = inputList.features
+  if desiredOutputs is None: raise TypeError("desiredOutputs is required unless inputList is a FeatureDataset.")
 
-  learningRate = 0.01
-  # Training loop
-  for epoch in range(1000):
-    for i in range(len(inputList)):
-      # Forward pass
-      inputVector = inputList[i]
-      desiredOutput = desiredOutputs[i]
+  options.setdefault("epochs", 1000)
+  options.setdefault("learningRate", 0.01)
 
-      # Layer 1
-      layer1Output = np.dot(inputVector, weightsL1) + biasesL1
-      layer1Output = np.tanh(layer1Output)
+  weights, _history = trainNetwork2Layers(inputList, desiredOutputs, batchSize=batchSize, optimizer=optimizer, **options)
+  return weights
 
-      # Layer 2
-      layer2Output = np.dot(layer1Output, weightsL2) + biasesL2
-      layer2Output = np.tanh(layer2Output)
 
-      # Backward pass
-      error = desiredOutput - layer2Output
-
-      # Calculate gradients
-      dLayer2 = error * (1 - layer2Output ** 2)
-      dLayer1 = np.dot(dLayer2, weightsL2.T) * (1 - layer1Output ** 2)
-
-      # Update weights and biases
-      weightsL2 += learningRate * np.outer(layer1Output, dLayer2)
-      biasesL2 += learningRate * dLayer2
+def neuralNetwork2LayersProduction(weights: list, inputs: list, numberOfOutputs) -> list:
+  """
+  Classify observations with trained weights (see Network2LayersPredictor in network.py
+  to keep the predictor and its buffers across calls).
 
-      weightsL1 += learningRate * np.outer(inputVector, dLayer1)
-      biasesL1 += learningRate * dLayer1
+  Args:
+    weights (list): [weightsL1, biasesL1, weightsL2, biasesL2] from neuralNetwork2LayersTraining.
+    inputs (list): List of input vectors.
+    numberOfOutputs (int): Expected number of outputs (classes) of the network.
+  Returns:
+    list: Softmax probabilities, one vector per input.
+  """
 
-  return [weightsL1, biasesL1, weightsL2, biasesL2]
+  predictor = Network2LayersPredictor(weights, capacity=max(1, len(inputs)))
+  if predictor.outputSize != numberOfOutputs:
+    raise ValueError(f"The network has {predictor.outputSize} outputs, expected {numberOfOutputs}.")
 
+  probabilities, _labels = predictor.predict(inputs)
+  return probabilities.tolist()
 
-def neuralNetwork2LayersProduction(weights: list, inputs: list, numberOfOutputs) -> list:
-  """
-  Neural network with 3 inputs and 3 outputs.
-  No hidden layers.
-  """
-  pass
+REDUCER_CLASS_LABELS = [
+  "1-roulement-sain-pignon-sain",
+  "2-roulement-defaut-pignon-sain",
+  "3-roulement-sain-pignon-defaut",
+  "4-roulement-defaut-pignon-defaut",
+]
 
 def repeat_list_elements(element: list, repetitions: int) -> list:
   output_list = []
@@ -398,90 +487,80 @@ def repeat_list_elements(element: list, repetitions: int) -> list:
   return output_list
 
 
-signalMatrix1 = importSignalList("./tp-reducer/data/1-roulement-sain-pignon-sain/")
-signalMatrix2 = importSignalList("./tp-reducer/data/2-roulement-defaut-pignon-sain/")
-signalMatrix3 = importSignalList("./tp-reducer/data/3-roulement-sain-pignon-defaut/")
-signalMatrix4 = importSignalList("./tp-reducer/data/4-roulement-defaut-pignon-defaut/")
-
-print()
-print("signalMatrix1", len(signalMatrix1))
-print("signalMatrix2", len(signalMatrix2))
-print("signalMatrix3", len(signalMatrix3))
-print("signalMatrix4", len(signalMatrix4))
-
-indicatorMatrix1 = [calculateIndicatorsVector(signal) for signal in signalMatrix1]
-indicatorMatrix2 = [calculateIndicatorsVector(signal) for signal in signalMatrix2]
-indicatorMatrix3 = [calculateIndicatorsVector(signal) for signal in signalMatrix3]
-indicatorMatrix4 = [calculateIndicatorsVector(signal) for signal in signalMatrix4]
-
-print()
-print("indicatorMatrix1 dimensions", len(indicatorMatrix1), len(indicatorMatrix1[0]))
-print("indicatorMatrix2 dimensions", len(indicatorMatrix2), len(indicatorMatrix2[0]))
-print("indicatorMatrix3 dimensions", len(indicatorMatrix3), len(indicatorMatrix3[0]))
-print("indicatorMatrix4 dimensions", len(indicatorMatrix4), len(indicatorMatrix4[0]))
-
-matrixOfIndicatorMatrices = [
-  indicatorMatrix1, # 1-roulement-sain-pignon-sain
-  indicatorMatrix2, # 2-roulement-defaut-pignon-sain
-  indicatorMatrix3, # 3-roulement-sain-pignon-defaut
-  indicatorMatrix4, # 4-roulement-defaut-pignon-defaut
-]
-
-relevantIndicatorMatrix = selectRelevantIndicators(matrixOfIndicatorMatrices, 3)
-
-print()
-print("relevantIndicatorMatrix dimensions", len(relevantIndicatorMatrix), len(relevantIndicatorMatrix[0]))
-print("relevantIndicatorMatrix[0] dimensions", len(relevantIndicatorMatrix[0]), len(relevantIndicatorMatrix[0][0]))
-print("relevantIndicatorMatrix[1] dimensions", len(relevantIndicatorMatrix[1]), len(relevantIndicatorMatrix[1][0]))
-print("relevantIndicatorMatrix[2] dimensions", len(relevantIndicatorMatrix[2]), len(relevantIndicatorMatrix[2][0]))
-print("relevantIndicatorMatrix[3] dimensions", len(relevantIndicatorMatrix[3]), len(relevantIndicatorMatrix[3][0]))
-
-dataLength = len(relevantIndicatorMatrix[0])
-splitRatio = 0.7
-splitIndex = int(dataLength * splitRatio)
-
-trainingDataMatrix = [
-    relevantIndicatorMatrix[0][:splitIndex], # 1-roulement-sain-pignon-sain
-    relevantIndicatorMatrix[1][:splitIndex], # 2-roulement-defaut-pignon-sain
-    relevantIndicatorMatrix[2][:splitIndex], # 3-roulement-sain-pignon-defaut
-    relevantIndicatorMatrix[3][:splitIndex], # 4-roulement-defaut-pignon-defaut
-]
-desiredOutputsMatrix = [
-    repeat_list_elements([1, 0, 0], splitIndex), # 1-roulement-sain-pignon-sain
-    repeat_list_elements([0, 1, 0], splitIndex), # 2-roulement-defaut-pignon-sain
-    repeat_list_elements([0, 0, 1], splitIndex), # 3-roulement-sain-pignon-defaut
-    repeat_list_elements([0, 0, 1], splitIndex), # 4-roulement-defaut-pignon-defaut
-]
-
-trainingData = sum(trainingDataMatrix, [])
-desiredOutputs = sum(desiredOutputsMatrix, [])
-
-testingDataMatrix = [
-  relevantIndicatorMatrix[0][splitIndex:], # 1-roulement-sain-pignon-sain
-  relevantIndicatorMatrix[1][splitIndex:], # 2-roulement-defaut-pignon-sain
-  relevantIndicatorMatrix[2][splitIndex:], # 3-roulement-sain-pignon-defaut
-  relevantIndicatorMatrix[3][splitIndex:], # 4-roulement-defaut-pignon-defaut
-]
-testingData = sum(testingDataMatrix, [])
-
-print()
-print("trainingDataMatrix dimensions", len(trainingDataMatrix), len(trainingDataMatrix[0]))
-print("trainingData dimensions", len(trainingData), len(trainingData[0]))
-
-print()
-print("desiredOutputsMatrix dimensions", len(desiredOutputsMatrix), len(desiredOutputsMatrix[0]))
-print("desiredOutputs dimensions", len(desiredOutputs), len(desiredOutputs[0]))
-print("desiredOutputs dimensions", desiredOutputs[0])
-
-print()
-print("testingDataMatrix dimensions", len(testingDataMatrix), len(testingDataMatrix[0]))
-print("testingData dimensions", len(testingData), len(testingData[0]))
-
-# Train the neural network
-[weightsL1, biasesL1, weightsL2, biasesL2] = neuralNetwork2LayersTraining(trainingData, desiredOutputs)
-
-print()
-print("weightsL1 dimensions", len(weightsL1))
-print("biasesL1 dimensions", len(biasesL1))
-print("weightsL2 dimensions", len(weightsL2))
-print("biasesL2 dimensions", len(biasesL2))
+if __name__ == "__main__":
+  indicatorCache = IndicatorCache("./tp-reducer/.indicator-cache")
+
+  indicatorMatrix1 = importIndicatorMatrix("./tp-reducer/data/1-roulement-sain-pignon-sain/", indicatorCache)
+  indicatorMatrix2 = importIndicatorMatrix("./tp-reducer/data/2-roulement-defaut-pignon-sain/", indicatorCache)
+  indicatorMatrix3 = importIndicatorMatrix("./tp-reducer/data/3-roulement-sain-pignon-defaut/", indicatorCache)
+  indicatorMatrix4 = importIndicatorMatrix("./tp-reducer/data/4-roulement-defaut-pignon-defaut/", indicatorCache)
+  indicatorCache.flush()
+
+  print()
+  print("indicatorCache", indicatorCache.stats())
+
+  print()
+  print("indicatorMatrix1 dimensions", len(indicatorMatrix1), len(indicatorMatrix1[0]))
+  print("indicatorMatrix2 dimensions", len(indicatorMatrix2), len(indicatorMatrix2[0]))
+  print("indicatorMatrix3 dimensions", len(indicatorMatrix3), len(indicatorMatrix3[0]))
+  print("indicatorMatrix4 dimensions", len(indicatorMatrix4), len(indicatorMatrix4[0]))
+
+  matrixOfIndicatorMatrices = FeatureDataset.fromClassMatrices([
+    indicatorMatrix1, # 1-roulement-sain-pignon-sain
+    indicatorMatrix2, # 2-roulement-defaut-pignon-sain
+    indicatorMatrix3, # 3-roulement-sain-pignon-defaut
+    indicatorMatrix4, # 4-roulement-defaut-pignon-defaut
+  ], INDICATOR_VECTOR_NAMES, REDUCER_CLASS_LABELS)
+
+  relevantIndicatorMatrix = selectRelevantIndicatorsUsingSBS(matrixOfIndicatorMatrices, 3)
+  relevantIndicatorNames = relevantIndicatorMatrix.featureNames
+
+  print()
+  print("relevantIndicatorNames", relevantIndicatorNames)
+  print("relevantIndicatorMatrix dimensions", relevantIndicatorMatrix.shape)
+  print("relevantIndicatorMatrix class dimensions", relevantIndicatorMatrix.classCounts.tolist())
+
+  splitRatio = 0.7
+  trainingData, testingData = relevantIndicatorMatrix.split(splitRatio)
+
+  print()
+  print("trainingData dimensions", trainingData.shape)
+  print("testingData dimensions", testingData.shape)
+
+  # Normalise with the training statistics
+  trainingMean = trainingData.features.mean(axis=0)
+  trainingScale = trainingData.features.std(axis=0)
+  trainingScale[trainingScale == 0] = 1.0
+  normalizedTrainingData = (trainingData.features - trainingMean) / trainingScale
+
+  # Train the neural network
+  [weightsL1, biasesL1, weightsL2, biasesL2] = neuralNetwork2LayersTraining(normalizedTrainingData, trainingData.oneHot(), batchSize=16, optimizer="momentum")
+
+  print()
+  print("weightsL1 dimensions", len(weightsL1))
+  print("biasesL1 dimensions", len(biasesL1))
+  print("weightsL2 dimensions", len(weightsL2))
+  print("biasesL2 dimensions", len(biasesL2))
+
+  # Save the pipeline, reloaded by a new process in milliseconds with loadPipeline
+  pipeline = PipelineArtifact(
+    [(weightsL1, biasesL1), (weightsL2, biasesL2)],
+    relevantIndicatorNames,
+    REDUCER_CLASS_LABELS,
+    trainingMean,
+    trainingScale,
+  )
+  savePipeline("./tp-reducer/pipeline.npz", pipeline)
+
+  # Classify the testing data
+  testingProbabilities, testingPredictions = pipeline.classify(testingData.features)
+
+  print()
+  print("testingProbabilities dimensions", len(testingProbabilities), len(testingProbabilities[0]))
+  print("testing accuracy", np.mean(testingPredictions == testingData.labels))
+
+  # MPP_METRICS=1 python tp-reducer/reducer.py records every stage (see metrics.py)
+  if metricsEnabled():
+    writeChromeTrace("./tp-reducer/trace.json")
+    print()
+    print(prometheusSnapshot())
@@ -0,0 +1,124 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from metrics import instrument
+
+"""
+  Sequential Backward Selection with the Fisher criterion of the TP (txt.txt, reducer.py):
+    J = DISP_INTER / DISP_INTRA
+    DISP_INTRA = sum_i sum_j ||X_ij - g_i||^2   (g_i: centroid of class i)
+    DISP_INTER = sum_i ||g_i - g||^2            (g: mean of the class centroids)
+  Both are sums over features, so with the per-feature scatters w_f and b_f computed once,
+  removing feature f from a subset S gives J = (B_S - b_f) / (W_S - w_f) in O(1).
+
+  Interface SBSResult
+    selected: list  -  Kept feature indices, ascending
+    removalOrder: list  -  Removed feature indices, first removed first
+    criterion: list  -  J of the subset after 0, 1, 2... removals
+"""
+
+
+def classScatters(classMatrices: list):
+  """
+  Per-feature within-class and between-class scatter.
+
+  Args:
+    classMatrices (list): One (n_samples_i, n_features) matrix per class.
+
+  Returns:
+    np.ndarray: within (n_features,)  -  sum over classes and samples of (x - g_i)^2
+    np.ndarray: between (n_features,)  -  sum over classes of (g_i - g)^2
+    np.ndarray: centroids (n_classes, n_features)
+  """
+
+  classMatrices = [np.asarray(matrix, dtype=np.float64) for matrix in classMatrices]
+  if not classMatrices: raise ValueError("At least one class matrix is required.")
+  featureCount = classMatrices[0].shape[1]
+  for i, matrix in enumerate(classMatrices):
+    if matrix.ndim != 2 or matrix.shape[1] != featureCount:
+      raise ValueError(f"Class {i} has shape {matrix.shape}, expected (n_samples, {featureCount}).")
+    if matrix.shape[0] == 0:
+      raise ValueError(f"Class {i} has no samples.")
+
+  centroids = np.stack([matrix.mean(axis=0) for matrix in classMatrices])
+  within = np.zeros(featureCount)
+  for matrix, centroid in zip(classMatrices, centroids):
+    centered = matrix - centroid
+    within += np.einsum('ij,ij->j', centered, centered)
+
+  spread = centroids - centroids.mean(axis=0)
+  between = np.einsum('ij,ij->j', spread, spread)
+  return within, between, centroids
+
+
+@instrument(counters=lambda result, classMatrices, *args, **kwargs: {"items": sum(len(matrix) for matrix in classMatrices)})
+def fisherSBS(classMatrices: list, desiredLength: int, standardize: bool = False) -> dict:
+  """
+  Remove, one at a time, the feature whose removal gives the highest J,
+  until desiredLength features remain.
+
+  Args:
+    classMatrices (list): One (n_samples_i, n_features) matrix per class.
+    desiredLength (int): Number of features to keep.
+    standardize (bool): Scale every feature to unit global variance first. The TP criterion
+      works on raw values (False), where large-valued features like energy dominate.
+
+  Returns:
+    dict: SBSResult.
+  """
+
+  classMatrices = [np.asarray(matrix, dtype=np.float64) for matrix in classMatrices]
+  if desiredLength < 0: raise ValueError("desiredLength cannot be negative.")
+
+  if standardize:
+    scale = np.concatenate(classMatrices).std(axis=0)
+    scale[scale == 0] = 1.0
+    classMatrices = [matrix / scale for matrix in classMatrices]
+
+  within, between, _ = classScatters(classMatrices)
+  return fisherSBSFromScatters(within, between, desiredLength)
+
+
+def fisherSBSFromScatters(within, between, desiredLength: int) -> dict:
+  """
+  fisherSBS on per-feature scatters already computed (see classScatters), e.g. kept
+  up to date from running class statistics.
+
+  Returns:
+    dict: SBSResult.
+  """
+
+  within = np.asarray(within, dtype=np.float64)
+  between = np.asarray(between, dtype=np.float64)
+  if desiredLength < 0: raise ValueError("desiredLength cannot be negative.")
+  featureCount = within.shape[0]
+  desiredLength = min(desiredLength, featureCount)
+
+  remaining = np.ones(featureCount, dtype=bool)
+  totalWithin, totalBetween = within.sum(), between.sum()
+  removalOrder = []
+  criterion = [totalBetween / totalWithin if totalWithin else np.inf]
+
+  for _ in range(featureCount - desiredLength):
+    with np.errstate(divide='ignore', invalid='ignore'):
+      candidates = (totalBetween - between) / (totalWithin - within)
+    candidates[~remaining] = -np.inf
+    candidates[np.isnan(candidates)] = -np.inf
+    position = int(np.argmax(candidates))
+    if not remaining[position]:
+      position = int(np.flatnonzero(remaining)[0])
+
+    remaining[position] = False
+    totalWithin -= within[position]
+    totalBetween -= between[position]
+    removalOrder.append(position)
+    criterion.append(float(candidates[position]))
+
+  return {
+    "selected": np.flatnonzero(remaining).tolist(),
+    "removalOrder": removalOrder,
+    "criterion": criterion,
+  }
@@ -0,0 +1,36 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import time
+
+import numpy as np
+
+from sbs import fisherSBS
+
+
+def naiveFisherSBS(classMatrices, desiredLength):
+  """Direct transcription of the MATLAB loop (txt.txt)."""
+  series = list(range(classMatrices[0].shape[1]))
+  while len(series) > desiredLength:
+    criterion = []
+    for position in range(len(series)):
+      select = series[:position] + series[position + 1:]
+      X = [matrix[:, select] for matrix in classMatrices]
+      intra = sum(((x - x.mean(axis=0)) ** 2).sum() for x in X)
+      g = sum(x.mean(axis=0) for x in X) / len(X)
+      inter = sum(((x.mean(axis=0) - g) ** 2).sum() for x in X)
+      criterion.append(inter / intra)
+    del series[int(np.argmax(criterion))]
+  return series
+
+
+rng = np.random.default_rng(1)
+classMatrices = [rng.normal(rng.normal(0, 2, 12), rng.uniform(0.5, 3, 12), size=(60, 12)) for _ in range(4)]
+assert fisherSBS(classMatrices, 3)["selected"] == naiveFisherSBS(classMatrices, 3)
+
+classMatrices = [rng.normal(rng.normal(0, 1, 300), 1.0, size=(70, 300)) for _ in range(4)]
+start = time.perf_counter()
+result = fisherSBS(classMatrices, 3)
+print(f"fisherSBS 300 -> 3 features in {(time.perf_counter() - start) * 1e3:.1f} ms, J {result['criterion'][0]:.3f} -> {result['criterion'][-1]:.3f}")
+assert len(result["removalOrder"]) == 297 and len(result["criterion"]) == 298
@@ -0,0 +1,214 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+"""
+  Wrapper feature selection: subsets are scored by a classifier instead of a
+  filter criterion. All candidates of one step are scored in parallel on a
+  process pool, and every score is memoized by frozenset(features) so SBS, SFS
+  and floating variants never evaluate the same subset twice.
+
+  Interface Scorer: callable(features: tuple) -> float  (higher is better, must be picklable)
+
+  Interface SelectionResult
+    selected: list  -  Kept feature indices, ascending
+    order: list  -  ("add" | "remove", feature) for each step, in order
+    criterion: list  -  Score of the subset after each step
+    stoppedEarly: bool  -  True when the score stopped improving before desiredLength
+"""
+
+
+class HoldoutScorer:
+  """
+  Nearest-centroid accuracy on a per-class train/test split.
+
+  Args:
+    classMatrices (list): One (n_samples_i, n_features) matrix per class.
+    splitRatio (float): Share of every class used to place the centroids.
+  """
+
+  def __init__(self, classMatrices: list, splitRatio: float = 0.7):
+    trainParts, testParts, labels = [], [], []
+    for label, matrix in enumerate(classMatrices):
+      matrix = np.asarray(matrix, dtype=np.float64)
+      splitIndex = int(matrix.shape[0] * splitRatio)
+      trainParts.append(matrix[:splitIndex])
+      testParts.append(matrix[splitIndex:])
+      labels.append(np.full(matrix.shape[0] - splitIndex, label))
+
+    # Standardize with the training statistics so every feature weighs the same.
+    train = np.concatenate(trainParts)
+    mean, scale = train.mean(axis=0), train.std(axis=0)
+    scale[scale == 0] = 1.0
+    self.centroids = np.stack([((part - mean) / scale).mean(axis=0) for part in trainParts])
+    self.test = (np.concatenate(testParts) - mean) / scale
+    self.labels = np.concatenate(labels)
+
+  def __call__(self, features: tuple) -> float:
+    features = list(features)
+    if not features:
+      return 0.0
+    test = self.test[:, features]
+    centroids = self.centroids[:, features]
+    distances = (
+      np.einsum('ij,ij->i', test, test)[:, None]
+      - 2 * test @ centroids.T
+      + np.einsum('ij,ij->i', centroids, centroids)[None, :]
+    )
+    return float(np.mean(np.argmin(distances, axis=1) == self.labels))
+
+
+class SubsetScoreCache:
+  """
+  Memo of subset scores, keyed by frozenset of feature indices.
+  """
+
+  def __init__(self):
+    self.scores = {}
+    self.hits = 0
+    self.misses = 0
+
+  def get(self, subset):
+    key = frozenset(subset)
+    if key in self.scores:
+      self.hits += 1
+      return self.scores[key]
+    self.misses += 1
+    return None
+
+  def put(self, subset, score: float):
+    self.scores[frozenset(subset)] = score
+
+
+_workerScorer = None
+
+
+def _initWorker(scorer):
+  global _workerScorer
+  _workerScorer = scorer
+
+
+def _scoreInWorker(features: tuple) -> float:
+  return _workerScorer(features)
+
+
+class WrapperSelector:
+  """
+  Drives SBS, SFS and SFFS over a scorer.
+
+  Args:
+    scorer (Scorer): Subset scoring function.
+    featureCount (int): Number of candidate features.
+    workers (int): Process pool size. Defaults to os.cpu_count(); 1 scores in the calling process.
+    cache (SubsetScoreCache): Shared memo, e.g. to reuse scores between SBS and SFS runs.
+    tolerance (float): Stop early when the best candidate of a step scores lower than
+      the current subset minus tolerance. None (default) always runs to desiredLength.
+  """
+
+  def __init__(self, scorer, featureCount: int, workers: int = None, cache: SubsetScoreCache = None, tolerance: float = None):
+    self.scorer = scorer
+    self.featureCount = featureCount
+    self.workers = workers or os.cpu_count() or 1
+    self.cache = cache if cache is not None else SubsetScoreCache()
+    self.tolerance = tolerance
+    self._pool = None
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def close(self):
+    if self._pool is not None:
+      self._pool.shutdown()
+      self._pool = None
+
+  def scoreSubsets(self, subsets: list) -> list:
+    """
+    Score subsets, evaluating only the ones missing from the cache (in parallel).
+    """
+
+    subsets = [tuple(sorted(subset)) for subset in subsets]
+    scores = [self.cache.get(subset) for subset in subsets]
+    missing = list(dict.fromkeys(subset for subset, score in zip(subsets, scores) if score is None))
+
+    if missing:
+      if self.workers == 1 or len(missing) == 1:
+        computed = [self.scorer(subset) for subset in missing]
+      else:
+        if self._pool is None:
+          # The scorer (and its data) is sent once per worker, tasks only carry indices.
+          self._pool = ProcessPoolExecutor(self.workers, initializer=_initWorker, initargs=(self.scorer,))
+        computed = list(self._pool.map(_scoreInWorker, missing))
+      for subset, score in zip(missing, computed):
+        self.cache.put(subset, score)
+
+    return [self.cache.scores[frozenset(subset)] for subset in subsets]
+
+  def _shouldStop(self, best: float, current: float) -> bool:
+    return self.tolerance is not None and best < current - self.tolerance
+
+  def backward(self, desiredLength: int, start: list = None) -> dict:
+    """
+    Sequential Backward Selection: remove the feature whose removal scores best.
+    """
+
+    selected = list(start) if start is not None else list(range(self.featureCount))
+    current = self.scoreSubsets([selected])[0]
+    order, criterion, stoppedEarly = [], [current], False
+
+    while len(selected) > desiredLength:
+      candidates = [[feature for feature in selected if feature != removed] for removed in selected]
+      scores = self.scoreSubsets(candidates)
+      position = int(np.argmax(scores))
+      if self._shouldStop(scores[position], current):
+        stoppedEarly = True
+        break
+      order.append(("remove", selected.pop(position)))
+      current = scores[position]
+      criterion.append(current)
+
+    return {"selected": sorted(selected), "order": order, "criterion": criterion, "stoppedEarly": stoppedEarly}
+
+  def forward(self, desiredLength: int, floating: bool = False) -> dict:
+    """
+    Sequential Forward Selection; with floating=True, SFFS: after every addition,
+    features are removed again while that beats the best subset already seen at that size.
+    """
+
+    desiredLength = min(desiredLength, self.featureCount)
+    selected, order, criterion, stoppedEarly = [], [], [], False
+    current = float("-inf")
+    bestBySize = {}
+
+    while len(selected) < desiredLength:
+      additions = [feature for feature in range(self.featureCount) if feature not in selected]
+      scores = self.scoreSubsets([selected + [feature] for feature in additions])
+      position = int(np.argmax(scores))
+      if selected and self._shouldStop(scores[position], current):
+        stoppedEarly = True
+        break
+      selected.append(additions[position])
+      current = scores[position]
+      order.append(("add", additions[position]))
+      criterion.append(current)
+      bestBySize[len(selected)] = max(bestBySize.get(len(selected), float("-inf")), current)
+
+      while floating and len(selected) > 2:
+        removals = self.scoreSubsets([[feature for feature in selected if feature != removed] for removed in selected])
+        position = int(np.argmax(removals))
+        if removals[position] <= bestBySize.get(len(selected) - 1, float("-inf")):
+          break
+        removed = selected.pop(position)
+        current = removals[position]
+        order.append(("remove", removed))
+        criterion.append(current)
+        bestBySize[len(selected)] = current
+
+    return {"selected": sorted(selected), "order": order, "criterion": criterion, "stoppedEarly": stoppedEarly}
@@ -0,0 +1,29 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from selection import HoldoutScorer, SubsetScoreCache, WrapperSelector
+
+rng = np.random.default_rng(2)
+# Features 0-2 separate the 4 classes, the other 9 are noise.
+classMatrices = []
+for label in range(4):
+  informative = rng.normal(np.array([label, label % 2, label // 2]) * 3.0, 1.0, size=(70, 3))
+  classMatrices.append(np.hstack([informative, rng.normal(0, 1, size=(70, 9))]))
+
+cache = SubsetScoreCache()
+with WrapperSelector(HoldoutScorer(classMatrices), 12, workers=2, cache=cache) as selector:
+  backward = selector.backward(3)
+  forward = selector.forward(3, floating=True)
+
+print("backward", backward["selected"], backward["criterion"][-1])
+print("floating forward", forward["selected"], forward["criterion"][-1])
+print("cache hits", cache.hits, "misses", cache.misses)
+assert backward["criterion"][-1] >= 0.95 and forward["selected"] == [0, 1, 2]
+assert cache.hits > 0
+
+with WrapperSelector(HoldoutScorer(classMatrices), 12, workers=1, tolerance=0.0) as selector:
+  early = selector.backward(1)
+assert early["stoppedEarly"] and len(early["selected"]) > 1
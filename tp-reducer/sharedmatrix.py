@@ -0,0 +1,341 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import atexit
+import hashlib
+import itertools
+import os
+import secrets
+import signal
+import sys
+import tempfile
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+"""
+  Signal matrices shared between processes without pickling them.
+
+  shareMatrix copies a matrix once into a POSIX shared memory segment (or a file
+  mapped with np.memmap) and returns a SharedMatrixHandle: a few hundred bytes that
+  pickle to process pool workers, which attach to it as zero-copy NumPy views.
+
+  Lifecycle:
+    - The publishing process owns its segments: releaseMatrix frees one, and every
+      remaining one is freed at interpreter exit (atexit, and SIGTERM is turned into
+      a normal exit when it has no handler of its own).
+    - Killed owner: "shm" segments are also registered with the multiprocessing
+      resource tracker, which unlinks them when the owner dies. Segment and file names
+      carry the owner's scope (boot and pid namespace), pid and start time, and every
+      shareMatrix call removes those of dead owners of its own scope (removeStaleSegments),
+      which covers the "file" backing and a killed tracker. Segments of other containers
+      sharing /dev/shm, or of a reused pid, are never mistaken for stale ones.
+    - Pool workers only attach; they never free a segment they did not create.
+
+  Interface SharedMatrixHandle
+    name: string  -  Segment name (shm) or file path (file)
+    shape: tuple
+    dtype: string  -  NumPy dtype string, e.g. "<f8"
+    backing: string  -  "shm" or "file"
+    owner: number  -  pid of the publishing process
+"""
+
+BACKINGS = ("shm", "file")
+SEGMENT_PREFIX = "mpp_"
+SHM_DIRECTORY = "/dev/shm"
+
+_lock = threading.Lock()
+_counter = itertools.count()
+# name -> (backing object, array), for segments created or attached by this process.
+_owned = {}
+_attached = {}
+_exitHooksInstalled = False
+
+
+class SharedMatrixHandle:
+  __slots__ = ("name", "shape", "dtype", "backing", "owner")
+
+  def __init__(self, name: str, shape: tuple, dtype: str, backing: str, owner: int):
+    self.name = name
+    self.shape = tuple(shape)
+    self.dtype = dtype
+    self.backing = backing
+    self.owner = owner
+
+  def __getstate__(self):
+    return (self.name, self.shape, self.dtype, self.backing, self.owner)
+
+  def __setstate__(self, state):
+    self.name, self.shape, self.dtype, self.backing, self.owner = state
+
+  def __repr__(self):
+    return f"SharedMatrixHandle({self.name!r}, shape={self.shape}, dtype={self.dtype!r}, backing={self.backing!r})"
+
+  @property
+  def nbytes(self) -> int:
+    return int(np.prod(self.shape, dtype=np.int64)) * np.dtype(self.dtype).itemsize
+
+  def attach(self, writeable: bool = False) -> np.ndarray:
+    """
+    Zero-copy view on the matrix, see attachMatrix.
+    """
+    return attachMatrix(self, writeable)
+
+
+def _readProc(path: str):
+  try:
+    if path.startswith("/proc/self/ns/"):
+      return os.readlink(path)
+    with open(path) as file:
+      return file.read().strip()
+  except OSError:
+    return None
+
+
+def _processStart(pid: int) -> str:
+  """
+  Start time of a process in clock ticks since boot ("0" when /proc is not available).
+  """
+  stat = _readProc(f"/proc/{pid}/stat")
+  # Fields after the command name, which may itself contain spaces: starttime is the 20th.
+  return stat.rpartition(")")[2].split()[19] if stat else "0"
+
+
+def _computeScope() -> str:
+  """
+  Token of this boot and pid namespace: pids are only comparable within one scope.
+  "0" when /proc is not available (then nothing is ever swept).
+  """
+  bootId, namespace = _readProc("/proc/sys/kernel/random/boot_id"), _readProc("/proc/self/ns/pid")
+  if bootId is None or namespace is None:
+    return "0"
+  return hashlib.sha256(f"{bootId}:{namespace}".encode()).hexdigest()[:8]
+
+
+_scope = _computeScope()
+
+
+def _segmentName() -> str:
+  pid = os.getpid()
+  return f"{SEGMENT_PREFIX}{_scope}_{pid}_{_processStart(pid)}_{next(_counter)}_{secrets.token_hex(4)}"
+
+
+def _parseName(name: str):
+  """
+  (scope, pid, start) of a segment name, None for names of another format.
+  """
+  parts = os.path.basename(name)[len(SEGMENT_PREFIX):].split("_")
+  if len(parts) != 5 or not parts[1].isdigit():
+    return None
+  return parts[0], int(parts[1]), parts[2]
+
+
+def _ownerPid(name: str):
+  parsed = _parseName(name)
+  return parsed[1] if parsed is not None else None
+
+
+def _isOwnerAlive(pid: int, start: str) -> bool:
+  try:
+    os.kill(pid, 0)
+  except ProcessLookupError:
+    return False
+  except PermissionError:
+    pass
+  # A live process with another start time reused the pid of the dead owner.
+  current = _processStart(pid)
+  return current == "0" or start == "0" or current == start
+
+
+def _openSharedMemory(name: str) -> shared_memory.SharedMemory:
+  # From Python 3.13 attaching processes can opt out of the resource tracker.
+  if sys.version_info >= (3, 13):
+    return shared_memory.SharedMemory(name=name, track=False)
+  return shared_memory.SharedMemory(name=name)
+
+
+def _fileDirectory(directory: str = None) -> str:
+  # Prefer RAM-backed /dev/shm: the file is then as fast as a shm segment.
+  if directory is not None:
+    return directory
+  return SHM_DIRECTORY if os.path.isdir(SHM_DIRECTORY) and os.access(SHM_DIRECTORY, os.W_OK) else tempfile.gettempdir()
+
+
+def removeStaleSegments(directory: str = None) -> int:
+  """
+  Remove the segments and files left by dead owner processes of this scope (same boot
+  and pid namespace). Names of other scopes or formats are left alone.
+
+  Returns:
+    int: Number of segments removed.
+  """
+
+  removed = 0
+  if _scope == "0":
+    return removed
+  directories = {_fileDirectory(directory)}
+  if os.path.isdir(SHM_DIRECTORY):
+    directories.add(SHM_DIRECTORY)
+  for path in directories:
+    try:
+      names = os.listdir(path)
+    except OSError:
+      continue
+    for name in names:
+      if not name.startswith(SEGMENT_PREFIX):
+        continue
+      parsed = _parseName(name)
+      if parsed is None or parsed[0] != _scope or _isOwnerAlive(parsed[1], parsed[2]):
+        continue
+      try:
+        os.unlink(os.path.join(path, name))
+        removed += 1
+      except OSError:
+        pass
+  return removed
+
+
+def _onTerminate(signum, frame):
+  sys.exit(128 + signum)
+
+
+def _installExitHooks():
+  global _exitHooksInstalled
+  if _exitHooksInstalled:
+    return
+  _exitHooksInstalled = True
+  atexit.register(releaseAll)
+  if threading.current_thread() is threading.main_thread() and signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+    signal.signal(signal.SIGTERM, _onTerminate)
+
+
+def shareMatrix(matrix, backing: str = "shm", directory: str = None) -> SharedMatrixHandle:
+  """
+  Copy a matrix into a new shared segment owned by this process.
+
+  Args:
+    matrix: Array to publish (any shape and dtype).
+    backing (str): "shm" (multiprocessing.shared_memory) or "file" (np.memmap).
+    directory (str): Directory of "file" segments. Defaults to /dev/shm, or the temporary directory.
+
+  Returns:
+    SharedMatrixHandle: Picklable handle, see attachMatrix.
+  """
+
+  if backing not in BACKINGS: raise ValueError(f"Unknown backing '{backing}', expected one of {BACKINGS}.")
+  matrix = np.asarray(matrix)
+  _installExitHooks()
+  removeStaleSegments(directory)
+
+  name = _segmentName()
+  if backing == "shm":
+    segment = shared_memory.SharedMemory(name=name, create=True, size=max(matrix.nbytes, 1))
+    array = np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=segment.buf)
+  else:
+    name = os.path.join(_fileDirectory(directory), name)
+    segment = None
+    if matrix.nbytes:
+      array = np.memmap(name, dtype=matrix.dtype, mode="w+", shape=matrix.shape)
+    else:
+      open(name, "wb").close()
+      array = np.empty(matrix.shape, dtype=matrix.dtype)
+  array[...] = matrix
+
+  with _lock:
+    _owned[name] = (segment, array)
+  return SharedMatrixHandle(name, matrix.shape, matrix.dtype.str, backing, os.getpid())
+
+
+def attachMatrix(handle: SharedMatrixHandle, writeable: bool = False) -> np.ndarray:
+  """
+  Zero-copy view on a shared matrix. The mapping is opened once per process and kept
+  until releaseMatrix (or exit); the publishing process gets a view of its own copy.
+
+  Raises:
+    FileNotFoundError: If the segment was released.
+  """
+
+  with _lock:
+    entry = _owned.get(handle.name) or _attached.get(handle.name)
+  if entry is None:
+    dtype = np.dtype(handle.dtype)
+    if handle.backing == "shm":
+      segment = _openSharedMemory(handle.name)
+      array = np.ndarray(handle.shape, dtype=dtype, buffer=segment.buf)
+    else:
+      segment = None
+      if handle.nbytes:
+        array = np.memmap(handle.name, dtype=dtype, mode="r+", shape=handle.shape)
+      elif os.path.exists(handle.name):
+        array = np.empty(handle.shape, dtype=dtype)
+      else:
+        raise FileNotFoundError(handle.name)
+    with _lock:
+      entry = _attached.setdefault(handle.name, (segment, array))
+
+  view = entry[1].view()
+  view.flags.writeable = writeable
+  return view
+
+
+def _close(segment):
+  if segment is None:
+    return
+  try:
+    segment.close()
+  except BufferError:
+    # Views are still alive: the mapping goes away with them.
+    pass
+
+
+def releaseMatrix(handle: SharedMatrixHandle):
+  """
+  Owner: free the segment (views still alive stay valid until dropped).
+  Other processes: detach from it.
+  """
+
+  with _lock:
+    owned = _owned.pop(handle.name, None)
+    attached = _attached.pop(handle.name, None)
+  # Drop our own arrays first: close() refuses while they still export the buffer.
+  isOwner = owned is not None
+  attachedSegment = attached[0] if attached is not None else None
+  ownedSegment = owned[0] if isOwner else None
+  del owned, attached
+  _close(attachedSegment)
+  if not isOwner:
+    return
+
+  _close(ownedSegment)
+  try:
+    if handle.backing == "shm":
+      # unlink() also unregisters the segment from the resource tracker.
+      ownedSegment.unlink()
+    else:
+      os.unlink(handle.name)
+  except FileNotFoundError:
+    pass
+
+
+def releaseAll():
+  """
+  Free every segment owned by this process. Registered with atexit by shareMatrix.
+  Forked children inherit the registry but never free their parent's segments.
+  """
+
+  with _lock:
+    owned = [(name, "shm" if segment is not None else "file") for name, (segment, _array) in _owned.items()]
+  for name, backing in owned:
+    if _ownerPid(name) == os.getpid():
+      releaseMatrix(SharedMatrixHandle(name, (), "u1", backing, os.getpid()))
+
+
+def asMatrix(matrix) -> np.ndarray:
+  """
+  The array behind a SharedMatrixHandle (attached read-only), or the input unchanged.
+  """
+  if isinstance(matrix, SharedMatrixHandle):
+    return matrix.attach()
+  return matrix
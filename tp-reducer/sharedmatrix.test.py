@@ -0,0 +1,109 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from indicators import calculateIndicatorsBatch
+from reducer import calculateIndicatorsMatrix, importSignalList
+from sharedmatrix import _processStart, _scope, attachMatrix, releaseMatrix, removeStaleSegments, shareMatrix
+
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "1-roulement-sain-pignon-sain")
+
+
+def workerIndicators(task):
+  handle, start, stop = task
+  matrix = handle.attach()
+  assert not matrix.flags.writeable
+  return calculateIndicatorsBatch(matrix[start:stop])
+
+
+def workerWrite(handle):
+  handle.attach(writeable=True)[0, 0] = 42.0
+
+
+def segmentExists(handle) -> bool:
+  return os.path.exists(handle.name if handle.backing == "file" else os.path.join("/dev/shm", handle.name))
+
+
+matrix = importSignalList(data_dir)
+for backing in ("shm", "file"):
+  handle = importSignalList(data_dir, shared=backing)
+  assert handle.shape == matrix.shape and handle.nbytes == matrix.nbytes
+  assert len(pickle.dumps(handle)) < 512
+  assert np.array_equal(attachMatrix(handle), matrix)
+
+  # Handles are consumed directly and by pool workers, without pickling the signals.
+  expected = calculateIndicatorsBatch(matrix)
+  assert np.array_equal(calculateIndicatorsBatch(handle), expected)
+  assert calculateIndicatorsMatrix(handle) == calculateIndicatorsMatrix(matrix)
+  tasks = [(handle, start, min(start + 16, matrix.shape[0])) for start in range(0, matrix.shape[0], 16)]
+  with ProcessPoolExecutor(2) as pool:
+    assert np.array_equal(np.concatenate(list(pool.map(workerIndicators, tasks))), expected)
+    pool.submit(workerWrite, handle).result()
+  assert attachMatrix(handle)[0, 0] == 42.0
+
+  assert segmentExists(handle)
+  releaseMatrix(handle)
+  assert not segmentExists(handle)
+  try:
+    attachMatrix(handle)
+    raise AssertionError("expected FileNotFoundError")
+  except FileNotFoundError:
+    pass
+
+# Segments are freed on normal exit, on SIGTERM and, once the owner is gone, after a SIGKILL.
+with tempfile.TemporaryDirectory() as directory:
+  child = (
+    "import os, signal, sys, time, numpy as np\n"
+    "from sharedmatrix import shareMatrix\n"
+    f"handles = [shareMatrix(np.ones((4, 4))), shareMatrix(np.ones(3), 'file', {directory!r})]\n"
+    "print(handles[0].name, handles[1].name, flush=True)\n"
+    "mode = sys.argv[1]\n"
+    "if mode == 'term': os.kill(os.getpid(), signal.SIGTERM); time.sleep(5)\n"
+    "if mode == 'kill': os.kill(os.getpid(), signal.SIGKILL)\n"
+  )
+  environment = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+  for mode in ("exit", "term", "kill"):
+    result = subprocess.run([sys.executable, "-c", child, mode], capture_output=True, text=True, env=environment)
+    shmName, filePath = result.stdout.split()
+    if mode == "kill":
+      # The resource tracker unlinks the shm segment; the file waits for the next sweep.
+      deadline = time.time() + 5
+      while os.path.exists(os.path.join("/dev/shm", shmName)) and time.time() < deadline:
+        time.sleep(0.05)
+      assert os.path.exists(filePath)
+      assert removeStaleSegments(directory) >= 1
+    assert not os.path.exists(os.path.join("/dev/shm", shmName)), mode
+    assert not os.path.exists(filePath), mode
+    print(f"{mode}: segments removed")
+
+# Only dead owners of this boot and pid namespace are swept: another container's live
+# segments look dead from here, and a reused pid does not keep a dead owner's segments.
+with tempfile.TemporaryDirectory() as directory:
+  deadPid, pid = 2 ** 23, os.getpid()
+  names = {
+    f"mpp_{_scope}_{deadPid}_1_0_aa": False,
+    f"mpp_{_scope}_{pid}_{_processStart(pid)}_0_bb": True,
+    f"mpp_{_scope}_{pid}_1_0_cc": False,
+    f"mpp_0000ffff_{deadPid}_1_0_dd": True,
+    f"mpp_{deadPid}_0_ee": True,
+  }
+  for name in names:
+    open(os.path.join(directory, name), "wb").close()
+  assert removeStaleSegments(directory) >= 2
+  assert sorted(os.listdir(directory)) == sorted(name for name, kept in names.items() if kept)
+  print("stale segments of this scope removed")
+
+empty = shareMatrix(np.empty((0, 5)))
+assert attachMatrix(empty).shape == (0, 5)
+releaseMatrix(empty)
+print("sharedmatrix tests passed")
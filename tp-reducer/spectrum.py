@@ -0,0 +1,180 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from indicators import BLOCK_ROWS
+
+"""
+  Frequency-domain indicators, computed with a batched rfft over a
+  (n_signals, n_samples) matrix.
+
+  Interface SpectralIndicator
+    band_<lo>_<hi>: number  -  Energy of the band [lo, hi[ Hz
+    spectral_centroid: number  -  Power-weighted mean frequency
+    spectral_spread: number  -  Power-weighted standard deviation around the centroid
+    spectral_kurtosis: number  -  Fourth standardized moment of the power spectrum
+    envelope_<name>: number  -  Peak of the Hilbert envelope spectrum around a fault frequency
+
+  The first CSV column is the acquisition time stamp (see ee.m), not a shaft speed:
+  the rotation frequency is passed explicitly to scale fault orders.
+"""
+
+# Acquisition rate of the NI accelerometer (ee.m: s.Rate = 25.6e3).
+SAMPLING_RATE = 25600.0
+
+
+class SpectralAnalyzer:
+  """
+  Spectral indicator extractor for signals of one length.
+  Window, frequency axis, band masks and Hilbert multiplier are computed once
+  and reused for every batch.
+
+  Args:
+    length (int): Number of samples per signal.
+    samplingRate (float): Sampling rate in Hz.
+    bands (list): [(lo, hi), ...] in Hz. Defaults to 8 equal bands up to Nyquist.
+    faultFrequencies (dict): {name: frequency} for the envelope indicators. Frequencies are
+      in Hz, or in orders of rotationFrequency when it is given.
+    rotationFrequency (float): Shaft frequency in Hz, used to scale faultFrequencies.
+    envelopeBand (tuple): (lo, hi) Hz band demodulated for the envelope. Defaults to the full band.
+    tolerance (float): Half-width in Hz of the search around each fault frequency.
+  """
+
+  def __init__(self, length: int, samplingRate: float = SAMPLING_RATE, bands: list = None,
+               faultFrequencies: dict = None, rotationFrequency: float = None,
+               envelopeBand: tuple = None, tolerance: float = 2.0):
+    if length < 2: raise ValueError("Signals must contain at least two samples.")
+
+    self.length = length
+    self.samplingRate = float(samplingRate)
+    self.frequencies = np.fft.rfftfreq(length, d=1.0 / self.samplingRate)
+
+    window = np.hanning(length)
+    self.window = window / np.sqrt(np.mean(window ** 2))
+
+    # One-sided spectrum: every bin but DC (and Nyquist for even lengths) stands for two.
+    self.binWeights = np.full(self.frequencies.shape[0], 2.0 / length)
+    self.binWeights[0] = 1.0 / length
+    if length % 2 == 0:
+      self.binWeights[-1] = 1.0 / length
+
+    nyquist = self.samplingRate / 2
+    if bands is None:
+      edges = np.linspace(0.0, nyquist, 9)
+      bands = list(zip(edges[:-1], edges[1:]))
+    self.bands = [(float(lo), float(hi)) for lo, hi in bands]
+    # Bands are [lo, hi[, except that a band reaching Nyquist keeps the Nyquist bin.
+    self.bandMatrix = np.stack([
+      (self.frequencies >= lo) & ((self.frequencies < hi) | (self.frequencies >= nyquist) & (hi >= nyquist))
+      for lo, hi in self.bands
+    ]).astype(np.float64).T
+
+    # Hilbert transform in the frequency domain: analytic = ifft(fft(x) * hilbert).
+    hilbert = np.zeros(length)
+    hilbert[0] = 1.0
+    if length % 2 == 0:
+      hilbert[length // 2] = 1.0
+      hilbert[1:length // 2] = 2.0
+    else:
+      hilbert[1:(length + 1) // 2] = 2.0
+    if envelopeBand is not None:
+      full_frequencies = np.abs(np.fft.fftfreq(length, d=1.0 / self.samplingRate))
+      hilbert[(full_frequencies < envelopeBand[0]) | (full_frequencies >= envelopeBand[1])] = 0.0
+    self.hilbert = hilbert
+
+    faultFrequencies = faultFrequencies or {}
+    scale = rotationFrequency if rotationFrequency is not None else 1.0
+    self.faultFrequencies = {name: float(frequency) * scale for name, frequency in faultFrequencies.items()}
+    self.faultMasks = [
+      np.abs(self.frequencies - frequency) <= tolerance for frequency in self.faultFrequencies.values()
+    ]
+
+    self.names = (
+      [f"band_{lo:g}_{hi:g}" for lo, hi in self.bands]
+      + ["spectral_centroid", "spectral_spread", "spectral_kurtosis"]
+      + [f"envelope_{name}" for name in self.faultFrequencies]
+    )
+
+  def _calculateBlock(self, block: np.ndarray, out: np.ndarray):
+    spectrum = np.fft.rfft(block * self.window, axis=1)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+    power *= self.binWeights
+
+    bandCount = len(self.bands)
+    out[:, :bandCount] = power @ self.bandMatrix
+
+    total = power.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+      centroid = power @ self.frequencies / total
+      offsets = self.frequencies[None, :] - centroid[:, None]
+      offsets *= offsets
+      spread2 = np.einsum('ij,ij->i', power, offsets) / total
+      offsets *= offsets
+      out[:, bandCount] = centroid
+      out[:, bandCount + 1] = np.sqrt(spread2)
+      out[:, bandCount + 2] = np.einsum('ij,ij->i', power, offsets) / total / (spread2 * spread2)
+
+    if self.faultMasks:
+      analytic = np.fft.ifft(np.fft.fft(block, axis=1) * self.hilbert, axis=1)
+      envelope = np.abs(analytic)
+      envelope -= envelope.mean(axis=1, keepdims=True)
+      envelopeSpectrum = np.abs(np.fft.rfft(envelope, axis=1)) * (2.0 / self.length)
+      for i, mask in enumerate(self.faultMasks):
+        column = bandCount + 3 + i
+        out[:, column] = envelopeSpectrum[:, mask].max(axis=1) if mask.any() else np.nan
+
+  def calculate(self, signalMatrix, out: np.ndarray = None) -> np.ndarray:
+    """
+    Calculate the spectral indicators of every signal of a matrix.
+
+    Args:
+      signalMatrix (np.ndarray): (n_signals, length) matrix, one signal per row.
+      out (np.ndarray): Optional (n_signals, len(self.names)) array to write into.
+
+    Returns:
+      np.ndarray: (n_signals, len(self.names)) array, columns in self.names order.
+    """
+
+    signalMatrix = np.asarray(signalMatrix, dtype=np.float64)
+    if signalMatrix.ndim == 1:
+      signalMatrix = signalMatrix[None, :]
+    if signalMatrix.ndim != 2 or signalMatrix.shape[1] != self.length:
+      raise ValueError(f"Expected a (n_signals, {self.length}) matrix, got shape {signalMatrix.shape}.")
+
+    if out is None:
+      out = np.empty((signalMatrix.shape[0], len(self.names)))
+    for start in range(0, signalMatrix.shape[0], BLOCK_ROWS):
+      stop = min(start + BLOCK_ROWS, signalMatrix.shape[0])
+      self._calculateBlock(signalMatrix[start:stop], out[start:stop])
+    return out
+
+
+_analyzers = {}
+
+
+def calculateSpectralIndicators(signalMatrix, samplingRate: float = SAMPLING_RATE, **options) -> np.ndarray:
+  """
+  Calculate the spectral indicators of a matrix, reusing one SpectralAnalyzer per
+  (length, samplingRate, options). See SpectralAnalyzer for the options.
+
+  The result can be stacked next to calculateIndicatorsMatrix before selectRelevantIndicators:
+    np.hstack([calculateIndicatorsMatrix(signalMatrix), calculateSpectralIndicators(signalMatrix)])
+  """
+
+  signalMatrix = np.asarray(signalMatrix, dtype=np.float64)
+  length = signalMatrix.shape[-1]
+  key = (length, float(samplingRate), repr(sorted(options.items())))
+  analyzer = _analyzers.get(key)
+  if analyzer is None:
+    analyzer = SpectralAnalyzer(length, samplingRate, **options)
+    _analyzers[key] = analyzer
+  return analyzer.calculate(signalMatrix)
+
+
+def spectralIndicatorNames(length: int, samplingRate: float = SAMPLING_RATE, **options) -> list:
+  """
+  Column names of calculateSpectralIndicators for the same arguments.
+  """
+  return SpectralAnalyzer(length, samplingRate, **options).names
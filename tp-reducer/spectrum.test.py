@@ -0,0 +1,26 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+
+import numpy as np
+
+from reducer import calculateIndicatorsMatrix, importSignalList
+from spectrum import SAMPLING_RATE, calculateSpectralIndicators, spectralIndicatorNames
+
+# 3 kHz carrier amplitude-modulated at 87 Hz: the envelope must peak at 87 Hz, not at 50 Hz.
+time = np.arange(25600) / SAMPLING_RATE
+modulated = (1 + 0.5 * np.cos(2 * np.pi * 87 * time)) * np.sin(2 * np.pi * 3000 * time)
+options = {"faultFrequencies": {"outer": 87.0, "other": 50.0}, "envelopeBand": (2000.0, 4000.0)}
+
+names = spectralIndicatorNames(25600, **options)
+values = dict(zip(names, calculateSpectralIndicators(modulated[None, :], **options)[0]))
+assert abs(values["spectral_centroid"] - 3000) < 50
+assert values["envelope_outer"] > 0.2 and values["envelope_other"] < 0.01
+assert np.isclose(sum(values[name] for name in names if name.startswith("band_")), np.sum(modulated ** 2), rtol=0.02)
+print("spectrum", {name: round(float(value), 4) for name, value in values.items()})
+
+signalMatrix = importSignalList(os.path.join(os.path.dirname(__file__), "data", "1-roulement-sain-pignon-sain"))
+featureMatrix = np.hstack([calculateIndicatorsMatrix(signalMatrix), calculateSpectralIndicators(signalMatrix, **options)])
+print("feature matrix", featureMatrix.shape)
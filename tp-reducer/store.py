@@ -0,0 +1,252 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from metrics import instrument
+
+"""
+  This module packs a directory of acc_*.csv files into one contiguous binary store.
+  Store layout (next to the CSV files):
+    .acc-store.bin   -  raw samples of every file, back to back
+    .acc-store.json  -  header: dtype + one entry per file
+  Header entry:
+    name: string  -  CSV file name
+    offset: number  -  Offset in samples inside .acc-store.bin
+    length: number  -  Number of samples
+    constant: number  -  Value of the first column (constant per file)
+    size: number  -  CSV size in bytes, used for invalidation
+    mtime_ns: number  -  CSV modification time, used for invalidation
+"""
+
+STORE_VERSION = 1
+STORE_DATA_FILE = ".acc-store.bin"
+STORE_HEADER_FILE = ".acc-store.json"
+SIGNAL_FILE_PREFIX = "acc_"
+SIGNAL_FILE_SUFFIX = ".csv"
+
+_openStores = {}
+
+
+def listSignalFiles(dir_path: str) -> list:
+  """
+  List the acc_*.csv files of a directory, sorted by name.
+  """
+  return sorted(
+    name for name in os.listdir(dir_path)
+    if name.startswith(SIGNAL_FILE_PREFIX) and name.endswith(SIGNAL_FILE_SUFFIX)
+  )
+
+
+def _fileStamp(file_path: str) -> dict:
+  stat = os.stat(file_path)
+  return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+# Bytes are the CSV bytes parsed, also when the parsing runs in worker processes.
+@instrument(counters=lambda header, *args, **kwargs: {"items": len(header["entries"]), "bytes": sum(entry["size"] for entry in header["entries"])})
+def buildSignalStore(dir_path: str, dtype=np.float64, workers: int = None, executor: str = "process") -> dict:
+  """
+  Convert every acc_*.csv file of a directory into the binary store.
+  The files are parsed concurrently (see loader.iterSignalFiles) and written in name order.
+
+  Args:
+    dir_path (str): Path to the class directory.
+    dtype: Sample type of the store, np.float64 (default) or np.float32.
+    workers (int): Number of parsing workers. Defaults to os.cpu_count(); 1 parses in the calling thread.
+    executor (str): "process" (default) or "thread".
+
+  Returns:
+    dict: The header written next to the data file.
+  """
+
+  # loader.py imports this module.
+  from loader import iterSignalFiles
+
+  dtype = np.dtype(dtype)
+  data_path = os.path.join(dir_path, STORE_DATA_FILE)
+  header_path = os.path.join(dir_path, STORE_HEADER_FILE)
+
+  names = listSignalFiles(dir_path)
+  # Stamps are taken before parsing: a file changed meanwhile makes the store stale, not wrong.
+  stamps = [_fileStamp(os.path.join(dir_path, name)) for name in names]
+  parsed = iterSignalFiles([os.path.join(dir_path, name) for name in names], workers, executor, dtype)
+
+  entries = []
+  offset = 0
+  with open(data_path + ".tmp", "wb") as data_file:
+    for name, stamp, (signal, constant) in zip(names, stamps, parsed):
+      data_file.write(np.ascontiguousarray(signal, dtype=dtype).tobytes())
+
+      entries.append({
+        "name": name,
+        "offset": offset,
+        "length": int(signal.shape[0]),
+        "constant": constant,
+        "size": stamp["size"],
+        "mtime_ns": stamp["mtime_ns"],
+      })
+      offset += int(signal.shape[0])
+
+  header = {"version": STORE_VERSION, "dtype": dtype.str, "entries": entries}
+  with open(header_path + ".tmp", "w") as header_file:
+    json.dump(header, header_file, indent=2)
+
+  # Header last: a store is only valid once both files are in place.
+  os.replace(data_path + ".tmp", data_path)
+  os.replace(header_path + ".tmp", header_path)
+  _openStores.pop(os.path.abspath(dir_path), None)
+  return header
+
+
+def _readHeader(dir_path: str):
+  header_path = os.path.join(dir_path, STORE_HEADER_FILE)
+  if not os.path.exists(header_path) or not os.path.exists(os.path.join(dir_path, STORE_DATA_FILE)):
+    return None
+  try:
+    with open(header_path) as header_file:
+      header = json.load(header_file)
+  except (OSError, ValueError):
+    return None
+  if header.get("version") != STORE_VERSION:
+    return None
+  return header
+
+
+def isSignalStoreValid(dir_path: str, header: dict = None) -> bool:
+  """
+  Check that the store matches the CSV files currently in the directory
+  (same file names, same sizes, same modification times).
+  """
+
+  if header is None:
+    header = _readHeader(dir_path)
+  if header is None:
+    return False
+
+  names = listSignalFiles(dir_path)
+  if names != [entry["name"] for entry in header["entries"]]:
+    return False
+
+  for entry in header["entries"]:
+    stamp = _fileStamp(os.path.join(dir_path, entry["name"]))
+    if stamp["size"] != entry["size"] or stamp["mtime_ns"] != entry["mtime_ns"]:
+      return False
+  return True
+
+
+class SignalStore:
+  """
+  Read-only view over a packed directory. Signals are zero-copy views on a np.memmap.
+  """
+
+  def __init__(self, dir_path: str, header: dict):
+    self.dir_path = dir_path
+    self.header = header
+    self.dtype = np.dtype(header["dtype"])
+    self.entries = {entry["name"]: entry for entry in header["entries"]}
+    self.names = [entry["name"] for entry in header["entries"]]
+
+    total = sum(entry["length"] for entry in header["entries"])
+    data_path = os.path.join(dir_path, STORE_DATA_FILE)
+    if total == 0:
+      self.data = np.empty(0, dtype=self.dtype)
+    else:
+      self.data = np.memmap(data_path, dtype=self.dtype, mode='r', shape=(total,))
+
+  def isEntryFresh(self, name: str) -> bool:
+    entry = self.entries.get(name)
+    if entry is None:
+      return False
+    file_path = os.path.join(self.dir_path, name)
+    if not os.path.exists(file_path):
+      return False
+    stamp = _fileStamp(file_path)
+    return stamp["size"] == entry["size"] and stamp["mtime_ns"] == entry["mtime_ns"]
+
+  def signal(self, name: str) -> np.ndarray:
+    entry = self.entries[name]
+    return self.data[entry["offset"]:entry["offset"] + entry["length"]]
+
+  def constant(self, name: str) -> float:
+    return self.entries[name]["constant"]
+
+  def matrix(self, names: list = None) -> np.ndarray:
+    """
+    Return the signals as a (n_files, n_samples) array.
+    A zero-copy view when the requested files are contiguous and of equal length,
+    a stacked copy otherwise.
+    """
+
+    if names is None:
+      names = self.names
+    if not names:
+      return np.empty((0, 0), dtype=self.dtype)
+
+    entries = [self.entries[name] for name in names]
+    length = entries[0]["length"]
+    start = entries[0]["offset"]
+    contiguous = all(
+      entry["length"] == length and entry["offset"] == start + i * length
+      for i, entry in enumerate(entries)
+    )
+    if contiguous:
+      return self.data[start:start + len(entries) * length].reshape(len(entries), length)
+    return np.stack([self.signal(name) for name in names])
+
+
+def openSignalStore(dir_path: str, dtype=np.float64, workers: int = None, executor: str = "process") -> SignalStore:
+  """
+  Open the store of a directory, building or rebuilding it when the CSV files changed.
+
+  Args:
+    dir_path (str): Path to the class directory.
+    dtype: Sample type used if the store has to be (re)built.
+    workers (int), executor (str): Parsing pool used if the store has to be (re)built, see buildSignalStore.
+
+  Returns:
+    SignalStore: The opened store.
+  """
+
+  key = os.path.abspath(dir_path)
+  store = _openStores.get(key)
+  if store is not None and isSignalStoreValid(dir_path, store.header):
+    return store
+
+  header = _readHeader(dir_path)
+  if header is None or not isSignalStoreValid(dir_path, header):
+    header = buildSignalStore(dir_path, dtype, workers, executor)
+
+  store = SignalStore(dir_path, header)
+  _openStores[key] = store
+  return store
+
+
+def loadStoredSignal(file_path: str) -> np.ndarray:
+  """
+  Load one signal through the store of its directory.
+  Only the requested file is checked for changes, the store is rebuilt if it is stale.
+  """
+
+  dir_path, name = os.path.split(file_path)
+  dir_path = dir_path or "."
+  key = os.path.abspath(dir_path)
+
+  store = _openStores.get(key)
+  if store is None or not store.isEntryFresh(name):
+    store = openSignalStore(dir_path)
+  if name not in store.entries:
+    raise FileNotFoundError(f"{file_path} is not an {SIGNAL_FILE_PREFIX}*{SIGNAL_FILE_SUFFIX} file of its directory.")
+  return store.signal(name)
+
+
+if __name__ == "__main__":
+  import sys
+
+  for dir_path in sys.argv[1:]:
+    header = buildSignalStore(dir_path)
+    print(dir_path, len(header["entries"]), "files packed")
@@ -0,0 +1,40 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from store import STORE_DATA_FILE, buildSignalStore, openSignalStore, loadStoredSignal
+
+source_dir = os.path.join(os.path.dirname(__file__), "data", "1-roulement-sain-pignon-sain")
+
+with tempfile.TemporaryDirectory() as dir_path:
+  for name in ["acc_00001.csv", "acc_00002.csv", "acc_00003.csv"]:
+    shutil.copy(os.path.join(source_dir, name), dir_path)
+
+  store = openSignalStore(dir_path)
+  expected = np.genfromtxt(os.path.join(dir_path, "acc_00002.csv"), delimiter=',', usecols=1)
+  signal = loadStoredSignal(os.path.join(dir_path, "acc_00002.csv"))
+  assert np.array_equal(signal, expected)
+  assert store.matrix().shape == (3, expected.shape[0])
+  print("store", store.names, store.constant("acc_00002.csv"))
+
+  # Touching a CSV file must invalidate the store.
+  with open(os.path.join(dir_path, "acc_00002.csv"), "a") as file:
+    file.write("1,42.0\n")
+  signal = loadStoredSignal(os.path.join(dir_path, "acc_00002.csv"))
+  assert signal.shape[0] == expected.shape[0] + 1 and signal[-1] == 42.0
+  print("store rebuilt after change", signal.shape)
+
+  # Parallel builds pack the same bytes as a serial one, files of different lengths included.
+  serial = buildSignalStore(dir_path, workers=1)
+  serialData = open(os.path.join(dir_path, STORE_DATA_FILE), "rb").read()
+  for executor in ("thread", "process"):
+    assert buildSignalStore(dir_path, workers=2, executor=executor) == serial
+    assert open(os.path.join(dir_path, STORE_DATA_FILE), "rb").read() == serialData
+  assert [entry["length"] for entry in serial["entries"]] == [expected.shape[0], expected.shape[0] + 1, expected.shape[0]]
+  print("parallel builds match")
@@ -0,0 +1,359 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import asyncio
+import json
+import struct
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from artifact import loadPipeline
+from metrics import stage, startMetricsServer
+from reader import readSignal
+from spectrum import SAMPLING_RATE
+
+"""
+  Streaming diagnosis over TCP or a Unix socket.
+
+  Clients send frames of raw samples; every channel of a connection has its own
+  ring buffer and each time `window` new samples (every `hop` samples once full) are
+  available the window is classified with a saved pipeline (see artifact.py) on an
+  executor, so the event loop only moves bytes.
+
+  Frame (client -> server), little-endian:
+    channel: uint16
+    count: uint32  -  Number of samples that follow
+    samples: float32[count]
+
+  Diagnosis (server -> client): one JSON object per line, see Interface Diagnosis. A window
+  that could not be classified gets a DiagnosisError line instead, and the connection goes on.
+
+  Interface Diagnosis
+    channel: number  -  Channel of the window
+    window: number  -  Index of the window on its channel, from 0
+    end: number  -  Samples received on the channel when the window was complete
+    label: string  -  Predicted class
+    probabilities: list  -  Softmax probabilities, in pipeline label order
+    latency_ms: number  -  Time from the window completing to the diagnosis being sent
+
+  Interface DiagnosisError
+    channel, window, end: number  -  As in Diagnosis
+    error: string  -  Why the window was not classified
+
+  Usage:
+    python tp-reducer/stream.py serve <pipeline.npz> (<host:port> | <unix socket path>) [--metrics <port>]
+    python tp-reducer/stream.py replay (<host:port> | <unix socket path>) <acc_*.csv>... [--speed N]
+"""
+
+FRAME_HEADER = struct.Struct("<HI")
+DEFAULT_WINDOW = 25600
+
+# Largest accepted frame: one second of a 25.6 kHz channel, 16 times over.
+MAX_FRAME_SAMPLES = 16 * DEFAULT_WINDOW
+
+
+class SampleRing:
+  """
+  Fixed-size ring buffer of one channel, emitting the last `window` samples every `hop` samples.
+
+  Args:
+    window (int): Samples per diagnosis window.
+    hop (int): Samples between two windows. Defaults to window (no overlap); a larger hop
+      skips the samples in between.
+  """
+
+  def __init__(self, window: int = DEFAULT_WINDOW, hop: int = None):
+    hop = hop or window
+    if window <= 0 or hop <= 0: raise ValueError("window and hop must be positive.")
+    self.window = window
+    self.hop = hop
+    self.buffer = np.zeros(window, dtype=np.float32)
+    self.position = 0
+    self.received = 0
+    self._untilNext = window
+
+  def extend(self, samples: np.ndarray) -> list:
+    """
+    Append samples; returns [(end, window copy), ...] for every window completed by them.
+    """
+
+    windows = []
+    while samples.shape[0]:
+      if self._untilNext > self.window:
+        # hop > window: samples more than a window before the next one are never used.
+        skip = min(samples.shape[0], self._untilNext - self.window)
+        samples = samples[skip:]
+        self.received += skip
+        self._untilNext -= skip
+        continue
+
+      take = min(samples.shape[0], self._untilNext)
+      chunk, samples = samples[:take], samples[take:]
+
+      # Copy, wrapping around the end of the buffer.
+      first = min(take, self.window - self.position)
+      self.buffer[self.position:self.position + first] = chunk[:first]
+      self.buffer[:take - first] = chunk[first:]
+      self.position = (self.position + take) % self.window
+      self.received += take
+      self._untilNext -= take
+
+      if self._untilNext == 0:
+        windows.append((self.received, np.concatenate((self.buffer[self.position:], self.buffer[:self.position]))))
+        self._untilNext = self.hop
+    return windows
+
+
+def parseAddress(address: str):
+  """
+  "host:port" -> (host, port); anything else is a Unix socket path.
+  """
+  host, separator, port = address.rpartition(":")
+  if separator and port.isdigit() and "/" not in address:
+    return host or "127.0.0.1", int(port)
+  return address
+
+
+class DiagnosisServer:
+  """
+  Args:
+    pipelinePath (str): Pipeline saved by savePipeline.
+    window (int): Samples per diagnosis window.
+    hop (int): Samples between windows. Defaults to window.
+    executor: Executor running indicators and classification. Defaults to one worker thread.
+    maxPending (int): Windows waiting for classification per connection before reading pauses.
+  """
+
+  def __init__(self, pipelinePath: str, window: int = DEFAULT_WINDOW, hop: int = None,
+               executor=None, maxPending: int = 8):
+    self.pipeline = loadPipeline(pipelinePath)
+    self.window = window
+    self.hop = hop
+    self.executor = executor or ThreadPoolExecutor(1)
+    self.maxPending = maxPending
+    self.connections = 0
+    self.diagnosed = 0
+    self._server = None
+
+  async def start(self, address):
+    """
+    Listen on ("host", port) or a Unix socket path.
+    """
+    if isinstance(address, tuple):
+      self._server = await asyncio.start_server(self._handle, *address)
+    else:
+      self._server = await asyncio.start_unix_server(self._handle, address)
+    return self._server
+
+  async def close(self):
+    if self._server is not None:
+      self._server.close()
+      await self._server.wait_closed()
+
+  def _classify(self, windows: list):
+    with stage("DiagnosisServer.classify", items=len(windows)):
+      return self.pipeline.classifySignals(np.stack(windows))
+
+  async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    self.connections += 1
+    pending = asyncio.Queue(self.maxPending)
+    responder = asyncio.create_task(self._respond(pending, writer))
+    rings = {}
+    windowCounts = {}
+
+    try:
+      while True:
+        try:
+          header = await reader.readexactly(FRAME_HEADER.size)
+        except asyncio.IncompleteReadError:
+          break
+        channel, count = FRAME_HEADER.unpack(header)
+        if count > MAX_FRAME_SAMPLES: raise ValueError(f"Frame of {count} samples exceeds {MAX_FRAME_SAMPLES}.")
+        samples = np.frombuffer(await reader.readexactly(4 * count), dtype="<f4")
+
+        ring = rings.get(channel)
+        if ring is None:
+          ring = rings[channel] = SampleRing(self.window, self.hop)
+          windowCounts[channel] = 0
+        for end, samplesWindow in ring.extend(samples):
+          if not await self._enqueue(pending, responder, (channel, windowCounts[channel], end, samplesWindow, time.perf_counter())):
+            return
+          windowCounts[channel] += 1
+    except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+      pass
+    finally:
+      await self._enqueue(pending, responder, None)
+      try:
+        await responder
+      except Exception as error:
+        print(f"DiagnosisServer: connection dropped: {error!r}", file=sys.stderr)
+      writer.close()
+
+  @staticmethod
+  async def _enqueue(pending: asyncio.Queue, responder: asyncio.Task, item) -> bool:
+    # A full queue is only waited on while the responder is alive to empty it.
+    if responder.done():
+      return False
+    if not pending.full():
+      pending.put_nowait(item)
+      return True
+    put = asyncio.ensure_future(pending.put(item))
+    await asyncio.wait((put, responder), return_when=asyncio.FIRST_COMPLETED)
+    if not put.done():
+      put.cancel()
+    return put.done() and not put.cancelled()
+
+  async def _respond(self, pending: asyncio.Queue, writer: asyncio.StreamWriter):
+    loop = asyncio.get_running_loop()
+    done = False
+    try:
+      while not done:
+        batch = [await pending.get()]
+        # Windows that completed together are classified in one executor call.
+        while not pending.empty():
+          batch.append(pending.get_nowait())
+        if batch[-1] is None:
+          batch.pop()
+          done = True
+        if not batch:
+          continue
+
+        try:
+          probabilities, labels = await loop.run_in_executor(self.executor, self._classify, [item[3] for item in batch])
+        except Exception as error:
+          lines = [
+            json.dumps({"channel": channel, "window": index, "end": end, "error": f"{type(error).__name__}: {error}"}) + "\n"
+            for channel, index, end, _, _ in batch
+          ]
+        else:
+          now = time.perf_counter()
+          lines = [
+            json.dumps({
+              "channel": channel,
+              "window": index,
+              "end": end,
+              "label": self.pipeline.labels[label],
+              "probabilities": probability.tolist(),
+              "latency_ms": round((now - completed) * 1e3, 3),
+            }) + "\n"
+            for (channel, index, end, _, completed), probability, label in zip(batch, probabilities, labels)
+          ]
+          self.diagnosed += len(lines)
+
+        try:
+          writer.write("".join(lines).encode())
+          await writer.drain()
+        except ConnectionError:
+          # The client is gone: _handle stops reading once this task is done.
+          return
+    finally:
+      # Windows left behind are dropped, nothing waits on them any more.
+      while not pending.empty():
+        pending.get_nowait()
+
+
+def encodeFrame(channel: int, samples) -> bytes:
+  samples = np.asarray(samples, dtype="<f4")
+  return FRAME_HEADER.pack(channel, samples.shape[0]) + samples.tobytes()
+
+
+async def _openConnection(address):
+  if isinstance(address, tuple):
+    return await asyncio.open_connection(*address)
+  return await asyncio.open_unix_connection(address)
+
+
+async def replayCaptures(address, filePaths: list, channels: int = 1, blockSize: int = 1024,
+                         speed: float = None, samplingRate: float = SAMPLING_RATE) -> list:
+  """
+  Synthetic client: stream acc_*.csv captures to a server and collect its diagnoses.
+
+  Args:
+    address: ("host", port) or a Unix socket path.
+    filePaths (list): Captures, sent one after the other on each channel.
+    channels (int): Channels to replay the captures on (channel i starts at capture i).
+    blockSize (int): Samples per frame.
+    speed (float): 1.0 replays at the sampling rate, 10.0 ten times faster;
+      None sends as fast as the connection allows.
+    samplingRate (float): Sampling rate of the captures in Hz.
+
+  Returns:
+    list: Diagnosis (and DiagnosisError) dicts, in the order received. A server closing the
+      connection early ends the replay with the diagnoses received so far.
+  """
+
+  signals = [readSignal(path).astype("<f4") for path in filePaths]
+  reader, writer = await _openConnection(address)
+
+  async def receive():
+    diagnoses = []
+    try:
+      while line := await reader.readline():
+        diagnoses.append(json.loads(line))
+    except ConnectionError:
+      pass
+    return diagnoses
+
+  receiving = asyncio.create_task(receive())
+  started = time.perf_counter()
+  sent = 0
+  try:
+    for i in range(len(signals)):
+      for start in range(0, signals[i].shape[0], blockSize):
+        for channel in range(channels):
+          signal = signals[(i + channel) % len(signals)]
+          writer.write(encodeFrame(channel, signal[start:start + blockSize]))
+        sent += min(blockSize, signals[i].shape[0] - start)
+        await writer.drain()
+        if speed:
+          delay = started + sent / (samplingRate * speed) - time.perf_counter()
+          if delay > 0:
+            await asyncio.sleep(delay)
+    writer.write_eof()
+  except ConnectionError:
+    pass
+
+  diagnoses = await receiving
+  writer.close()
+  return diagnoses
+
+
+if __name__ == "__main__":
+  arguments = sys.argv[1:]
+  if len(arguments) >= 3 and arguments[0] == "serve":
+    if "--metrics" in arguments:
+      position = arguments.index("--metrics")
+      startMetricsServer(port=int(arguments[position + 1]))
+      del arguments[position:position + 2]
+
+    async def serve():
+      server = DiagnosisServer(arguments[1])
+      await server.start(parseAddress(arguments[2]))
+      print(f"Serving {arguments[1]} on {arguments[2]}")
+      await asyncio.Event().wait()
+
+    try:
+      asyncio.run(serve())
+    except KeyboardInterrupt:
+      pass
+
+  elif len(arguments) >= 3 and arguments[0] == "replay":
+    speed = None
+    if "--speed" in arguments:
+      position = arguments.index("--speed")
+      speed = float(arguments[position + 1])
+      del arguments[position:position + 2]
+    for diagnosis in asyncio.run(replayCaptures(parseAddress(arguments[1]), arguments[2:], speed=speed)):
+      if "error" in diagnosis:
+        print(diagnosis["channel"], diagnosis["window"], "error:", diagnosis["error"])
+      else:
+        print(diagnosis["channel"], diagnosis["window"], diagnosis["label"], f"{diagnosis['latency_ms']} ms")
+
+  else:
+    print("Usage: python tp-reducer/stream.py serve <pipeline.npz> <host:port | socket path> [--metrics <port>]")
+    print("       python tp-reducer/stream.py replay <host:port | socket path> <acc_*.csv>... [--speed N]")
+    sys.exit(1)
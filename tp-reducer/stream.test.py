@@ -0,0 +1,104 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import numpy as np
+
+from artifact import PipelineArtifact, savePipeline
+from reader import readSignal
+from stream import DiagnosisServer, SampleRing, parseAddress, replayCaptures
+
+# Ring buffer: windows of 8 samples every 3 samples, fed in uneven chunks.
+ring = SampleRing(8, 3)
+stream = np.arange(30, dtype=np.float32)
+windows = []
+for chunk in np.array_split(stream, [5, 6, 17, 18, 29]):
+  windows += ring.extend(chunk)
+assert [end for end, _ in windows] == [8, 11, 14, 17, 20, 23, 26, 29]
+for end, window in windows:
+  assert np.array_equal(window, stream[end - 8:end])
+
+# hop > window: the samples between windows are skipped, whatever the packet size.
+ring = SampleRing(100, 300)
+windows = ring.extend(np.arange(301.0)) + ring.extend(np.arange(301.0, 1000.0))
+assert [end for end, _ in windows] == [100, 400, 700, 1000]
+for end, window in windows:
+  assert np.array_equal(window, np.arange(end - 100.0, end))
+ring = SampleRing(100, 300)
+windows = []
+for chunk in np.array_split(np.arange(1000.0), [7, 150, 160, 420, 999]):
+  windows += ring.extend(chunk)
+assert [end for end, _ in windows] == [100, 400, 700, 1000] and ring.received == 1000
+assert all(np.array_equal(window, np.arange(end - 100.0, end)) for end, window in windows)
+
+assert parseAddress("127.0.0.1:8765") == ("127.0.0.1", 8765)
+assert parseAddress("/tmp/mpp.sock") == "/tmp/mpp.sock"
+
+data_dir = os.path.join(os.path.dirname(__file__), "data", "1-roulement-sain-pignon-sain")
+files = [os.path.join(data_dir, f"acc_{i:05d}.csv") for i in range(11, 14)]
+rng = np.random.default_rng(0)
+pipeline = PipelineArtifact(
+  [(rng.random((3, 3)), rng.random(3)), (rng.random((3, 4)), rng.random(4))],
+  ["rms", "kurtosis", "peak"], ["a", "b", "c", "d"],
+)
+expected = pipeline.classifySignals(np.stack([readSignal(path).astype(np.float32) for path in files]))
+
+
+async def main(directory):
+  pipelinePath = os.path.join(directory, "pipeline.npz")
+  savePipeline(pipelinePath, pipeline)
+  server = DiagnosisServer(pipelinePath)
+  address = os.path.join(directory, "mpp.sock")
+  await server.start(address)
+  diagnoses = await replayCaptures(address, files, channels=2, blockSize=1000)
+  await server.close()
+  return diagnoses
+
+
+async def failures(directory):
+  pipelinePath = os.path.join(directory, "pipeline.npz")
+  address = os.path.join(directory, "failing.sock")
+
+  # A failing classification answers with error lines and the connection goes on.
+  server = DiagnosisServer(pipelinePath)
+  classify, calls = server._classify, []
+
+  def failOnce(windows):
+    calls.append(len(windows))
+    if len(calls) == 1: raise FloatingPointError("overflow")
+    return classify(windows)
+
+  server._classify = failOnce
+  await server.start(address)
+  diagnoses = await replayCaptures(address, files[:2], blockSize=1000)
+  await server.close()
+
+  # A dead responder must not leave the connection waiting on its full queue.
+  server = DiagnosisServer(pipelinePath, window=1000, maxPending=1)
+
+  async def dead(pending, writer):
+    raise RuntimeError("responder failed")
+
+  server._respond = dead
+  await server.start(address + "2")
+  assert await asyncio.wait_for(replayCaptures(address + "2", files, blockSize=1000), 10) == []
+  await server.close()
+  return diagnoses
+
+
+with tempfile.TemporaryDirectory() as directory:
+  diagnoses = asyncio.run(main(directory))
+  failed = asyncio.run(failures(directory))
+
+assert [("error" in d, d["window"]) for d in failed] == [(True, 0), (False, 1)]
+assert failed[0]["error"] == "FloatingPointError: overflow"
+
+print(f"{len(diagnoses)} diagnoses, max latency {max(d['latency_ms'] for d in diagnoses):.1f} ms")
+assert len(diagnoses) == 6
+channel0 = [d for d in diagnoses if d["channel"] == 0]
+assert [d["window"] for d in channel0] == [0, 1, 2]
+assert np.allclose([d["probabilities"] for d in channel0], expected[0], atol=1e-6)
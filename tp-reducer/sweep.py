@@ -0,0 +1,272 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from dataset import FeatureDataset, openDataset, saveDataset
+from network import Network2LayersPredictor, trainNetwork2Layers
+from sbs import fisherSBS
+
+"""
+  Stratified k-fold cross-validation of the reducer pipeline (SBS selection ->
+  standardisation -> 2-layer network) over a grid of hyperparameters.
+
+  Every (configuration, fold) pair is one task of a process pool. The feature table
+  is written once with saveDataset and memory-mapped by every worker, so the CSVs are
+  never imported again and the rows are never pickled. Selection and standardisation
+  are fitted on the training folds only. Each task trains with its own seed, derived
+  from (seed, configuration, fold), so results do not depend on the worker count.
+
+  Interface SweepConfig
+    subsetSize: number  -  Indicators kept by fisherSBS
+    hiddenSize: number  -  Hidden layer width
+    learningRate: number
+    epochs: number
+    validationSplit: number  -  Share of the training folds held out to pick the best epoch
+
+  Interface SweepResult (SweepConfig plus)
+    rank: number  -  1 for the best mean accuracy (ties: lower std, then faster)
+    accuracy: number  -  Mean test accuracy over the folds
+    accuracyStd: number
+    fitSeconds: number  -  Mean selection + training time of one fold
+    seconds: number  -  Task time summed over the folds
+    epochsRun: number  -  Mean epochs actually run
+
+  Usage: python tp-reducer/sweep.py [--subset-sizes 2,3,4] [--hidden-sizes 3,6] [--learning-rates 0.01,0.05]
+           [--epochs 200,1000] [--validation-splits 0,0.2] [--folds 5] [--workers N] [--seed 0] [--output sweep.csv]
+"""
+
+GRID_KEYS = ("subsetSize", "hiddenSize", "learningRate", "epochs", "validationSplit")
+
+_workerState = None
+
+
+def stratifiedFolds(labels: np.ndarray, folds: int, seed=0) -> np.ndarray:
+  """
+  Fold of every row: each class is shuffled and dealt round-robin over the folds,
+  so every fold holds the same share of every class (within one row).
+
+  Raises:
+    ValueError: If a class has fewer rows than folds.
+  """
+
+  if folds < 2: raise ValueError("folds must be at least 2.")
+  labels = np.asarray(labels)
+  rng = np.random.default_rng(seed)
+  foldOf = np.empty(labels.shape[0], dtype=np.int16)
+  for label in np.unique(labels):
+    rows = np.flatnonzero(labels == label)
+    if rows.shape[0] < folds: raise ValueError(f"Class {label} has {rows.shape[0]} rows, fewer than {folds} folds.")
+    foldOf[rng.permutation(rows)] = np.arange(rows.shape[0]) % folds
+  return foldOf
+
+
+def configGrid(**values) -> list:
+  """
+  Cartesian product of the GRID_KEYS values, e.g. configGrid(subsetSize=[2, 3], hiddenSize=[3], ...).
+  """
+  missing = [key for key in GRID_KEYS if key not in values]
+  if missing: raise ValueError(f"Missing grid values for {missing}.")
+  return [dict(zip(GRID_KEYS, combination)) for combination in itertools.product(*(values[key] for key in GRID_KEYS))]
+
+
+def _initWorker(datasetPath: str, foldOf: np.ndarray):
+  global _workerState
+  _workerState = (openDataset(datasetPath), foldOf)
+
+
+def evaluateFold(task: tuple, dataset: FeatureDataset = None, foldOf: np.ndarray = None) -> dict:
+  """
+  Train on every fold but one and test on it.
+
+  Args:
+    task (tuple): (configIndex, config, fold, seed).
+    dataset (FeatureDataset): Defaults to the worker's memory-mapped dataset.
+    foldOf (np.ndarray): Fold of every row, see stratifiedFolds.
+
+  Returns:
+    dict: configIndex, fold, accuracy, fitSeconds, seconds, epochsRun.
+  """
+
+  if dataset is None:
+    dataset, foldOf = _workerState
+  configIndex, config, fold, seed = task
+  started = time.perf_counter()
+
+  testing = foldOf == fold
+  trainingFeatures, trainingLabels = dataset.features[~testing], dataset.labels[~testing]
+  classMatrices = [trainingFeatures[trainingLabels == label] for label in range(len(dataset.labelNames))]
+  selected = fisherSBS(classMatrices, config["subsetSize"])["selected"]
+
+  inputs = trainingFeatures[:, selected]
+  mean = inputs.mean(axis=0)
+  scale = inputs.std(axis=0)
+  scale[scale == 0] = 1.0
+  targets = np.eye(len(dataset.labelNames))[trainingLabels]
+
+  weights, history = trainNetwork2Layers(
+    (inputs - mean) / scale, targets,
+    hiddenSize=config["hiddenSize"], epochs=config["epochs"], learningRate=config["learningRate"],
+    validationSplit=config["validationSplit"], batchSize=16, optimizer="momentum",
+    seed=np.random.SeedSequence([seed, configIndex, fold]),
+  )
+  fitSeconds = time.perf_counter() - started
+
+  _probabilities, predictions = Network2LayersPredictor(weights).predict((dataset.features[testing][:, selected] - mean) / scale)
+  return {
+    "configIndex": configIndex,
+    "fold": fold,
+    "accuracy": float(np.mean(predictions == dataset.labels[testing])),
+    "fitSeconds": fitSeconds,
+    "seconds": time.perf_counter() - started,
+    "epochsRun": history["epochs"],
+  }
+
+
+def rankResults(configs: list, foldResults: list) -> list:
+  """
+  One SweepResult per configuration, best first.
+  """
+
+  byConfig = [[] for _ in configs]
+  for entry in foldResults:
+    byConfig[entry["configIndex"]].append(entry)
+
+  results = []
+  for config, entries in zip(configs, byConfig):
+    accuracies = np.array([entry["accuracy"] for entry in entries])
+    results.append({
+      **config,
+      "accuracy": float(accuracies.mean()),
+      "accuracyStd": float(accuracies.std()),
+      "fitSeconds": float(np.mean([entry["fitSeconds"] for entry in entries])),
+      "seconds": float(sum(entry["seconds"] for entry in entries)),
+      "epochsRun": float(np.mean([entry["epochsRun"] for entry in entries])),
+    })
+  results.sort(key=lambda result: (-result["accuracy"], result["accuracyStd"], result["seconds"]))
+  for rank, result in enumerate(results, 1):
+    result["rank"] = rank
+  return results
+
+
+def sweep(dataset: FeatureDataset, configs: list, folds: int = 5, workers: int = None,
+          seed: int = 0, progress=None) -> dict:
+  """
+  Cross-validate every configuration.
+
+  Args:
+    dataset (FeatureDataset): All indicators of all rows.
+    configs (list): SweepConfig dicts, see configGrid.
+    folds (int): Number of stratified folds.
+    workers (int): Process pool size. Defaults to os.cpu_count(); 1 runs in the calling process.
+    seed (int): Seed of the folds and of every training.
+    progress: Optional callable(done, total) called after every task.
+
+  Returns:
+    dict: "results" (SweepResult list, ranked), "folds" (per-task dicts, see evaluateFold),
+      "seconds" (wall time).
+  """
+
+  workers = workers or os.cpu_count() or 1
+  foldOf = stratifiedFolds(dataset.labels, folds, seed)
+  tasks = [(configIndex, config, fold, seed) for configIndex, config in enumerate(configs) for fold in range(folds)]
+
+  started = time.perf_counter()
+  foldResults = []
+  if workers > 1:
+    with tempfile.TemporaryDirectory() as directory:
+      datasetPath = os.path.join(directory, "features.mppds")
+      saveDataset(datasetPath, dataset)
+      with ProcessPoolExecutor(workers, initializer=_initWorker, initargs=(datasetPath, foldOf)) as pool:
+        # Interleaved chunks keep slow (many-epoch) configurations spread over the workers.
+        for entry in pool.map(evaluateFold, tasks, chunksize=max(1, len(tasks) // (4 * workers))):
+          foldResults.append(entry)
+          if progress is not None:
+            progress(len(foldResults), len(tasks))
+  else:
+    for task in tasks:
+      foldResults.append(evaluateFold(task, dataset, foldOf))
+      if progress is not None:
+        progress(len(foldResults), len(tasks))
+
+  return {"results": rankResults(configs, foldResults), "folds": foldResults, "seconds": time.perf_counter() - started}
+
+
+def printResults(results: list, limit: int = None, file=sys.stdout):
+  print(f"{'rank':>4}{'subset':>8}{'hidden':>8}{'rate':>9}{'epochs':>8}{'val':>6}{'accuracy':>10}{'std':>8}{'fit s':>9}{'total s':>9}", file=file)
+  for result in results[:limit]:
+    print(
+      f"{result['rank']:>4}{result['subsetSize']:>8}{result['hiddenSize']:>8}{result['learningRate']:>9g}"
+      f"{result['epochs']:>8}{result['validationSplit']:>6g}{result['accuracy']:>10.3f}{result['accuracyStd']:>8.3f}"
+      f"{result['fitSeconds']:>9.3f}{result['seconds']:>9.2f}",
+      file=file,
+    )
+
+
+def writeResults(path: str, results: list):
+  columns = ["rank", *GRID_KEYS, "accuracy", "accuracyStd", "fitSeconds", "seconds", "epochsRun"]
+  with open(path, "w") as file:
+    file.write(",".join(columns) + "\n")
+    for result in results:
+      file.write(",".join(f"{result[column]:.6g}" if isinstance(result[column], float) else str(result[column]) for column in columns) + "\n")
+
+
+def reducerDataset(data_dir: str = "./tp-reducer/data", cacheDir: str = "./tp-reducer/.indicator-cache") -> FeatureDataset:
+  """
+  Every indicator of the tp-reducer captures, read through the indicator cache as reducer.py does.
+  """
+
+  from featurecache import IndicatorCache
+  from reducer import INDICATOR_VECTOR_NAMES, REDUCER_CLASS_LABELS, importIndicatorMatrix
+
+  with IndicatorCache(cacheDir) as indicatorCache:
+    matrices = [importIndicatorMatrix(os.path.join(data_dir, label), indicatorCache) for label in REDUCER_CLASS_LABELS]
+  return FeatureDataset.fromClassMatrices(matrices, INDICATOR_VECTOR_NAMES, REDUCER_CLASS_LABELS)
+
+
+if __name__ == "__main__":
+  def numbers(kind):
+    return lambda text: [kind(value) for value in text.split(",") if value]
+
+  parser = argparse.ArgumentParser(description="Cross-validated hyperparameter sweep of the reducer pipeline.")
+  parser.add_argument("--dataset", default=None, help="Dataset saved by saveDataset. Defaults to the tp-reducer captures.")
+  parser.add_argument("--subset-sizes", type=numbers(int), default=[2, 3, 4])
+  parser.add_argument("--hidden-sizes", type=numbers(int), default=[3, 6])
+  parser.add_argument("--learning-rates", type=numbers(float), default=[0.01, 0.05])
+  parser.add_argument("--epochs", type=numbers(int), default=[200, 1000])
+  parser.add_argument("--validation-splits", type=numbers(float), default=[0.0, 0.2])
+  parser.add_argument("--folds", type=int, default=5)
+  parser.add_argument("--workers", type=int, default=None)
+  parser.add_argument("--seed", type=int, default=0)
+  parser.add_argument("--top", type=int, default=20, help="Rows printed.")
+  parser.add_argument("--output", default=None, help="CSV file of the full ranked table.")
+  arguments = parser.parse_args()
+
+  dataset = openDataset(arguments.dataset) if arguments.dataset else reducerDataset()
+  configs = configGrid(
+    subsetSize=arguments.subset_sizes,
+    hiddenSize=arguments.hidden_sizes,
+    learningRate=arguments.learning_rates,
+    epochs=arguments.epochs,
+    validationSplit=arguments.validation_splits,
+  )
+  report = sweep(
+    dataset, configs, arguments.folds, arguments.workers, arguments.seed,
+    progress=lambda done, total: print(f"\r{done}/{total} tasks", end="", file=sys.stderr, flush=True),
+  )
+  print(file=sys.stderr)
+
+  print(f"{len(configs)} configurations x {arguments.folds} folds on {dataset.shape[0]} rows in {report['seconds']:.1f} s")
+  printResults(report["results"], arguments.top)
+  if arguments.output:
+    writeResults(arguments.output, report["results"])
+    print(f"Results written to {arguments.output}")
@@ -0,0 +1,46 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import numpy as np
+
+from dataset import FeatureDataset
+from sweep import configGrid, stratifiedFolds, sweep
+
+rng = np.random.default_rng(0)
+names = ["mean", "rms", "peak", "kurtosis", "energy"]
+# Two informative features (mean, rms), three of noise.
+classMatrices = []
+for label in range(3):
+  matrix = rng.normal(0.0, 1.0, (20 + label, 5))
+  matrix[:, :2] += 4.0 * label
+  classMatrices.append(matrix)
+dataset = FeatureDataset.fromClassMatrices(classMatrices, names, ["a", "b", "c"])
+
+foldOf = stratifiedFolds(dataset.labels, 4, seed=1)
+for fold in range(4):
+  counts = np.bincount(dataset.labels[foldOf == fold], minlength=3)
+  assert np.all((counts >= 5) & (counts <= 6)), counts
+assert np.array_equal(foldOf, stratifiedFolds(dataset.labels, 4, seed=1))
+try:
+  stratifiedFolds(dataset.labels, 21)
+  raise AssertionError("expected ValueError")
+except ValueError:
+  pass
+
+configs = configGrid(subsetSize=[1, 2], hiddenSize=[3], learningRate=[0.05], epochs=[30, 60], validationSplit=[0.0, 0.2])
+assert len(configs) == 8 and configs[-1] == {"subsetSize": 2, "hiddenSize": 3, "learningRate": 0.05, "epochs": 60, "validationSplit": 0.2}
+
+# Per-task seeds: the pool gives the same results as the calling process.
+serial = sweep(dataset, configs, folds=4, workers=1, seed=3)
+parallel = sweep(dataset, configs, folds=4, workers=2, seed=3)
+assert [result["accuracy"] for result in serial["results"]] == [result["accuracy"] for result in parallel["results"]]
+assert [(entry["configIndex"], entry["fold"]) for entry in parallel["folds"]] == [(i, fold) for i in range(8) for fold in range(4)]
+
+results = serial["results"]
+assert [result["rank"] for result in results] == list(range(1, 9))
+assert all(a["accuracy"] >= b["accuracy"] for a, b in zip(results, results[1:]))
+assert results[0]["accuracy"] > 0.9 and results[0]["seconds"] > 0
+print(f"best {results[0]}")
+print(f"serial {serial['seconds']:.2f} s, parallel {parallel['seconds']:.2f} s")
+print("sweep tests passed")
@@ -0,0 +1,277 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+from artifact import loadPipeline
+from metrics import stage, startMetricsServer
+from reader import readSignal
+
+"""
+  Online diagnosis: watch a directory (as model/source/predict.ts reads ./input) and
+  classify every new acc_*.csv file with a saved pipeline (see artifact.py).
+
+  Files are detected with inotify (IN_CLOSE_WRITE / IN_MOVED_TO) when available, by
+  polling otherwise. Detected files go through a bounded queue; the diagnosis thread
+  takes every file arriving within batchWindow seconds, computes their indicators in
+  one batch and appends one line per file to the output log:
+    detected_at,file,label,latency_ms,p_<label>...
+
+  Usage: python tp-reducer/watcher.py <directory> <pipeline.npz> <log.csv> [--poll] [--metrics <port>]
+"""
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_NONBLOCK = 0x00000800
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+  """
+  Linux inotify through ctypes. Raises OSError where inotify is not available.
+  """
+
+  def __init__(self, directory: str, pattern: str = "acc_*.csv"):
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None: raise OSError("libc not found.")
+    libc = ctypes.CDLL(libc_name, use_errno=True)
+    if not hasattr(libc, "inotify_init1"): raise OSError("inotify is not available.")
+
+    self.directory = directory
+    self.pattern = pattern
+    self.fd = libc.inotify_init1(_IN_NONBLOCK)
+    if self.fd < 0: raise OSError(ctypes.get_errno(), "inotify_init1 failed.")
+    if libc.inotify_add_watch(self.fd, os.fsencode(directory), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+      os.close(self.fd)
+      raise OSError(ctypes.get_errno(), f"inotify_add_watch failed on {directory}.")
+
+  def poll(self, timeout: float) -> list:
+    """
+    Files closed after writing (or moved in) since the last call, waiting at most timeout seconds.
+    """
+
+    readable, _, _ = select.select([self.fd], [], [], timeout)
+    if not readable:
+      return []
+    try:
+      data = os.read(self.fd, 64 * 1024)
+    except BlockingIOError:
+      return []
+
+    paths, offset = [], 0
+    while offset < len(data):
+      _watch, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+      offset += _EVENT_HEADER.size
+      name = data[offset:offset + length].rstrip(b"\0").decode()
+      offset += length
+      if fnmatch.fnmatch(name, self.pattern):
+        paths.append(os.path.join(self.directory, name))
+    return paths
+
+  def close(self):
+    os.close(self.fd)
+
+
+class PollingWatcher:
+  """
+  Portable fallback: a file is reported once its size did not change between two scans.
+  """
+
+  def __init__(self, directory: str, pattern: str = "acc_*.csv", interval: float = 0.01):
+    self.directory = directory
+    self.pattern = pattern
+    self.interval = interval
+    self._sizes = {}
+    self._reported = {entry.name for entry in os.scandir(directory) if fnmatch.fnmatch(entry.name, pattern)}
+
+  def poll(self, timeout: float) -> list:
+    time.sleep(min(timeout, self.interval))
+    paths = []
+    for entry in os.scandir(self.directory):
+      if entry.name in self._reported or not fnmatch.fnmatch(entry.name, self.pattern):
+        continue
+      size = entry.stat().st_size
+      if size > 0 and self._sizes.get(entry.name) == size:
+        self._reported.add(entry.name)
+        del self._sizes[entry.name]
+        paths.append(entry.path)
+      else:
+        self._sizes[entry.name] = size
+    return paths
+
+  def close(self):
+    pass
+
+
+def createWatcher(directory: str, pattern: str = "acc_*.csv", polling: bool = False):
+  """
+  inotify watcher when available (and polling is False), polling watcher otherwise.
+  """
+  if not polling:
+    try:
+      return InotifyWatcher(directory, pattern)
+    except (OSError, AttributeError):
+      pass
+  return PollingWatcher(directory, pattern)
+
+
+class DiagnosisService:
+  """
+  Args:
+    directory (str): Directory where acc_*.csv files land.
+    pipelinePath (str): Pipeline saved by savePipeline.
+    logPath (str): CSV log the diagnoses are appended to.
+    batchWindow (float): Seconds to wait for more files after the first one of a batch.
+    maxBatch (int): Maximum files per batch.
+    maxQueue (int): Bound of the work queue; the watcher blocks when it is full.
+    polling (bool): Force the polling watcher.
+  """
+
+  def __init__(self, directory: str, pipelinePath: str, logPath: str, batchWindow: float = 0.005,
+               maxBatch: int = 256, maxQueue: int = 4096, polling: bool = False):
+    self.directory = directory
+    self.pipeline = loadPipeline(pipelinePath)
+    self.logPath = logPath
+    self.batchWindow = batchWindow
+    self.maxBatch = maxBatch
+    self.queue = queue.Queue(maxsize=maxQueue)
+    self.watcher = createWatcher(directory, polling=polling)
+    self.processed = 0
+    self.failed = 0
+    self._stop = threading.Event()
+    self._threads = []
+
+    if not os.path.exists(logPath):
+      with open(logPath, "w") as log:
+        log.write(",".join(["detected_at", "file", "label", "latency_ms"] + [f"p_{label}" for label in self.pipeline.labels]) + "\n")
+
+  def start(self) -> "DiagnosisService":
+    self._threads = [
+      threading.Thread(target=self._watch, name="diagnosis-watch", daemon=True),
+      threading.Thread(target=self._diagnose, name="diagnosis-batch", daemon=True),
+    ]
+    for thread in self._threads:
+      thread.start()
+    return self
+
+  def stop(self):
+    self._stop.set()
+    for thread in self._threads:
+      thread.join()
+    self.watcher.close()
+
+  def __enter__(self):
+    return self.start()
+
+  def __exit__(self, *exc_info):
+    self.stop()
+
+  def _watch(self):
+    while not self._stop.is_set():
+      for path in self.watcher.poll(0.05):
+        detected = time.time()
+        while not self._stop.is_set():
+          try:
+            self.queue.put((detected, path), timeout=0.1)
+            break
+          except queue.Full:
+            continue
+
+  def _nextBatch(self) -> list:
+    try:
+      batch = [self.queue.get(timeout=0.05)]
+    except queue.Empty:
+      return []
+    deadline = time.monotonic() + self.batchWindow
+    while len(batch) < self.maxBatch:
+      remaining = deadline - time.monotonic()
+      try:
+        batch.append(self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait())
+      except queue.Empty:
+        break
+    return batch
+
+  def _diagnose(self):
+    while not self._stop.is_set() or not self.queue.empty():
+      batch = self._nextBatch()
+      if batch:
+        self.diagnoseBatch(batch)
+
+  def diagnoseBatch(self, batch: list):
+    """
+    Classify [(detected_at, path), ...] and append the results to the log.
+    """
+
+    with stage("DiagnosisService.diagnoseBatch", items=len(batch)):
+      self._diagnoseBatch(batch)
+
+  def _fail(self, count: int, error: Exception):
+    self.failed += count
+    print(f"DiagnosisService: {count} file(s) failed: {error}", file=sys.stderr)
+
+  def _diagnoseBatch(self, batch: list):
+    signals, kept = [], []
+    for detected, path in batch:
+      try:
+        signal = readSignal(path)
+        if signal.shape[0] == 0: raise ValueError(f"{path} has no samples.")
+        signals.append(signal)
+        kept.append((detected, path))
+      except (OSError, ValueError) as error:
+        self._fail(1, error)
+
+    lines = []
+    # Signals of equal length are classified together.
+    for length in sorted({signal.shape[0] for signal in signals}):
+      positions = [i for i, signal in enumerate(signals) if signal.shape[0] == length]
+      try:
+        probabilities, labels = self.pipeline.classifySignals(np.stack([signals[i] for i in positions]))
+      except Exception as error:
+        # One bad group must not end the diagnosis thread.
+        self._fail(len(positions), error)
+        continue
+      done = time.time()
+      for position, probability, label in zip(positions, probabilities, labels):
+        detected, path = kept[position]
+        lines.append(",".join(
+          [f"{detected:.6f}", os.path.basename(path), self.pipeline.labels[label], f"{(done - detected) * 1e3:.3f}"]
+          + [f"{value:.6g}" for value in probability]
+        ))
+
+    if lines:
+      with open(self.logPath, "a") as log:
+        log.write("\n".join(lines) + "\n")
+      self.processed += len(lines)
+
+
+if __name__ == "__main__":
+  arguments = [argument for argument in sys.argv[1:] if argument != "--poll"]
+  if "--metrics" in arguments:
+    position = arguments.index("--metrics")
+    startMetricsServer(port=int(arguments[position + 1]))
+    del arguments[position:position + 2]
+  if len(arguments) != 3:
+    print("Usage: python tp-reducer/watcher.py <directory> <pipeline.npz> <log.csv> [--poll] [--metrics <port>]")
+    sys.exit(1)
+
+  service = DiagnosisService(*arguments, polling="--poll" in sys.argv)
+  print(f"Watching {arguments[0]} with {type(service.watcher).__name__}, logging to {arguments[2]}")
+  service.start()
+  try:
+    while True:
+      time.sleep(1)
+  except KeyboardInterrupt:
+    service.stop()
+    print(f"{service.processed} files diagnosed, {service.failed} failed")
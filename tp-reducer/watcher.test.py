@@ -0,0 +1,63 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from artifact import PipelineArtifact, savePipeline
+from watcher import DiagnosisService
+
+data_dir = os.path.join(os.path.dirname(__file__), "data")
+rng = np.random.default_rng(0)
+pipeline = PipelineArtifact(
+  [(rng.random((3, 3)), rng.random(3)), (rng.random((3, 4)), rng.random(4))],
+  ["rms", "kurtosis", "peak"], ["a", "b", "c", "d"],
+)
+
+for polling in (False, True):
+  with tempfile.TemporaryDirectory() as directory:
+    inbox = os.path.join(directory, "input")
+    os.mkdir(inbox)
+    pipelinePath = os.path.join(directory, "pipeline.npz")
+    logPath = os.path.join(directory, "diagnosis.csv")
+    savePipeline(pipelinePath, pipeline)
+
+    with DiagnosisService(inbox, pipelinePath, logPath, polling=polling) as service:
+      for i in range(1, 21):
+        # Written elsewhere then moved in, as an acquisition writer should.
+        staged = shutil.copy(os.path.join(data_dir, "1-roulement-sain-pignon-sain", f"acc_{i:05d}.csv"), directory)
+        os.replace(staged, os.path.join(inbox, os.path.basename(staged)))
+      deadline = time.time() + 10
+      while service.processed < 20 and time.time() < deadline:
+        time.sleep(0.01)
+
+    with open(logPath) as log:
+      lines = log.read().splitlines()
+    latencies = [float(line.split(",")[3]) for line in lines[1:]]
+    print(f"{type(service.watcher).__name__}: {len(lines) - 1} files, median latency {np.median(latencies):.1f} ms")
+    assert len(lines) == 21 and lines[0].startswith("detected_at,file,label,latency_ms")
+
+# An empty capture is counted as failed and the service keeps diagnosing what follows.
+with tempfile.TemporaryDirectory() as directory:
+  inbox = os.path.join(directory, "input")
+  os.mkdir(inbox)
+  pipelinePath = os.path.join(directory, "pipeline.npz")
+  savePipeline(pipelinePath, pipeline)
+  with DiagnosisService(inbox, pipelinePath, os.path.join(directory, "diagnosis.csv")) as service:
+    open(os.path.join(directory, "acc_00000.csv"), "w").close()
+    os.replace(os.path.join(directory, "acc_00000.csv"), os.path.join(inbox, "acc_00000.csv"))
+    deadline = time.time() + 10
+    while service.failed < 1 and time.time() < deadline:
+      time.sleep(0.01)
+    staged = shutil.copy(os.path.join(data_dir, "1-roulement-sain-pignon-sain", "acc_00001.csv"), directory)
+    os.replace(staged, os.path.join(inbox, "acc_00001.csv"))
+    while service.processed < 1 and time.time() < deadline:
+      time.sleep(0.01)
+    assert all(thread.is_alive() for thread in service._threads), "diagnosis thread died"
+  assert (service.processed, service.failed) == (1, 1), (service.processed, service.failed)
+print("empty capture skipped")
@@ -0,0 +1,113 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+from math import gcd
+
+import numpy as np
+
+from indicators import INDICATOR_NAMES
+
+"""
+  Sliding-window indicators: one row of INDICATOR_NAMES per window.
+  The signal is cut in blocks of gcd(window, hop) samples. Power sums 1..4 of
+  the blocks are prefix-summed, so every window costs O(1) whatever its length.
+  The peak uses a van Herk / Gil-Werman running max over the block maxima.
+  Moments come from differences of prefix sums: on long signals with short windows,
+  skewness and kurtosis carry an absolute error around 1e-5 against calculateIndicators.
+"""
+
+
+def _slidingMax(values: np.ndarray, width: int) -> np.ndarray:
+  """
+  Max of every run of `width` consecutive values (van Herk / Gil-Werman), O(len(values)).
+  """
+
+  count = values.shape[0]
+  padded_length = -(-count // width) * width
+  padded = np.full(padded_length, -np.inf)
+  padded[:count] = values
+  blocks = padded.reshape(-1, width)
+
+  prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+  suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+  starts = np.arange(count - width + 1)
+  return np.maximum(suffix[starts], prefix[starts + width - 1])
+
+
+def windowStarts(signalLength: int, window: int, hop: int) -> np.ndarray:
+  """
+  First sample of every full window.
+  """
+  if signalLength < window:
+    return np.empty(0, dtype=np.int64)
+  return np.arange(0, signalLength - window + 1, hop)
+
+
+def calculateWindowedIndicators(signal, window: int, hop: int = None) -> np.ndarray:
+  """
+  Calculate the indicators over a sliding window.
+
+  Args:
+    signal (np.ndarray): 1-D signal.
+    window (int): Window length in samples.
+    hop (int): Step between two windows in samples. Defaults to window (no overlap).
+
+  Returns:
+    np.ndarray: (n_windows, len(INDICATOR_NAMES)) array, window i starting at sample i * hop.
+      Only full windows are returned.
+  """
+
+  signal = np.asarray(signal, dtype=np.float64).ravel()
+  if hop is None: hop = window
+  if window <= 0 or hop <= 0: raise ValueError("window and hop must be positive.")
+
+  out = np.empty((windowStarts(signal.shape[0], window, hop).shape[0], len(INDICATOR_NAMES)))
+  if out.shape[0] == 0:
+    return out
+
+  block = gcd(window, hop)
+  block_count = signal.shape[0] // block
+  blocks = signal[:block_count * block].reshape(block_count, block)
+
+  # Power sums of the shifted signal: shifting by the global mean limits cancellation.
+  shift = float(blocks.mean())
+  shifted = blocks - shift
+  squared = shifted * shifted
+  power_sums = np.zeros((block_count + 1, 4))
+  power_sums[1:, 0] = shifted.sum(axis=1)
+  power_sums[1:, 1] = squared.sum(axis=1)
+  power_sums[1:, 2] = np.einsum('ij,ij->i', squared, shifted)
+  power_sums[1:, 3] = np.einsum('ij,ij->i', squared, squared)
+  np.cumsum(power_sums, axis=0, out=power_sums)
+
+  width = window // block
+  first_blocks = np.arange(0, block_count - width + 1, hop // block)
+  sums = (power_sums[first_blocks + width] - power_sums[first_blocks]) / window
+  s1, s2, s3, s4 = sums[:, 0], sums[:, 1], sums[:, 2], sums[:, 3]
+
+  block_peaks = np.maximum(blocks.max(axis=1), -blocks.min(axis=1))
+  peak = _slidingMax(block_peaks, width)[first_blocks]
+
+  variance = np.maximum(s2 - s1 * s1, 0.0)
+  m3 = s3 - 3 * s1 * s2 + 2 * s1 ** 3
+  m4 = s4 - 4 * s1 * s3 + 6 * s1 * s1 * s2 - 3 * s1 ** 4
+  mean = s1 + shift
+  power = s2 + 2 * shift * s1 + shift * shift
+  std_dev = np.sqrt(variance)
+  rms = np.sqrt(power)
+
+  out[:, 0] = mean
+  out[:, 1] = std_dev
+  out[:, 2] = variance
+  out[:, 3] = rms
+  out[:, 4] = peak
+  out[:, 5] = power * window
+  out[:, 6] = power
+  with np.errstate(divide='ignore', invalid='ignore'):
+    out[:, 7] = m3 / (variance * std_dev)
+    out[:, 8] = m4 / (variance * variance) - 3
+    out[:, 9] = peak / rms
+  out[:, 10] = peak * rms
+  return out
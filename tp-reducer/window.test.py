@@ -0,0 +1,26 @@
+"""
+  @copyright Copyright © 2025 GUIHO Technologies as represented by Cristóvão GUIHO. All Rights Reserved.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from indicators import calculateIndicatorsBatch
+from reducer import importSignalList
+from window import calculateWindowedIndicators
+
+signalMatrix = importSignalList(os.path.join(os.path.dirname(__file__), "data", "4-roulement-defaut-pignon-defaut"))
+recording = np.asarray(signalMatrix[:20]).ravel()
+
+for window, hop in [(2048, 512), (1000, 300), (25600, 25600), (64, 1)]:
+  windowed = calculateWindowedIndicators(recording[:200000], window, hop)
+  views = np.lib.stride_tricks.sliding_window_view(recording[:200000], window)[::hop]
+  assert windowed.shape[0] == views.shape[0]
+  assert np.allclose(windowed, calculateIndicatorsBatch(views), rtol=1e-7, atol=1e-4), (window, hop)
+
+start = time.perf_counter()
+windowed = calculateWindowedIndicators(recording, 1024, 1)
+elapsed = time.perf_counter() - start
+print(f"window 1024 hop 1: {windowed.shape[0]} windows in {elapsed * 1e3:.1f} ms, {windowed.shape[0] / elapsed:,.0f} windows/s")